@@ -0,0 +1,26 @@
+from grpc.aio import Channel
+
+
+class AsyncGRPCClient:
+    """
+    Базовый класс асинхронного gRPC-клиента (grpc.aio).
+
+    В отличие от GRPCClient, не использует gevent: вызовы выполняются в цикле событий asyncio,
+    и один процесс держит тысячи одновременных вызовов. Модули асинхронных клиентов не должны
+    импортировать clients.grpc.client — он включает gevent-режим gRPC (grpc_gevent.init_gevent()).
+    """
+
+    def __init__(self, channel: Channel):
+        """
+        Конструктор базового клиента.
+
+        :param channel: Асинхронный gRPC-канал, через который происходит подключение к серверу.
+                        Один канал может использоваться несколькими клиентами.
+        """
+        self.channel = channel
+
+    async def close(self) -> None:
+        """
+        Закрывает канал клиента (если канал общий, он закрывается для всех клиентов).
+        """
+        await self.channel.close()
@@ -0,0 +1,18 @@
+from grpc import Compression
+
+from tools.config.grpc import GRPCChannelOptions
+
+# GRPCChannelOptions.compression -> алгоритм сжатия gRPC
+GRPC_COMPRESSION = {
+    "none": Compression.NoCompression,
+    "deflate": Compression.Deflate,
+    "gzip": Compression.Gzip,
+}
+
+
+def get_grpc_compression(options: GRPCChannelOptions) -> Compression | None:
+    """
+    Возвращает сжатие каналов из настроек канала (None — по умолчанию gRPC).
+    Общая функция для синхронных и асинхронных (grpc.aio) каналов.
+    """
+    return None if options.compression is None else GRPC_COMPRESSION[options.compression]
@@ -0,0 +1,43 @@
+from typing import TYPE_CHECKING
+
+from grpc.aio import Channel, insecure_channel
+
+from clients.grpc.compression import get_grpc_compression
+from clients.grpc.interceptors.async_locust_interceptor import build_async_locust_interceptors
+from config import settings
+
+if TYPE_CHECKING:
+    from locust.env import Environment
+
+
+def build_gateway_async_grpc_client() -> Channel:
+    """
+    Фабричная функция для создания асинхронного gRPC-канала (grpc.aio) к сервису grpc-gateway
+    с адресом и опциями из settings.gateway_grpc_client.
+
+    Канал нужно создавать внутри запущенного цикла событий asyncio.
+
+    :return: Асинхронный gRPC-канал.
+    """
+    return insecure_channel(
+        settings.gateway_grpc_client.client_url,
+        options=settings.gateway_grpc_client.options.to_channel_arguments(),
+        compression=get_grpc_compression(settings.gateway_grpc_client.options)
+    )
+
+
+def build_gateway_locust_async_grpc_client(environment: "Environment") -> Channel:
+    """
+    Фабричная функция для создания асинхронного gRPC-канала с интерцепторами Locust
+    (см. build_async_locust_interceptors), которые регистрируют вызовы всех типов
+    в системе метрик Locust (события request).
+
+    :param environment: Среда выполнения Locust (необходима для отправки событий).
+    :return: Асинхронный gRPC-канал с подключёнными интерцепторами Locust.
+    """
+    return insecure_channel(
+        settings.gateway_grpc_client.client_url,
+        options=settings.gateway_grpc_client.options.to_channel_arguments(),
+        compression=get_grpc_compression(settings.gateway_grpc_client.options),
+        interceptors=build_async_locust_interceptors(environment=environment)
+    )
@@ -0,0 +1,85 @@
+from typing import TYPE_CHECKING
+
+from grpc.aio import Channel
+
+from clients.grpc.async_client import AsyncGRPCClient
+from clients.grpc.gateway.async_client import build_gateway_async_grpc_client, build_gateway_locust_async_grpc_client
+from contracts.services.gateway.cards.cards_gateway_service_pb2_grpc import CardsGatewayServiceStub
+from contracts.services.gateway.cards.rpc_issue_physical_card_pb2 import (
+    IssuePhysicalCardRequest,
+    IssuePhysicalCardResponse
+)
+from contracts.services.gateway.cards.rpc_issue_virtual_card_pb2 import (
+    IssueVirtualCardRequest,
+    IssueVirtualCardResponse
+)
+
+if TYPE_CHECKING:
+    from locust.env import Environment
+
+
+class AsyncCardsGatewayGRPCClient(AsyncGRPCClient):
+    """
+    Асинхронный gRPC-клиент для взаимодействия с CardsGatewayService.
+    Методы совпадают с CardsGatewayGRPCClient, но являются корутинами.
+    """
+
+    def __init__(self, channel: Channel):
+        """
+        Инициализация клиента с указанным асинхронным gRPC-каналом.
+
+        :param channel: gRPC-канал для подключения к CardsGatewayService.
+        """
+        super().__init__(channel)
+
+        self.stub = CardsGatewayServiceStub(channel)
+
+    async def issue_virtual_card_api(self, request: IssueVirtualCardRequest) -> IssueVirtualCardResponse:
+        """
+        Низкоуровневый вызов метода IssueVirtualCard через gRPC.
+
+        :param request: gRPC-запрос с ID пользователя и счета.
+        :return: Ответ от сервиса с данными выпущенной виртуальной карты.
+        """
+        return await self.stub.IssueVirtualCard(request)
+
+    async def issue_physical_card_api(self, request: IssuePhysicalCardRequest) -> IssuePhysicalCardResponse:
+        """
+        Низкоуровневый вызов метода IssuePhysicalCard через gRPC.
+
+        :param request: gRPC-запрос с ID пользователя и счета.
+        :return: Ответ от сервиса с данными выпущенной физической карты.
+        """
+        return await self.stub.IssuePhysicalCard(request)
+
+    async def issue_virtual_card(self, user_id: str, account_id: str) -> IssueVirtualCardResponse:
+        request = IssueVirtualCardRequest(user_id=user_id, account_id=account_id)
+        return await self.issue_virtual_card_api(request)
+
+    async def issue_physical_card(self, user_id: str, account_id: str) -> IssuePhysicalCardResponse:
+        request = IssuePhysicalCardRequest(user_id=user_id, account_id=account_id)
+        return await self.issue_physical_card_api(request)
+
+
+def build_cards_gateway_async_grpc_client(channel: Channel | None = None) -> AsyncCardsGatewayGRPCClient:
+    """
+    Фабрика для создания экземпляра AsyncCardsGatewayGRPCClient.
+
+    :param channel: Общий асинхронный канал; если не передан, создаётся собственный.
+    :return: Инициализированный клиент для CardsGatewayService.
+    """
+    return AsyncCardsGatewayGRPCClient(channel=channel or build_gateway_async_grpc_client())
+
+
+def build_cards_gateway_locust_async_grpc_client(
+        environment: "Environment",
+        channel: Channel | None = None
+) -> AsyncCardsGatewayGRPCClient:
+    """
+    Функция создаёт экземпляр AsyncCardsGatewayGRPCClient, отправляющий метрики в Locust.
+
+    :param environment: объект окружения Locust.
+    :param channel: Общий канал с интерцепторами Locust; если не передан, создаётся собственный.
+    :return: экземпляр AsyncCardsGatewayGRPCClient с интерцептором сбора метрик.
+    """
+    return AsyncCardsGatewayGRPCClient(channel=channel or build_gateway_locust_async_grpc_client(environment))
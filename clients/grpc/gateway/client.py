@@ -1,17 +1,35 @@
+import logging
+
 from grpc import Channel, insecure_channel, intercept_channel
+from clients.grpc.compression import get_grpc_compression
 from clients.grpc.interceptors.locust_interceptor import LocustInterceptor
+from clients.grpc.pool import GRPCChannelPool
 from locust.env import Environment
 
 from config import settings
 
+logger = logging.getLogger(__name__)
+
+
+def build_gateway_grpc_channel() -> Channel:
+    """
+    Создаёт канал к grpc-gateway с опциями из settings.gateway_grpc_client.options
+    (keepalive, размеры сообщений, окна HTTP/2, сжатие).
+    """
+    return insecure_channel(
+        settings.gateway_grpc_client.client_url,
+        options=settings.gateway_grpc_client.options.to_channel_arguments(),
+        compression=get_grpc_compression(settings.gateway_grpc_client.options)
+    )
+
 
 def build_gateway_grpc_client() -> Channel:
     """
     Фабричная функция (билдер) для создания gRPC-канала к сервису grpc-gateway.
 
-    :return: gRPC-канал (Channel), настроенный на адрес localhost:9003.
+    :return: gRPC-канал (Channel), настроенный на адрес и опции из settings.gateway_grpc_client.
     """
-    return insecure_channel(settings.gateway_grpc_client.client_url)
+    return build_gateway_grpc_channel()
 
 
 def build_gateway_locust_grpc_client(environment: Environment) -> Channel:
@@ -20,10 +38,46 @@ def build_gateway_locust_grpc_client(environment: Environment) -> Channel:
     В канал автоматически встраивается интерцептор LocustInterceptor,
     который регистрирует вызовы в системе метрик Locust.
 
+    Если задан settings.gateway_grpc_client.pool_size, канал не создаётся,
+    а берётся по кругу из общего пула процесса (см. get_gateway_locust_grpc_channel_pool).
+
     :param environment: Среда выполнения Locust (необходима для отправки событий).
-    :ret
+    :return: gRPC-канал с подключённым LocustInterceptor.
     """
+    if settings.gateway_grpc_client.pool_size is not None:
+        return get_gateway_locust_grpc_channel_pool(environment).get_channel()
 
     locust_interceptor = LocustInterceptor(environment=environment)
-    channel = insecure_channel(settings.gateway_grpc_client.client_url)
+    channel = build_gateway_grpc_channel()
     return intercept_channel(channel, locust_interceptor)
+
+
+def get_gateway_locust_grpc_channel_pool(environment: Environment) -> GRPCChannelPool:
+    """
+    Возвращает общий для процесса пул каналов grpc-gateway (создаётся при первом обращении).
+    По окончании теста статистика каналов выводится в лог, а пул закрывается.
+
+    :param environment: Среда выполнения Locust.
+    :return: Пул из settings.gateway_grpc_client.pool_size каналов с LocustInterceptor.
+    """
+    pool = getattr(environment, "grpc_channel_pool", None)
+    if pool is None:
+        pool = GRPCChannelPool(
+            target=settings.gateway_grpc_client.client_url,
+            size=settings.gateway_grpc_client.pool_size,
+            interceptors=lambda: [LocustInterceptor(environment=environment)],
+            options=settings.gateway_grpc_client.options.to_channel_arguments(),
+            compression=get_grpc_compression(settings.gateway_grpc_client.options)
+        )
+        environment.grpc_channel_pool = pool
+
+        def on_test_stop(**kwargs):
+            logger.info(f"Каналы grpc-gateway: {pool}")
+            # При повторном запуске теста (например, из веб-интерфейса) создаётся новый пул
+            if environment.grpc_channel_pool is pool:
+                environment.grpc_channel_pool = None
+            pool.close()
+
+        environment.events.test_stop.add_listener(on_test_stop)
+
+    return pool
@@ -12,6 +12,7 @@ from clients.grpc.gateway.operations.client import (
     build_operations_gateway_locust_grpc_client
 )
 from clients.grpc.gateway.users.client import UsersGatewayGRPCClient, build_users_gateway_locust_grpc_client
+from seeds.harvester import SeedsHarvestSession, init_locust_seeds_harvest
 
 
 class GatewayGRPCTaskSet(TaskSet):
@@ -28,6 +29,8 @@ class GatewayGRPCTaskSet(TaskSet):
     accounts_gateway_client: AccountsGatewayGRPCClient
     documents_gateway_client: DocumentsGatewayGRPCClient
     operations_gateway_client: OperationsGatewayGRPCClient
+    # Сессия сбора сидов (см. seeds.harvester), если задан settings.seeds.harvest
+    harvest_session: SeedsHarvestSession | None = None
 
     def on_start(self) -> None:
         """
@@ -39,6 +42,14 @@ class GatewayGRPCTaskSet(TaskSet):
         self.accounts_gateway_client = build_accounts_gateway_locust_grpc_client(self.user.environment)
         self.documents_gateway_client = build_documents_gateway_locust_grpc_client(self.user.environment)
         self.operations_gateway_client = build_operations_gateway_locust_grpc_client(self.user.environment)
+        self.harvest_session = init_locust_seeds_harvest(self)
+
+    def on_stop(self) -> None:
+        """
+        Передаёт на запись пользователей, собранных виртуальным пользователем (если включён сбор сидов).
+        """
+        if self.harvest_session is not None:
+            self.harvest_session.finish()
 
 
 class GatewayGRPCSequentialTaskSet(SequentialTaskSet):
@@ -53,6 +64,8 @@ class GatewayGRPCSequentialTaskSet(SequentialTaskSet):
     accounts_gateway_client: AccountsGatewayGRPCClient
     documents_gateway_client: DocumentsGatewayGRPCClient
     operations_gateway_client: OperationsGatewayGRPCClient
+    # Сессия сбора сидов (см. seeds.harvester), если задан settings.seeds.harvest
+    harvest_session: SeedsHarvestSession | None = None
 
     def on_start(self) -> None:
         """
@@ -63,3 +76,11 @@ class GatewayGRPCSequentialTaskSet(SequentialTaskSet):
         self.accounts_gateway_client = build_accounts_gateway_locust_grpc_client(self.user.environment)
         self.documents_gateway_client = build_documents_gateway_locust_grpc_client(self.user.environment)
         self.operations_gateway_client = build_operations_gateway_locust_grpc_client(self.user.environment)
+        self.harvest_session = init_locust_seeds_harvest(self)
+
+    def on_stop(self) -> None:
+        """
+        Передаёт на запись пользователей, собранных виртуальным пользователем (если включён сбор сидов).
+        """
+        if self.harvest_session is not None:
+            self.harvest_session.finish()
@@ -0,0 +1,205 @@
+import asyncio
+import time
+from typing import Any, TYPE_CHECKING
+
+from grpc import RpcError, StatusCode
+from grpc.aio import (
+    AioRpcError,
+    ClientInterceptor,
+    StreamStreamClientInterceptor,
+    StreamUnaryClientInterceptor,
+    UnaryStreamClientInterceptor,
+    UnaryUnaryClientInterceptor
+)
+
+if TYPE_CHECKING:
+    from locust.env import Environment
+
+
+class BaseAsyncLocustInterceptor:
+    """
+    Общая часть асинхронных (grpc.aio) интерцепторов Locust: отправка событий request.
+
+    Канал grpc.aio подключает каждый объект интерцептора только к одному типу вызовов
+    (первому подходящему классу), поэтому на каждый тип вызова свой интерцептор
+    (см. build_async_locust_interceptors).
+    """
+
+    def __init__(self, environment: "Environment"):
+        """
+        :param environment: Экземпляр среды Locust, содержащий события сбора метрик.
+        """
+        self.environment = environment
+        # Задачи отправки событий потоковых вызовов: ссылки держатся до завершения задачи
+        self.reports: set[asyncio.Task] = set()
+
+    def fire(
+            self,
+            client_call_details,
+            start_time: float,
+            response: Any,
+            exception: RpcError | None,
+            response_length: int
+    ) -> None:
+        """
+        Отправляет событие request в Locust.
+
+        :param client_call_details: Детали запроса (имя метода берётся отсюда).
+        :param start_time: Время начала вызова (time.perf_counter()).
+        :param response: Ответ или вызов gRPC.
+        :param exception: Ошибка вызова (None, если вызов успешен).
+        :param response_length: Размер ответа в байтах.
+        """
+        # В grpc.aio имя метода в деталях вызова может быть bytes
+        method = client_call_details.method
+        self.environment.events.request.fire(
+            name=method.decode() if isinstance(method, bytes) else method,
+            context=None,
+            response=response,
+            exception=exception,
+            request_type="gRPC",
+            response_time=(time.perf_counter() - start_time) * 1000,
+            response_length=response_length,
+        )
+
+    async def report(self, call, client_call_details, start_time: float, unary_response: bool) -> None:
+        """
+        Отправляет событие по завершённому вызову. Статус уже известен, поэтому ожидание не блокирует.
+
+        :param call: Завершённый вызов gRPC.
+        :param client_call_details: Детали запроса.
+        :param start_time: Время начала вызова (time.perf_counter()).
+        :param unary_response: Вызов возвращает один ответ (его размер входит в событие).
+        """
+        code = await call.code()
+        if code != StatusCode.OK:
+            exception = AioRpcError(
+                code=code,
+                initial_metadata=await call.initial_metadata(),
+                trailing_metadata=await call.trailing_metadata(),
+                details=await call.details(),
+                debug_error_string=await call.debug_error_string()
+            )
+            self.fire(client_call_details, start_time, None, exception, 0)
+            return
+
+        response_length = (await call).ByteSize() if unary_response else 0
+        self.fire(client_call_details, start_time, call, None, response_length)
+
+    def report_on_done(self, call, client_call_details, start_time: float, unary_response: bool):
+        """
+        Подписывается на завершение потокового вызова. Отменённые клиентом вызовы не учитываются.
+
+        Вызов возвращается без обёртки (у него остаются read, write и done_writing),
+        поэтому размер потока ответов не считается (response_length = 0), в отличие
+        от LocustInterceptor, который оборачивает синхронный итератор ответов.
+
+        :param call: Вызов gRPC.
+        :param client_call_details: Детали запроса.
+        :param start_time: Время начала вызова (time.perf_counter()).
+        :param unary_response: Вызов возвращает один ответ (stream-unary).
+        :return: Тот же вызов.
+        """
+        loop = asyncio.get_running_loop()
+
+        def on_done(done_call) -> None:
+            if done_call.cancelled():
+                # Вызов отменил сам клиент — ответа сервера нет, и измерять нечего
+                return
+
+            task = loop.create_task(self.report(done_call, client_call_details, start_time, unary_response))
+            self.reports.add(task)
+            task.add_done_callback(self.reports.discard)
+
+        call.add_done_callback(on_done)
+        return call
+
+
+class AsyncLocustInterceptor(BaseAsyncLocustInterceptor, UnaryUnaryClientInterceptor):
+    """
+    Асинхронный (grpc.aio) gRPC-интерцептор для сбора метрик Locust по unary-unary вызовам.
+    Отправляет те же события request, что и LocustInterceptor, но не блокирует цикл событий.
+    """
+
+    async def intercept_unary_unary(self, continuation, client_call_details, request):
+        """
+        Метод-перехватчик для unary-unary gRPC вызовов.
+
+        :param continuation: Корутина, вызывающая фактический gRPC метод.
+        :param client_call_details: Детали запроса (метод, метаданные, таймаут и т.д.).
+        :param request: Объект запроса, отправляемый на сервер.
+        :return: Вызов gRPC (ошибка вызова пробрасывается при его ожидании).
+        """
+        exception: RpcError | None = None
+        start_time = time.perf_counter()
+        response_length = 0
+
+        call = await continuation(client_call_details, request)
+        try:
+            response = await call
+            response_length = response.ByteSize()
+        except RpcError as error:
+            response = None
+            exception = error
+
+        self.fire(client_call_details, start_time, response, exception, response_length)
+
+        return call
+
+
+class AsyncLocustUnaryStreamInterceptor(BaseAsyncLocustInterceptor, UnaryStreamClientInterceptor):
+    """
+    Асинхронный gRPC-интерцептор Locust для unary-stream вызовов (один запрос — поток ответов).
+    """
+
+    async def intercept_unary_stream(self, continuation, client_call_details, request):
+        """
+        :return: Вызов gRPC; событие отправляется, когда поток ответов завершится.
+        """
+        start_time = time.perf_counter()
+        call = await continuation(client_call_details, request)
+        return self.report_on_done(call, client_call_details, start_time, unary_response=False)
+
+
+class AsyncLocustStreamUnaryInterceptor(BaseAsyncLocustInterceptor, StreamUnaryClientInterceptor):
+    """
+    Асинхронный gRPC-интерцептор Locust для stream-unary вызовов (поток запросов — один ответ).
+    """
+
+    async def intercept_stream_unary(self, continuation, client_call_details, request_iterator):
+        """
+        :return: Вызов gRPC; событие отправляется после получения ответа.
+        """
+        start_time = time.perf_counter()
+        call = await continuation(client_call_details, request_iterator)
+        return self.report_on_done(call, client_call_details, start_time, unary_response=True)
+
+
+class AsyncLocustStreamStreamInterceptor(BaseAsyncLocustInterceptor, StreamStreamClientInterceptor):
+    """
+    Асинхронный gRPC-интерцептор Locust для stream-stream вызовов (поток запросов — поток ответов).
+    """
+
+    async def intercept_stream_stream(self, continuation, client_call_details, request_iterator):
+        """
+        :return: Вызов gRPC; событие отправляется, когда поток ответов завершится.
+        """
+        start_time = time.perf_counter()
+        call = await continuation(client_call_details, request_iterator)
+        return self.report_on_done(call, client_call_details, start_time, unary_response=False)
+
+
+def build_async_locust_interceptors(environment: "Environment") -> list[ClientInterceptor]:
+    """
+    Создаёт асинхронные интерцепторы Locust для всех четырёх типов вызовов,
+    как у синхронного LocustInterceptor.
+
+    :param environment: Экземпляр среды Locust, содержащий события сбора метрик.
+    :return: Список интерцепторов для grpc.aio.insecure_channel(interceptors=...).
+    """
+    return [
+        AsyncLocustInterceptor(environment=environment),
+        AsyncLocustUnaryStreamInterceptor(environment=environment),
+        AsyncLocustStreamUnaryInterceptor(environment=environment),
+        AsyncLocustStreamStreamInterceptor(environment=environment)
+    ]
@@ -1,20 +1,141 @@
 import time
+from typing import Any, Iterator
+
 from locust.env import Environment
 
-from grpc import UnaryUnaryClientInterceptor, RpcError
+from grpc import (
+    RpcError,
+    StreamStreamClientInterceptor,
+    StreamUnaryClientInterceptor,
+    UnaryStreamClientInterceptor,
+    UnaryUnaryClientInterceptor
+)
+
 
+class LocustResponseStream:
+    """
+    Обёртка над потоком ответов gRPC (unary-stream и stream-stream вызовы).
 
-class LocustInterceptor(UnaryUnaryClientInterceptor):
+    Считает размер полученных сообщений и отправляет событие Locust, когда поток прочитан
+    до конца или завершился ошибкой. Остальные методы вызова (cancel, code, details и т.д.)
+    проксируются к исходному объекту.
+    """
+
+    def __init__(self, call: Any, interceptor: "LocustInterceptor", method: str, start_time: float):
+        """
+        :param call: Вызов gRPC, который одновременно является итератором ответов.
+        :param interceptor: Интерцептор, через который отправляется событие.
+        :param method: Полное имя метода gRPC.
+        :param start_time: Время начала вызова (time.perf_counter()).
+        """
+        self.call = call
+        self.interceptor = interceptor
+        self.method = method
+        self.start_time = start_time
+        self.response_length = 0
+        self.reported = False
+
+    def report(self, exception: RpcError | None) -> None:
+        if not self.reported:
+            self.reported = True
+            self.interceptor.fire(self.method, self.start_time, self.call, exception, self.response_length)
+
+    def __iter__(self) -> Iterator:
+        return self
+
+    def __next__(self) -> Any:
+        try:
+            message = next(self.call)
+        except StopIteration:
+            self.report(None)
+            raise
+        except RpcError as error:
+            self.report(error)
+            raise
+
+        self.response_length += message.ByteSize()
+        return message
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.call, name)
+
+
+class LocustInterceptor(
+    UnaryUnaryClientInterceptor,
+    UnaryStreamClientInterceptor,
+    StreamUnaryClientInterceptor,
+    StreamStreamClientInterceptor
+):
     """
     gRPC-интерцептор для сбора метрик Locust.
     Используется для измерения времени выполнения вызовов и регистрации успехов/ошибок.
+
+    Интерцептор не ждёт ответа: для unary-ответов событие отправляется из callback завершения
+    вызова, поэтому stub.Method.future(...) остаётся неблокирующим и вызовы можно отправлять
+    пачкой (pipelining). Для потоковых ответов событие отправляется по окончании потока
+    (см. LocustResponseStream), размер ответа — сумма размеров сообщений.
     """
 
-    def __init__(self, environment: Environment):
+    def __init__(self, environment: Environment, request_type: str = "gRPC"):
         """
         :param environment: Экземпляр среды Locust, содержащий события сбора метрик.
+        :param request_type: Тип запроса в статистике Locust. Служебные вызовы (например, пополнение сидов)
+            помечаются отдельным типом, чтобы не смешиваться с вызовами сценария.
         """
         self.environment = environment
+        self.request_type = request_type
+
+    def fire(
+            self,
+            method: str,
+            start_time: float,
+            response: Any,
+            exception: RpcError | None,
+            response_length: int
+    ) -> None:
+        """
+        Отправляет событие request в Locust.
+
+        :param method: Полное имя метода gRPC.
+        :param start_time: Время начала вызова (time.perf_counter()).
+        :param response: Ответ или вызов gRPC.
+        :param exception: Ошибка вызова (None, если вызов успешен).
+        :param response_length: Размер ответа в байтах.
+        """
+        self.environment.events.request.fire(
+            name=method,
+            context=None,
+            response=response,
+            exception=exception,
+            request_type=self.request_type,
+            response_time=(time.perf_counter() - start_time) * 1000,
+            response_length=response_length,
+        )
+
+    def report_on_done(self, response: Any, method: str, start_time: float) -> Any:
+        """
+        Подписывается на завершение вызова с одним ответом (unary-unary и stream-unary).
+        Если вызов уже завершён (блокирующий вызов stub.Method(...)), событие отправляется сразу.
+        Отменённые клиентом вызовы не учитываются.
+
+        :param response: Future вызова gRPC.
+        :param method: Полное имя метода gRPC.
+        :param start_time: Время начала вызова (time.perf_counter()).
+        :return: Тот же future.
+        """
+        def on_done(future) -> None:
+            if future.cancelled():
+                # Вызов отменил сам клиент — ответа сервера нет, и измерять нечего
+                return
+
+            exception = future.exception()
+            if exception is not None:
+                self.fire(method, start_time, future, exception, 0)
+            else:
+                self.fire(method, start_time, future, None, future.result().ByteSize())
+
+        response.add_done_callback(on_done)
+        return response
 
     def intercept_unary_unary(self, continuation, client_call_details, request):
         """
@@ -25,25 +146,36 @@ class LocustInterceptor(UnaryUnaryClientInterceptor):
         :param request: Объект запроса, отправляемый на сервер.
         :return: gRPC response (future объект).
         """
-        response = None
-        exception: RpcError | None = None
         start_time = time.perf_counter()
-        response_length = 0
+        response = continuation(client_call_details, request)
+        return self.report_on_done(response, client_call_details.method, start_time)
 
-        try:
-            response = continuation(client_call_details, request)
-            response_length = response.result().ByteSize()
-        except RpcError as error:
-            exception = error
+    def intercept_unary_stream(self, continuation, client_call_details, request):
+        """
+        Метод-перехватчик для unary-stream gRPC вызовов (один запрос — поток ответов).
 
-        self.environment.events.request.fire(
-            name=f"{client_call_details.method}",
-            context=None,
-            response=response,
-            exception=exception,
-            request_type="gRPC",
-            response_time=(time.perf_counter() - start_time) * 1000,
-            response_length=response_length,
-        )
+        :return: Поток ответов, который отправит событие после прочтения.
+        """
+        start_time = time.perf_counter()
+        call = continuation(client_call_details, request)
+        return LocustResponseStream(call, self, client_call_details.method, start_time)
 
-        return response
+    def intercept_stream_unary(self, continuation, client_call_details, request_iterator):
+        """
+        Метод-перехватчик для stream-unary gRPC вызовов (поток запросов — один ответ).
+
+        :return: gRPC response (future объект).
+        """
+        start_time = time.perf_counter()
+        response = continuation(client_call_details, request_iterator)
+        return self.report_on_done(response, client_call_details.method, start_time)
+
+    def intercept_stream_stream(self, continuation, client_call_details, request_iterator):
+        """
+        Метод-перехватчик для stream-stream gRPC вызовов (поток запросов — поток ответов).
+
+        :return: Поток ответов, который отправит событие после прочтения.
+        """
+        start_time = time.perf_counter()
+        call = continuation(client_call_details, request_iterator)
+        return LocustResponseStream(call, self, client_call_details.method, start_time)
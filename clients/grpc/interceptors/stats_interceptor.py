@@ -0,0 +1,89 @@
+from grpc import (
+    StreamStreamClientInterceptor,
+    StreamUnaryClientInterceptor,
+    UnaryStreamClientInterceptor,
+    UnaryUnaryClientInterceptor
+)
+
+
+class StatsInterceptor(
+    UnaryUnaryClientInterceptor,
+    UnaryStreamClientInterceptor,
+    StreamUnaryClientInterceptor,
+    StreamStreamClientInterceptor
+):
+    """
+    gRPC-интерцептор, который считает вызовы канала и активные (ещё не завершённые) стримы.
+
+    Учитываются вызовы всех четырёх типов. Потоковый вызов остаётся активным, пока поток ответов
+    не прочитан до конца, не завершился ошибкой или не отменён через cancel(): до этого
+    непрочитанный поток действительно занимает HTTP/2-стрим канала.
+
+    Attributes:
+        calls (int): Количество вызовов через канал.
+        active (int): Количество вызовов, которые выполняются прямо сейчас (открытые HTTP/2-стримы).
+        peak (int): Максимальное количество одновременно активных вызовов.
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.active = 0
+        self.peak = 0
+
+    def on_done(self, future) -> None:
+        self.active -= 1
+
+    def track(self, continuation, client_call_details, request):
+        """
+        Учитывает вызов как активный до его завершения (успешного, с ошибкой или отмены).
+
+        :param continuation: Функция, вызывающая фактический gRPC метод.
+        :param client_call_details: Детали запроса (метод, метаданные, таймаут и т.д.).
+        :param request: Объект запроса или итератор запросов.
+        :return: Вызов gRPC (future или поток ответов).
+        """
+        self.calls += 1
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+
+        try:
+            call = continuation(client_call_details, request)
+        except Exception:
+            self.active -= 1
+            raise
+
+        # Если вызов уже завершён, callback выполнится сразу
+        call.add_done_callback(self.on_done)
+        return call
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        """
+        Метод-перехватчик для unary-unary gRPC вызовов.
+
+        :return: gRPC response (future объект).
+        """
+        return self.track(continuation, client_call_details, request)
+
+    def intercept_unary_stream(self, continuation, client_call_details, request):
+        """
+        Метод-перехватчик для unary-stream gRPC вызовов (один запрос — поток ответов).
+
+        :return: Поток ответов.
+        """
+        return self.track(continuation, client_call_details, request)
+
+    def intercept_stream_unary(self, continuation, client_call_details, request_iterator):
+        """
+        Метод-перехватчик для stream-unary gRPC вызовов (поток запросов — один ответ).
+
+        :return: gRPC response (future объект).
+        """
+        return self.track(continuation, client_call_details, request_iterator)
+
+    def intercept_stream_stream(self, continuation, client_call_details, request_iterator):
+        """
+        Метод-перехватчик для stream-stream gRPC вызовов (поток запросов — поток ответов).
+
+        :return: Поток ответов.
+        """
+        return self.track(continuation, client_call_details, request_iterator)
@@ -0,0 +1,72 @@
+from itertools import cycle
+from typing import Callable
+
+from grpc import Channel, Compression, UnaryUnaryClientInterceptor, insecure_channel, intercept_channel
+
+from clients.grpc.interceptors.stats_interceptor import StatsInterceptor
+
+
+class GRPCChannelPool:
+    """
+    Пул gRPC-каналов, которые выдаются клиентам по кругу (round-robin).
+
+    Каждый канал — отдельное HTTP/2-соединение, по которому вызовы всех получивших его клиентов
+    мультиплексируются в стримы. Размер пула задаёт, сколько соединений открывает процесс:
+    один канал — все вызовы в одном соединении, N каналов — нагрузка делится на N соединений.
+
+    gRPC по умолчанию переиспользует соединения (сабканалы) каналов с одинаковыми адресом
+    и опциями, поэтому каналы пула создаются с локальным пулом сабканалов
+    (grpc.use_local_subchannel_pool): иначе N каналов делили бы одно соединение.
+    """
+
+    def __init__(
+            self,
+            target: str,
+            size: int,
+            interceptors: Callable[[], list[UnaryUnaryClientInterceptor]] = list,
+            options: list[tuple[str, int]] | None = None,
+            compression: Compression | None = None
+    ):
+        """
+        :param target: Адрес сервиса в формате host:port.
+        :param size: Количество каналов (соединений) в пуле.
+        :param interceptors: Фабрика интерцепторов, которые встраиваются в каждый канал пула.
+        :param options: Аргументы каналов (grpc.use_local_subchannel_pool пул задаёт сам).
+        :param compression: Сжатие вызовов каналов.
+        :raises ValueError: Если size меньше 1.
+        """
+        if size < 1:
+            raise ValueError(f"Размер пула gRPC-каналов должен быть не меньше 1, получено {size}")
+
+        self.target = target
+        options = [option for option in (options or []) if option[0] != "grpc.use_local_subchannel_pool"]
+        options.append(("grpc.use_local_subchannel_pool", 1))
+        self.channels: list[Channel] = []
+        self.stats: list[StatsInterceptor] = []
+
+        for _ in range(size):
+            stats = StatsInterceptor()
+            channel = insecure_channel(target, options=options, compression=compression)
+            self.channels.append(intercept_channel(channel, *interceptors(), stats))
+            self.stats.append(stats)
+
+        self.round_robin = cycle(self.channels)
+
+    def get_channel(self) -> Channel:
+        """
+        Возвращает следующий канал пула (по кругу).
+        """
+        return next(self.round_robin)
+
+    def close(self) -> None:
+        """
+        Закрывает все каналы пула.
+        """
+        for channel in self.channels:
+            channel.close()
+
+    def __str__(self) -> str:
+        return ", ".join(
+            f"канал {index}: вызовов {stats.calls}, активных стримов {stats.active} (максимум {stats.peak})"
+            for index, stats in enumerate(self.stats)
+        )
@@ -1,6 +1,6 @@
 from typing import Any, TypedDict
 
-from httpx import Client, URL, Response, QueryParams
+from httpx import AsyncClient, Client, URL, Response, QueryParams
 
 
 class HTTPClientExtensions(TypedDict, total=False):
@@ -39,3 +39,45 @@ class HTTPClient:
         :return: Объект Response с данными ответа.
         """
         return self.client.post(url=url, json=json, extensions=extensions)
+
+
+class AsyncHTTPClient:
+    """
+    Базовый асинхронный HTTP API клиент, принимающий объект httpx.AsyncClient.
+    Методы совпадают с HTTPClient, но являются корутинами.
+
+    :param client: экземпляр httpx.AsyncClient для выполнения HTTP-запросов
+    """
+
+    def __init__(self, client: AsyncClient):
+        self.client = client
+
+    async def get(self, url: URL | str, params: QueryParams | None = None,
+                  extensions: HTTPClientExtensions | None = None) -> Response:
+        """
+        Выполняет GET-запрос.
+
+        :param url: URL-адрес эндпоинта.
+        :param params: GET-параметры запроса (например, ?key=value).
+        :param extensions: Дополнительные данные, передаваемые через HTTPX
+        :return: Объект Response с данными ответа.
+        """
+        return await self.client.get(url, params=params, extensions=extensions)
+
+    async def post(self, url: str, json: Any | None = None,
+                   extensions: HTTPClientExtensions | None = None) -> Response:
+        """
+        Выполняет POST-запрос.
+
+        :param url: URL-адрес эндпоинта.
+        :param json: Данные в формате JSON.
+        :param extensions: Дополнительные данные, передаваемые через HTTPX
+        :return: Объект Response с данными ответа.
+        """
+        return await self.client.post(url=url, json=json, extensions=extensions)
+
+    async def close(self) -> None:
+        """
+        Закрывает httpx.AsyncClient (если клиент общий, он закрывается для всех клиентов).
+        """
+        await self.client.aclose()
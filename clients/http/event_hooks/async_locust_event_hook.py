@@ -0,0 +1,53 @@
+import time
+from typing import TYPE_CHECKING
+
+from httpx import Request, Response, HTTPError, HTTPStatusError
+
+if TYPE_CHECKING:
+    from locust.env import Environment
+
+
+async def locust_async_request_event_hook(request: Request):
+    """
+    Асинхронный HTTPX event hook (для httpx.AsyncClient), вызываемый перед отправкой запроса.
+
+    Сохраняет текущее время в `request.extensions["start_time"]`,
+    чтобы потом использовать его для расчёта времени ответа.
+    """
+    request.extensions["start_time"] = time.time()
+
+
+def locust_async_response_event_hook(environment: "Environment"):
+    """
+    Возвращает асинхронный HTTPX event hook, вызываемый после получения ответа.
+    Отправляет в `environment.events.request` те же метрики, что и locust_response_event_hook,
+    но читает тело ответа без блокировки цикла событий.
+
+    :param environment: Объект окружения Locust, через который отправляются метрики.
+    :return: Корутина-хук для HTTPX response event hook.
+    """
+    async def inner(response: Response) -> None:
+        exception: HTTPError | HTTPStatusError | None = None
+        try:
+            response.raise_for_status()
+        except (HTTPError, HTTPStatusError) as error:
+            exception = error
+
+        request = response.request
+
+        route = request.extensions.get("route", request.url.path)
+        start_time = request.extensions.get("start_time", time.time())
+        response_time = (time.time() - start_time) * 1000
+        response_length = len(await response.aread())
+
+        environment.events.request.fire(
+            name=f"{request.method} {route}",
+            context=None,
+            response=response,
+            exception=exception,
+            request_type="http",
+            response_time=response_time,
+            response_length=response_length,
+        )
+
+    return inner
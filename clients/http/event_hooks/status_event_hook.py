@@ -0,0 +1,12 @@
+from httpx import Response
+
+
+def raise_for_status_event_hook(response: Response) -> None:
+    """
+    HTTPX event hook, вызываемый после получения ответа.
+
+    Выбрасывает httpx.HTTPStatusError для ответов 4xx/5xx. Без него высокоуровневые методы клиентов
+    пытаются разобрать тело ошибки как ответ и падают с ValidationError, по которому не понять статус
+    (например, отличить 404 от ошибки сервера).
+    """
+    response.raise_for_status()
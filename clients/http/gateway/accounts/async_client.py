@@ -0,0 +1,120 @@
+from typing import TYPE_CHECKING
+
+from httpx import AsyncClient, QueryParams, Response
+
+from clients.http.client import AsyncHTTPClient, HTTPClientExtensions
+from clients.http.gateway.accounts.schema import GetAccountsQuerySchema, OpenDepositAccountRequestSchema, \
+    OpenSavingsAccountRequestSchema, OpenDebitCardAccountRequestSchema, OpenCreditCardAccountRequestSchema, \
+    GetAccountsResponseSchema, OpenDepositAccountResponseSchema, OpenSavingsAccountResponseSchema, \
+    OpenDebitCardAccountResponseSchema, OpenCreditCardAccountResponseSchema
+from clients.http.gateway.async_client import (
+    build_gateway_async_http_client,
+    build_gateway_locust_async_http_client
+)
+
+if TYPE_CHECKING:
+    from locust.env import Environment
+
+
+class AsyncAccountsGatewayHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/accounts сервиса http-gateway.
+    Методы совпадают с AccountsGatewayHTTPClient, но являются корутинами.
+    """
+
+    async def get_accounts_api(self, query: GetAccountsQuerySchema) -> Response:
+        """
+        Выполняет GET-запрос на получение списка счетов пользователя.
+
+        :param query: Словарь с параметрами запроса, например: {'userId': '123'}.
+        :return: Объект httpx.Response с данными о счетах.
+        """
+        return await self.get("/api/v1/accounts", params=QueryParams(**query.model_dump(by_alias=True)),
+                              extensions=HTTPClientExtensions(route="/api/v1/accounts"))
+
+    async def open_deposit_account_api(self, request: OpenDepositAccountRequestSchema) -> Response:
+        """
+        Выполняет POST-запрос для открытия депозитного счёта.
+
+        :param request: Словарь с userId.
+        :return: Объект httpx.Response с результатом операции.
+        """
+        return await self.post("/api/v1/accounts/open-deposit-account", json=request.model_dump(by_alias=True))
+
+    async def open_savings_account_api(self, request: OpenSavingsAccountRequestSchema) -> Response:
+        """
+        Выполняет POST-запрос для открытия сберегательного счёта.
+
+        :param request: Словарь с userId.
+        :return: Объект httpx.Response.
+        """
+        return await self.post("/api/v1/accounts/open-savings-account", json=request.model_dump(by_alias=True))
+
+    async def open_debit_card_account_api(self, request: OpenDebitCardAccountRequestSchema) -> Response:
+        """
+        Выполняет POST-запрос для открытия дебетовой карты.
+
+        :param request: Словарь с userId.
+        :return: Объект httpx.Response.
+        """
+        return await self.post("/api/v1/accounts/open-debit-card-account", json=request.model_dump(by_alias=True))
+
+    async def open_credit_card_account_api(self, request: OpenCreditCardAccountRequestSchema) -> Response:
+        """
+        Выполняет POST-запрос для открытия кредитной карты.
+
+        :param request: Словарь с userId.
+        :return: Объект httpx.Response.
+        """
+        return await self.post("/api/v1/accounts/open-credit-card-account", json=request.model_dump(by_alias=True))
+
+    async def get_accounts(self, user_id: str) -> GetAccountsResponseSchema:
+        query = GetAccountsQuerySchema(user_id=user_id)
+        response = await self.get_accounts_api(query)
+        return GetAccountsResponseSchema.model_validate_json(response.text)
+
+    async def open_deposit_account(self, user_id: str) -> OpenDepositAccountResponseSchema:
+        request = OpenDepositAccountRequestSchema(user_id=user_id)
+        response = await self.open_deposit_account_api(request)
+        return OpenDepositAccountResponseSchema.model_validate_json(response.text)
+
+    async def open_savings_account(self, user_id: str) -> OpenSavingsAccountResponseSchema:
+        request = OpenSavingsAccountRequestSchema(user_id=user_id)
+        response = await self.open_savings_account_api(request)
+        return OpenSavingsAccountResponseSchema.model_validate_json(response.text)
+
+    async def open_debit_card_account(self, user_id: str) -> OpenDebitCardAccountResponseSchema:
+        request = OpenDebitCardAccountRequestSchema(user_id=user_id)
+        response = await self.open_debit_card_account_api(request)
+        return OpenDebitCardAccountResponseSchema.model_validate_json(response.text)
+
+    async def open_credit_card_account(self, user_id: str) -> OpenCreditCardAccountResponseSchema:
+        request = OpenCreditCardAccountRequestSchema(user_id=user_id)
+        response = await self.open_credit_card_account_api(request)
+        return OpenCreditCardAccountResponseSchema.model_validate_json(response.text)
+
+
+def build_accounts_gateway_async_http_client(client: AsyncClient | None = None) -> AsyncAccountsGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncAccountsGatewayHTTPClient с уже настроенным асинхронным HTTP-клиентом.
+
+    :param client: Общий httpx.AsyncClient (см. build_gateway_async_http_client).
+        Если не передан, создаётся собственный.
+    :return: Готовый к использованию AsyncAccountsGatewayHTTPClient.
+    """
+    return AsyncAccountsGatewayHTTPClient(client=client or build_gateway_async_http_client())
+
+
+def build_accounts_gateway_locust_async_http_client(
+        environment: "Environment",
+        client: AsyncClient | None = None
+) -> AsyncAccountsGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncAccountsGatewayHTTPClient, отправляющий метрики в Locust через асинхронные хуки.
+
+    :param environment: объект окружения Locust.
+    :param client: Общий httpx.AsyncClient с хуками (см. build_gateway_locust_async_http_client).
+        Если не передан, создаётся собственный.
+    :return: экземпляр AsyncAccountsGatewayHTTPClient с хуками сбора метрик.
+    """
+    return AsyncAccountsGatewayHTTPClient(client=client or build_gateway_locust_async_http_client(environment))
@@ -1,4 +1,4 @@
-from httpx import Response, QueryParams
+from httpx import Response, QueryParams, Client
 from locust.env import Environment
 
 from clients.http.client import HTTPClient, HTTPClientExtensions
@@ -95,7 +95,10 @@ def build_accounts_gateway_http_client() -> AccountsGatewayHTTPClient:
     return AccountsGatewayHTTPClient(client=build_gateway_http_client())
 
 
-def build_accounts_gateway_locust_http_client(environment: Environment) -> AccountsGatewayHTTPClient:
+def build_accounts_gateway_locust_http_client(
+        environment: Environment,
+        client: Client | None = None
+) -> AccountsGatewayHTTPClient:
     """
     Функция создаёт экземпляр AccountsGatewayHTTPClient адаптированного под Locust.
 
@@ -103,6 +106,8 @@ def build_accounts_gateway_locust_http_client(environment: Environment) -> Accou
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param client: Общий httpx.Client виртуального пользователя (см. build_gateway_locust_http_user_client).
+        Если не передан, создаётся собственный.
     :return: экземпляр AccountsGatewayHTTPClient с хуками сбора метрик.
     """
-    return AccountsGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
+    return AccountsGatewayHTTPClient(client=client or build_gateway_locust_http_client(environment))
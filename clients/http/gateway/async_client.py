@@ -0,0 +1,58 @@
+from typing import TYPE_CHECKING
+
+from httpx import AsyncClient, AsyncHTTPTransport
+
+from clients.http.event_hooks.async_locust_event_hook import (
+    locust_async_request_event_hook,
+    locust_async_response_event_hook
+)
+from clients.http.transport import build_http_limits, build_http_timeout, get_http_versions
+from config import settings
+
+if TYPE_CHECKING:
+    from locust.env import Environment
+
+
+def build_gateway_async_http_transport() -> AsyncHTTPTransport:
+    """
+    Создаёт асинхронный транспорт (пул соединений) для http-gateway с размером пула, keep-alive
+    и версией протокола (HTTP/1.1 или HTTP/2) из settings.gateway_http_client.
+    """
+    return AsyncHTTPTransport(
+        limits=build_http_limits(settings.gateway_http_client),
+        **get_http_versions(settings.gateway_http_client)
+    )
+
+
+def build_gateway_async_http_client() -> AsyncClient:
+    """
+    Функция создаёт экземпляр httpx.AsyncClient с настройками для сервиса http-gateway из settings.gateway_http_client.
+
+    Один AsyncClient можно передать всем асинхронным клиентам gateway: запросы разделят пул соединений.
+
+    :return: Готовый к использованию объект httpx.AsyncClient.
+    """
+    return AsyncClient(
+        timeout=build_http_timeout(settings.gateway_http_client),
+        base_url=settings.gateway_http_client.client_url,
+        transport=build_gateway_async_http_transport()
+    )
+
+
+def build_gateway_locust_async_http_client(environment: "Environment") -> AsyncClient:
+    """
+    Асинхронный HTTP-клиент, который отправляет метрики каждого запроса в Locust
+    через асинхронные хуки locust_async_request_event_hook и locust_async_response_event_hook.
+
+    :param environment: Объект окружения Locust, необходим для генерации событий метрик.
+    :return: httpx.AsyncClient с подключёнными хуками сбора метрик.
+    """
+    return AsyncClient(
+        timeout=build_http_timeout(settings.gateway_http_client),
+        base_url=settings.gateway_http_client.client_url,
+        transport=build_gateway_async_http_transport(),
+        event_hooks={
+            "request": [locust_async_request_event_hook],
+            "response": [locust_async_response_event_hook(environment)]
+        }
+    )
@@ -0,0 +1,75 @@
+from typing import TYPE_CHECKING
+
+from httpx import AsyncClient, Response
+
+from clients.http.client import AsyncHTTPClient
+from clients.http.gateway.cards.schema import IssueVirtualCardRequestSchema, IssuePhysicalCardRequestSchema, \
+    IssueVirtualCardResponseSchema, IssuePhysicalCardResponseSchema
+from clients.http.gateway.async_client import (
+    build_gateway_async_http_client,
+    build_gateway_locust_async_http_client
+)
+
+if TYPE_CHECKING:
+    from locust.env import Environment
+
+
+class AsyncCardsGatewayHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/cards сервиса http-gateway.
+    Методы совпадают с CardsGatewayHTTPClient, но являются корутинами.
+    """
+
+    async def issue_virtual_card_api(self, request: IssueVirtualCardRequestSchema) -> Response:
+        """
+        Выпуск виртуальной карты.
+
+        :param request: Словарь с данными для выпуска виртуальной карты.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.post("/api/v1/cards/issue-virtual-card", json=request.model_dump(by_alias=True))
+
+    async def issue_physical_card_api(self, request: IssuePhysicalCardRequestSchema) -> Response:
+        """
+        Выпуск физической карты.
+
+        :param request: Словарь с данными для выпуска физической карты.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.post("/api/v1/cards/issue-physical-card", json=request.model_dump(by_alias=True))
+
+    async def issue_virtual_card(self, user_id: str, account_id: str) -> IssueVirtualCardResponseSchema:
+        request = IssueVirtualCardRequestSchema(user_id=user_id, account_id=account_id)
+        response = await self.issue_virtual_card_api(request)
+        return IssueVirtualCardResponseSchema.model_validate_json(response.text)
+
+    async def issue_physical_card(self, user_id: str, account_id: str) -> IssuePhysicalCardResponseSchema:
+        request = IssuePhysicalCardRequestSchema(user_id=user_id, account_id=account_id)
+        response = await self.issue_physical_card_api(request)
+        return IssuePhysicalCardResponseSchema.model_validate_json(response.text)
+
+
+def build_cards_gateway_async_http_client(client: AsyncClient | None = None) -> AsyncCardsGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncCardsGatewayHTTPClient с уже настроенным асинхронным HTTP-клиентом.
+
+    :param client: Общий httpx.AsyncClient (см. build_gateway_async_http_client).
+        Если не передан, создаётся собственный.
+    :return: Готовый к использованию AsyncCardsGatewayHTTPClient.
+    """
+    return AsyncCardsGatewayHTTPClient(client=client or build_gateway_async_http_client())
+
+
+def build_cards_gateway_locust_async_http_client(
+        environment: "Environment",
+        client: AsyncClient | None = None
+) -> AsyncCardsGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncCardsGatewayHTTPClient, отправляющий метрики в Locust через асинхронные хуки.
+
+    :param environment: объект окружения Locust.
+    :param client: Общий httpx.AsyncClient с хуками (см. build_gateway_locust_async_http_client).
+        Если не передан, создаётся собственный.
+    :return: экземпляр AsyncCardsGatewayHTTPClient с хуками сбора метрик.
+    """
+    return AsyncCardsGatewayHTTPClient(client=client or build_gateway_locust_async_http_client(environment))
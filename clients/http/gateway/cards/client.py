@@ -1,4 +1,4 @@
-from httpx import Response
+from httpx import Response, Client
 from locust.env import Environment
 
 from clients.http.client import HTTPClient
@@ -50,7 +50,10 @@ def build_cards_gateway_http_client() -> CardsGatewayHTTPClient:
     return CardsGatewayHTTPClient(client=build_gateway_http_client())
 
 
-def build_cards_gateway_locust_http_client(environment: Environment) -> CardsGatewayHTTPClient:
+def build_cards_gateway_locust_http_client(
+        environment: Environment,
+        client: Client | None = None
+) -> CardsGatewayHTTPClient:
     """
     Функция создаёт экземпляр CardsGatewayHTTPClient адаптированного под Locust.
 
@@ -58,6 +61,8 @@ def build_cards_gateway_locust_http_client(environment: Environment) -> CardsGat
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param client: Общий httpx.Client виртуального пользователя (см. build_gateway_locust_http_user_client).
+        Если не передан, создаётся собственный.
     :return: экземпляр CardsGatewayHTTPClient с хуками сбора метрик.
     """
-    return CardsGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
\ No newline at end of file
+    return CardsGatewayHTTPClient(client=client or build_gateway_locust_http_client(environment))
\ No newline at end of file
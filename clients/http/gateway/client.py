@@ -1,9 +1,50 @@
 from httpx import Client
 from clients.http.event_hooks.locust_event_hook import locust_request_event_hook, locust_response_event_hook
+from clients.http.event_hooks.status_event_hook import raise_for_status_event_hook
+from clients.http.transport import (
+    HTTPConnectionStats,
+    StatsHTTPTransport,
+    build_http_limits,
+    build_http_timeout,
+    get_http_versions
+)
 from locust.env import Environment
 from config import settings
 import logging
 
+logger = logging.getLogger(__name__)
+
+# Статистика соединений всех транспортов http-gateway в процессе
+gateway_http_connection_stats = HTTPConnectionStats()
+
+# Общий транспорт процесса для pool_mode == "worker" (создаётся при первом обращении)
+gateway_http_transport: StatsHTTPTransport | None = None
+
+
+def build_gateway_http_transport() -> StatsHTTPTransport:
+    """
+    Создаёт транспорт (пул соединений) для http-gateway с размером пула, keep-alive
+    и версией протокола (HTTP/1.1 или HTTP/2) из settings.gateway_http_client.
+
+    :return: Транспорт, который пишет статистику в gateway_http_connection_stats.
+    """
+    return StatsHTTPTransport(
+        stats=gateway_http_connection_stats,
+        limits=build_http_limits(settings.gateway_http_client),
+        **get_http_versions(settings.gateway_http_client)
+    )
+
+
+def get_gateway_http_transport() -> StatsHTTPTransport:
+    """
+    Возвращает общий для процесса транспорт http-gateway: все клиенты делят один пул соединений.
+    """
+    global gateway_http_transport
+    if gateway_http_transport is None:
+        gateway_http_transport = build_gateway_http_transport()
+
+    return gateway_http_transport
+
 
 def build_gateway_http_client() -> Client:
     """
@@ -11,7 +52,28 @@ def build_gateway_http_client() -> Client:
 
     :return: Готовый к использованию объект httpx.Client.
     """
-    return Client(timeout=100, base_url="http://localhost:8003")
+    return Client(
+        timeout=build_http_timeout(settings.gateway_http_client),
+        base_url=settings.gateway_http_client.client_url,
+        transport=build_gateway_http_transport()
+    )
+
+
+def build_gateway_verifier_http_client() -> Client:
+    """
+    HTTP-клиент для проверки сидов на gateway (см. seeds.verifier).
+
+    В отличие от обычного клиента, ответы 4xx/5xx выбрасывают httpx.HTTPStatusError
+    (см. raise_for_status_event_hook): проверке нужно отличить 404 от ошибки сервера.
+
+    :return: httpx.Client с хуком raise_for_status_event_hook.
+    """
+    return Client(
+        timeout=build_http_timeout(settings.gateway_http_client),
+        base_url=settings.gateway_http_client.client_url,
+        transport=build_gateway_http_transport(),
+        event_hooks={"response": [raise_for_status_event_hook]}
+    )
 
 
 def build_gateway_locust_http_client(environment: Environment) -> Client:
@@ -26,16 +88,55 @@ def build_gateway_locust_http_client(environment: Environment) -> Client:
     Таким образом, данный клиент автоматически репортит статистику в Locust
     при каждом выполненном HTTP-запросе.
 
+    Пул соединений зависит от settings.gateway_http_client.pool_mode: при "worker" клиент использует
+    общий транспорт процесса, иначе — собственный. Статистика соединений выводится в лог по окончании теста.
+
     :param environment: Объект окружения Locust, необходим для генерации событий метрик.
     :return: httpx.Client с подключёнными хуками под нагрузочное тестирование.
     """
     logging.getLogger("httpx").setLevel(logging.WARNING)
+    init_locust_http_connection_stats(environment)
+
+    if settings.gateway_http_client.pool_mode == "worker":
+        transport = get_gateway_http_transport()
+    else:
+        transport = build_gateway_http_transport()
 
     return Client(
-        timeout=settings.gateway_http_client.timeout,
+        timeout=build_http_timeout(settings.gateway_http_client),
         base_url=settings.gateway_http_client.client_url,
+        transport=transport,
         event_hooks={
             "request": [locust_request_event_hook],
             "response": [locust_response_event_hook(environment)]
         }
     )
+
+
+def build_gateway_locust_http_user_client(environment: Environment) -> Client | None:
+    """
+    Возвращает клиент, общий для всех клиентов gateway одного виртуального пользователя,
+    если settings.gateway_http_client.pool_mode == "user", иначе None (каждый клиент создаёт свой).
+
+    :param environment: Объект окружения Locust.
+    :return: httpx.Client виртуального пользователя или None.
+    """
+    if settings.gateway_http_client.pool_mode != "user":
+        return None
+
+    return build_gateway_locust_http_client(environment)
+
+
+def init_locust_http_connection_stats(environment: Environment) -> None:
+    """
+    Один раз на окружение Locust подписывается на окончание теста, чтобы вывести статистику соединений.
+    """
+    if getattr(environment, "http_connection_stats", None) is not None:
+        return
+
+    environment.http_connection_stats = gateway_http_connection_stats
+
+    def on_test_stop(**kwargs):
+        logger.info(f"Соединения http-gateway: {gateway_http_connection_stats}")
+
+    environment.events.test_stop.add_listener(on_test_stop)
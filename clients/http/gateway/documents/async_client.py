@@ -0,0 +1,74 @@
+from typing import TYPE_CHECKING
+
+from httpx import AsyncClient, Response
+
+from clients.http.client import AsyncHTTPClient, HTTPClientExtensions
+from clients.http.gateway.async_client import (
+    build_gateway_async_http_client,
+    build_gateway_locust_async_http_client
+)
+from clients.http.gateway.documents.schema import GetTariffDocumentResponseSchema, GetContractDocumentResponseSchema
+
+if TYPE_CHECKING:
+    from locust.env import Environment
+
+
+class AsyncDocumentsGatewayHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/documents сервиса http-gateway.
+    Методы совпадают с DocumentsGatewayHTTPClient, но являются корутинами.
+    """
+
+    async def get_tariff_document_api(self, account_id: str) -> Response:
+        """
+        Получение тарифа по счету.
+
+        :param account_id: Идентификатор счета.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.get(f"/api/v1/documents/tariff-document/{account_id}",
+                              extensions=HTTPClientExtensions(route="/api/v1/documents/tariff-document/{account_id}"))
+
+    async def get_contract_document_api(self, account_id: str) -> Response:
+        """
+        Получение контракта по счету.
+
+        :param account_id: Идентификатор счета.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.get(f"/api/v1/documents/contract-document/{account_id}",
+                              extensions=HTTPClientExtensions(route="/api/v1/documents/contract-document/{account_id}"))
+
+    async def get_tariff_document(self, account_id: str) -> GetTariffDocumentResponseSchema:
+        response = await self.get_tariff_document_api(account_id)
+        return GetTariffDocumentResponseSchema.model_validate_json(response.text)
+
+    async def get_contract_document(self, account_id: str) -> GetContractDocumentResponseSchema:
+        response = await self.get_contract_document_api(account_id)
+        return GetContractDocumentResponseSchema.model_validate_json(response.text)
+
+
+def build_documents_gateway_async_http_client(client: AsyncClient | None = None) -> AsyncDocumentsGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncDocumentsGatewayHTTPClient с уже настроенным асинхронным HTTP-клиентом.
+
+    :param client: Общий httpx.AsyncClient (см. build_gateway_async_http_client).
+        Если не передан, создаётся собственный.
+    :return: Готовый к использованию AsyncDocumentsGatewayHTTPClient.
+    """
+    return AsyncDocumentsGatewayHTTPClient(client=client or build_gateway_async_http_client())
+
+
+def build_documents_gateway_locust_async_http_client(
+        environment: "Environment",
+        client: AsyncClient | None = None
+) -> AsyncDocumentsGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncDocumentsGatewayHTTPClient, отправляющий метрики в Locust через асинхронные хуки.
+
+    :param environment: объект окружения Locust.
+    :param client: Общий httpx.AsyncClient с хуками (см. build_gateway_locust_async_http_client).
+        Если не передан, создаётся собственный.
+    :return: экземпляр AsyncDocumentsGatewayHTTPClient с хуками сбора метрик.
+    """
+    return AsyncDocumentsGatewayHTTPClient(client=client or build_gateway_locust_async_http_client(environment))
@@ -1,4 +1,4 @@
-from httpx import Response
+from httpx import Response, Client
 from locust.env import Environment
 
 from clients.http.client import HTTPClient, HTTPClientExtensions
@@ -49,7 +49,10 @@ def build_documents_gateway_http_client() -> DocumentsGatewayHTTPClient:
     return DocumentsGatewayHTTPClient(client=build_gateway_http_client())
 
 
-def build_documents_gateway_locust_http_client(environment: Environment) -> DocumentsGatewayHTTPClient:
+def build_documents_gateway_locust_http_client(
+        environment: Environment,
+        client: Client | None = None
+) -> DocumentsGatewayHTTPClient:
     """
     Функция создаёт экземпляр DocumentsGatewayHTTPClient адаптированного под Locust.
 
@@ -57,6 +60,8 @@ def build_documents_gateway_locust_http_client(environment: Environment) -> Docu
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param client: Общий httpx.Client виртуального пользователя (см. build_gateway_locust_http_user_client).
+        Если не передан, создаётся собственный.
     :return: экземпляр DocumentsGatewayHTTPClient с хуками сбора метрик.
     """
-    return DocumentsGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
+    return DocumentsGatewayHTTPClient(client=client or build_gateway_locust_http_client(environment))
@@ -1,7 +1,9 @@
+from httpx import Client
 from locust import TaskSet, SequentialTaskSet
 
 from clients.http.gateway.accounts.client import AccountsGatewayHTTPClient, build_accounts_gateway_locust_http_client
 from clients.http.gateway.cards.client import CardsGatewayHTTPClient, build_cards_gateway_locust_http_client
+from clients.http.gateway.client import build_gateway_locust_http_user_client
 from clients.http.gateway.documents.client import (
     DocumentsGatewayHTTPClient,
     build_documents_gateway_locust_http_client
@@ -11,6 +13,7 @@ from clients.http.gateway.operations.client import (
     build_operations_gateway_locust_http_client
 )
 from clients.http.gateway.users.client import UsersGatewayHTTPClient, build_users_gateway_locust_http_client
+from seeds.harvester import SeedsHarvestSession, init_locust_seeds_harvest
 
 
 class GatewayHTTPTaskSet(TaskSet):
@@ -27,17 +30,43 @@ class GatewayHTTPTaskSet(TaskSet):
     accounts_gateway_client: AccountsGatewayHTTPClient
     documents_gateway_client: DocumentsGatewayHTTPClient
     operations_gateway_client: OperationsGatewayHTTPClient
+    # Сессия сбора сидов (см. seeds.harvester), если задан settings.seeds.harvest
+    harvest_session: SeedsHarvestSession | None = None
+    # Общий httpx.Client клиентов виртуального пользователя, если settings.gateway_http_client.pool_mode == "user"
+    http_client: Client | None = None
 
     def on_start(self) -> None:
         """
         Метод вызывается перед запуском задач TaskSet.
         Здесь создаются API клиенты с использованием контекста окружения Locust.
         """
-        self.users_gateway_client = build_users_gateway_locust_http_client(self.user.environment)
-        self.cards_gateway_client = build_cards_gateway_locust_http_client(self.user.environment)
-        self.accounts_gateway_client = build_accounts_gateway_locust_http_client(self.user.environment)
-        self.documents_gateway_client = build_documents_gateway_locust_http_client(self.user.environment)
-        self.operations_gateway_client = build_operations_gateway_locust_http_client(self.user.environment)
+        self.http_client = build_gateway_locust_http_user_client(self.user.environment)
+        self.users_gateway_client = build_users_gateway_locust_http_client(
+            self.user.environment, self.http_client
+        )
+        self.cards_gateway_client = build_cards_gateway_locust_http_client(
+            self.user.environment, self.http_client
+        )
+        self.accounts_gateway_client = build_accounts_gateway_locust_http_client(
+            self.user.environment, self.http_client
+        )
+        self.documents_gateway_client = build_documents_gateway_locust_http_client(
+            self.user.environment, self.http_client
+        )
+        self.operations_gateway_client = build_operations_gateway_locust_http_client(
+            self.user.environment, self.http_client
+        )
+        self.harvest_session = init_locust_seeds_harvest(self)
+
+    def on_stop(self) -> None:
+        """
+        Передаёт на запись пользователей, собранных виртуальным пользователем (если включён сбор сидов),
+        и закрывает общий клиент виртуального пользователя.
+        """
+        if self.harvest_session is not None:
+            self.harvest_session.finish()
+        if self.http_client is not None:
+            self.http_client.close()
 
 
 class GatewayHTTPSequentialTaskSet(SequentialTaskSet):
@@ -53,13 +82,39 @@ class GatewayHTTPSequentialTaskSet(SequentialTaskSet):
     accounts_gateway_client: AccountsGatewayHTTPClient
     documents_gateway_client: DocumentsGatewayHTTPClient
     operations_gateway_client: OperationsGatewayHTTPClient
+    # Сессия сбора сидов (см. seeds.harvester), если задан settings.seeds.harvest
+    harvest_session: SeedsHarvestSession | None = None
+    # Общий httpx.Client клиентов виртуального пользователя, если settings.gateway_http_client.pool_mode == "user"
+    http_client: Client | None = None
 
     def on_start(self) -> None:
         """
         Создание API клиентов для последовательного сценария.
         """
-        self.users_gateway_client = build_users_gateway_locust_http_client(self.user.environment)
-        self.cards_gateway_client = build_cards_gateway_locust_http_client(self.user.environment)
-        self.accounts_gateway_client = build_accounts_gateway_locust_http_client(self.user.environment)
-        self.documents_gateway_client = build_documents_gateway_locust_http_client(self.user.environment)
-        self.operations_gateway_client = build_operations_gateway_locust_http_client(self.user.environment)
+        self.http_client = build_gateway_locust_http_user_client(self.user.environment)
+        self.users_gateway_client = build_users_gateway_locust_http_client(
+            self.user.environment, self.http_client
+        )
+        self.cards_gateway_client = build_cards_gateway_locust_http_client(
+            self.user.environment, self.http_client
+        )
+        self.accounts_gateway_client = build_accounts_gateway_locust_http_client(
+            self.user.environment, self.http_client
+        )
+        self.documents_gateway_client = build_documents_gateway_locust_http_client(
+            self.user.environment, self.http_client
+        )
+        self.operations_gateway_client = build_operations_gateway_locust_http_client(
+            self.user.environment, self.http_client
+        )
+        self.harvest_session = init_locust_seeds_harvest(self)
+
+    def on_stop(self) -> None:
+        """
+        Передаёт на запись пользователей, собранных виртуальным пользователем (если включён сбор сидов),
+        и закрывает общий клиент виртуального пользователя.
+        """
+        if self.harvest_session is not None:
+            self.harvest_session.finish()
+        if self.http_client is not None:
+            self.http_client.close()
@@ -1,4 +1,4 @@
-from httpx import Response, QueryParams
+from httpx import Response, QueryParams, Client
 from locust.env import Environment
 
 from clients.http.client import HTTPClient, HTTPClientExtensions
@@ -186,7 +186,10 @@ def build_operations_gateway_http_client() -> OperationsGatewayHTTPClient:
     return OperationsGatewayHTTPClient(client=build_gateway_http_client())
 
 
-def build_operations_gateway_locust_http_client(environment: Environment) -> OperationsGatewayHTTPClient:
+def build_operations_gateway_locust_http_client(
+        environment: Environment,
+        client: Client | None = None
+) -> OperationsGatewayHTTPClient:
     """
     Функция создаёт экземпляр OperationsGatewayHTTPClient адаптированного под Locust.
 
@@ -194,6 +197,8 @@ def build_operations_gateway_locust_http_client(environment: Environment) -> Ope
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param client: Общий httpx.Client виртуального пользователя (см. build_gateway_locust_http_user_client).
+        Если не передан, создаётся собственный.
     :return: экземпляр OperationsGatewayHTTPClient с хуками сбора метрик.
     """
-    return OperationsGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
+    return OperationsGatewayHTTPClient(client=client or build_gateway_locust_http_client(environment))
@@ -0,0 +1,73 @@
+from typing import TYPE_CHECKING
+
+from httpx import AsyncClient, Response
+from clients.http.client import AsyncHTTPClient, HTTPClientExtensions
+from clients.http.gateway.async_client import (
+    build_gateway_async_http_client,
+    build_gateway_locust_async_http_client
+)
+from clients.http.gateway.users.schema import CreateUserRequestSchema, GetUserResponseSchema, CreateUserResponseSchema
+
+if TYPE_CHECKING:
+    from locust.env import Environment
+
+
+class AsyncUsersGatewayHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для взаимодействия с /api/v1/users сервиса http-gateway.
+    Методы совпадают с UsersGatewayHTTPClient, но являются корутинами.
+    """
+
+    async def get_user_api(self, user_id: str) -> Response:
+        """
+        Получить данные пользователя по его user_id.
+
+        :param user_id: Идентификатор пользователя.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.get(f"/api/v1/users/{user_id}",
+                              extensions=HTTPClientExtensions(route="/api/v1/users/{user_id}"))
+
+    async def create_user_api(self, request: CreateUserRequestSchema) -> Response:
+        """
+        Создание нового пользователя.
+
+        :param request: Словарь с данными нового пользователя.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.post("/api/v1/users", json=request.model_dump(by_alias=True))
+
+    async def get_user(self, user_id: str) -> GetUserResponseSchema:
+        response = await self.get_user_api(user_id)
+        return GetUserResponseSchema.model_validate_json(response.text)
+
+    async def create_user(self) -> CreateUserResponseSchema:
+        request = CreateUserRequestSchema()
+        response = await self.create_user_api(request)
+        return CreateUserResponseSchema.model_validate_json(response.text)
+
+
+def build_users_gateway_async_http_client(client: AsyncClient | None = None) -> AsyncUsersGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncUsersGatewayHTTPClient с уже настроенным асинхронным HTTP-клиентом.
+
+    :param client: Общий httpx.AsyncClient (см. build_gateway_async_http_client).
+        Если не передан, создаётся собственный.
+    :return: Готовый к использованию AsyncUsersGatewayHTTPClient.
+    """
+    return AsyncUsersGatewayHTTPClient(client=client or build_gateway_async_http_client())
+
+
+def build_users_gateway_locust_async_http_client(
+        environment: "Environment",
+        client: AsyncClient | None = None
+) -> AsyncUsersGatewayHTTPClient:
+    """
+    Функция создаёт экземпляр AsyncUsersGatewayHTTPClient, отправляющий метрики в Locust через асинхронные хуки.
+
+    :param environment: объект окружения Locust.
+    :param client: Общий httpx.AsyncClient с хуками (см. build_gateway_locust_async_http_client).
+        Если не передан, создаётся собственный.
+    :return: экземпляр AsyncUsersGatewayHTTPClient с хуками сбора метрик.
+    """
+    return AsyncUsersGatewayHTTPClient(client=client or build_gateway_locust_async_http_client(environment))
@@ -0,0 +1,128 @@
+from weakref import WeakSet
+
+from httpx import HTTPTransport, Limits, Request, Response, Timeout
+
+from tools.config.http import HTTPClientConfig
+
+
+def build_http_timeout(config: HTTPClientConfig) -> Timeout:
+    """
+    Собирает таймауты из настроек клиента: незаданные таймауты фаз равны config.timeout.
+    """
+    return Timeout(
+        connect=config.timeout if config.connect_timeout is None else config.connect_timeout,
+        read=config.timeout if config.read_timeout is None else config.read_timeout,
+        write=config.timeout if config.write_timeout is None else config.write_timeout,
+        pool=config.timeout if config.pool_timeout is None else config.pool_timeout
+    )
+
+
+def build_http_limits(config: HTTPClientConfig) -> Limits:
+    """
+    Собирает размер пула и время жизни keep-alive соединений из настроек клиента.
+    """
+    return Limits(
+        max_connections=config.max_connections,
+        max_keepalive_connections=config.max_keepalive_connections,
+        keepalive_expiry=config.keepalive_expiry
+    )
+
+
+def get_http_versions(config: HTTPClientConfig) -> dict[str, bool]:
+    """
+    Возвращает параметры http1/http2 транспорта httpx.
+
+    HTTP/2 без TLS (http://) не согласуется через ALPN, поэтому для такого адреса клиент
+    сразу говорит по HTTP/2 (prior knowledge, h2c), а для https:// версия выбирается при рукопожатии.
+    """
+    if config.http2:
+        # h2 — необязательная зависимость, нужна только для HTTP/2 (httpx проверяет её лишь при первом запросе)
+        import h2  # noqa: F401
+
+    return {"http1": not (config.http2 and config.url.scheme == "http"), "http2": config.http2}
+
+
+class HTTPConnectionStats:
+    """
+    Статистика соединений одного или нескольких HTTP-транспортов.
+
+    Attributes:
+        requests (int): Количество выполненных запросов.
+        opened (int): Количество открытых TCP-соединений.
+        reused (int): Количество запросов, отправленных по уже открытому соединению (keep-alive).
+    """
+
+    def __init__(self):
+        self.requests = 0
+        self.opened = 0
+        self.reused = 0
+        self.transports: WeakSet["StatsHTTPTransport"] = WeakSet()
+
+    @property
+    def connections(self) -> int:
+        """
+        Количество соединений, которые сейчас держат пулы транспортов.
+        """
+        return sum(len(transport.get_connections()) for transport in self.transports)
+
+    @property
+    def idle(self) -> int:
+        """
+        Количество простаивающих соединений в пулах транспортов (открыты, но запрос по ним не идёт).
+        """
+        return sum(
+            1 for transport in self.transports for connection in transport.get_connections() if connection.is_idle()
+        )
+
+    def __str__(self) -> str:
+        return (
+            f"запросов {self.requests}, открыто соединений {self.opened}, переиспользовано {self.reused}, "
+            f"в пулах {self.connections} (простаивают {self.idle})"
+        )
+
+
+class StatsHTTPTransport(HTTPTransport):
+    """
+    HTTP-транспорт httpx (пул соединений), который считает открытые и переиспользованные соединения.
+
+    Новое соединение определяется по trace-событию httpcore connection.connect_tcp.complete:
+    если запрос был отправлен (send_request_headers), а соединение не открывалось,
+    запрос ушёл по соединению из пула.
+    """
+
+    def __init__(self, stats: HTTPConnectionStats, limits: Limits, **kwargs):
+        """
+        :param stats: Статистика, в которую транспорт пишет счётчики (может быть общей для нескольких транспортов).
+        :param limits: Размер пула и время жизни keep-alive соединений.
+        :param kwargs: Остальные параметры httpx.HTTPTransport.
+        """
+        super().__init__(limits=limits, **kwargs)
+        self.stats = stats
+        stats.transports.add(self)
+
+    def get_connections(self) -> list:
+        # httpx не даёт публичного доступа к пулу httpcore, а статистика простаивающих соединений нужна
+        return list(self._pool.connections)
+
+    def handle_request(self, request: Request) -> Response:
+        connected, sent = False, False
+        trace = request.extensions.get("trace")
+
+        def on_trace(event_name: str, info: dict) -> None:
+            nonlocal connected, sent
+            if event_name == "connection.connect_tcp.complete":
+                connected = True
+            elif event_name.endswith("send_request_headers.started"):
+                sent = True
+            if trace is not None:
+                trace(event_name, info)
+
+        request.extensions["trace"] = on_trace
+        try:
+            return super().handle_request(request)
+        finally:
+            self.stats.requests += 1
+            if connected:
+                self.stats.opened += 1
+            elif sent:
+                self.stats.reused += 1
@@ -2,24 +2,30 @@ from locust import task, events
 from locust.env import Environment
 
 from clients.grpc.gateway.locust import GatewayGRPCTaskSet
-from seeds.scenarios.existing_user_get_operations import ExistingUserGetOperationsSeedsScenario
-from seeds.schema.result import SeedUserResult
+from seeds.locust import init_locust_seeds
+from seeds.scenarios.existing_user_get_operations import (
+    CREDIT_CARD_ACCOUNT_QUERY,
+    ExistingUserGetOperationsSeedsScenario
+)
+from seeds.schema.result import SeedUserResult, SeedAccountResult
 from tools.locust.user import LocustBaseUser
 
 
 @events.init.add_listener
 def init(environment: Environment, **kwargs):
-    seeds_scenario = ExistingUserGetOperationsSeedsScenario()
-    seeds_scenario.build()
-    environment.seeds = seeds_scenario.load()
+    # Сидинг выполняется один раз (в распределённом режиме — только на мастере),
+    # а в environment.seeds попадают пользователи этого процесса
+    init_locust_seeds(environment, ExistingUserGetOperationsSeedsScenario(), queries=[CREDIT_CARD_ACCOUNT_QUERY])
 
 
 class GetOperationsTaskSet(GatewayGRPCTaskSet):
     seed_user: SeedUserResult
+    credit_card_account: SeedAccountResult
 
     def on_start(self) -> None:
         super().on_start()
-        self.seed_user = self.user.environment.seeds.get_random_user()
+        self.seed_user = self.user.environment.seeds.get_random_user(CREDIT_CARD_ACCOUNT_QUERY)
+        self.credit_card_account = CREDIT_CARD_ACCOUNT_QUERY.get_account(self.seed_user)
 
     @task
     def get_accounts(self):
@@ -28,13 +34,13 @@ class GetOperationsTaskSet(GatewayGRPCTaskSet):
     @task(3)
     def get_operations(self):
         self.operations_gateway_client.get_operations(
-            account_id=self.seed_user.credit_card_accounts[0].account_id
+            account_id=self.credit_card_account.account_id
         )
 
     @task(3)
     def get_operations_summary(self):
         self.operations_gateway_client.get_operations_summary(
-            account_id=self.seed_user.credit_card_accounts[0].account_id
+            account_id=self.credit_card_account.account_id
         )
 
 
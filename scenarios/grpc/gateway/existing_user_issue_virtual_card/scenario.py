@@ -2,27 +2,31 @@ from locust import task, events
 from locust.env import Environment
 
 from clients.grpc.gateway.locust import GatewayGRPCTaskSet
-from seeds.scenarios.existing_user_issue_virtual_card import ExistingUserIssueVirtualCardSeedsScenario
-from seeds.schema.result import SeedUserResult
+from seeds.locust import init_locust_seeds
+from seeds.scenarios.existing_user_issue_virtual_card import (
+    DEBIT_CARD_ACCOUNT_QUERY,
+    ExistingUserIssueVirtualCardSeedsScenario
+)
+from seeds.schema.result import SeedUserResult, SeedAccountResult
 from tools.locust.user import LocustBaseUser
 
 
 @events.init.add_listener
 def init(environment: Environment, **kwargs):
-    seeds_scenario = ExistingUserIssueVirtualCardSeedsScenario()
-
-    seeds_scenario.build()
-
-    environment.seeds = seeds_scenario.load()
+    # Сидинг выполняется один раз (в распределённом режиме — только на мастере),
+    # а в environment.seeds попадают пользователи этого процесса
+    init_locust_seeds(environment, ExistingUserIssueVirtualCardSeedsScenario(), queries=[DEBIT_CARD_ACCOUNT_QUERY])
 
 
 class IssueVirtualCardTaskSet(GatewayGRPCTaskSet):
     seed_user: SeedUserResult
+    debit_card_account: SeedAccountResult
 
     def on_start(self) -> None:
         super().on_start()
 
-        self.seed_user = self.user.environment.seeds.get_random_user()
+        self.seed_user = self.user.environment.seeds.get_random_user(DEBIT_CARD_ACCOUNT_QUERY)
+        self.debit_card_account = DEBIT_CARD_ACCOUNT_QUERY.get_account(self.seed_user)
 
     @task(3)
     def get_accounts(self):
@@ -32,7 +36,7 @@ class IssueVirtualCardTaskSet(GatewayGRPCTaskSet):
     def issue_virtual_card(self):
         self.cards_gateway_client.issue_virtual_card(
             user_id=self.seed_user.user_id,
-            account_id=self.seed_user.debit_card_accounts[0].account_id,
+            account_id=self.debit_card_account.account_id,
         )
 
 
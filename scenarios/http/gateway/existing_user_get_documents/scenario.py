@@ -2,8 +2,13 @@ from locust import task, events
 from locust.env import Environment
 
 from clients.http.gateway.locust import GatewayHTTPTaskSet
-from seeds.scenarios.existing_user_get_documents import ExistingUserGetDocumentsSeedsScenario
-from seeds.schema.result import SeedUserResult
+from seeds.locust import init_locust_seeds
+from seeds.scenarios.existing_user_get_documents import (
+    DEBIT_CARD_ACCOUNT_QUERY,
+    SAVINGS_ACCOUNT_QUERY,
+    ExistingUserGetDocumentsSeedsScenario
+)
+from seeds.schema.result import SeedUserResult, SeedAccountResult
 from tools.locust.user import LocustBaseUser
 
 
@@ -11,27 +16,27 @@ from tools.locust.user import LocustBaseUser
 # Мы используем его, чтобы заранее прогнать сидинг и загрузить пользователей в память.
 @events.init.add_listener
 def init(environment: Environment, **kwargs):
-    # Создаем экземпляр сидинг-сценария
-    seeds_scenario = ExistingUserGetDocumentsSeedsScenario()
-
-    # Выполняем генерацию данных, если они ещё не созданы
-    seeds_scenario.build()
-
-    # Загружаем сгенерированных пользователей в окружение Locust
-    environment.seeds = seeds_scenario.load()
+    # Сидинг выполняется один раз (в распределённом режиме — только на мастере),
+    # а в environment.seeds попадают пользователи этого процесса
+    # Индекс по запросу строится сразу при загрузке сидов, а не при первом обращении из задачи
+    init_locust_seeds(environment, ExistingUserGetDocumentsSeedsScenario(), queries=[SAVINGS_ACCOUNT_QUERY])
 
 
 # Набор задач (TaskSet), который будет выполняться виртуальными пользователями.
 class GetDocumentsTaskSet(GatewayHTTPTaskSet):
     # Типизируем объект пользователя из сидинга
     seed_user: SeedUserResult
+    savings_account: SeedAccountResult
+    debit_card_account: SeedAccountResult
 
     # Метод вызывается при запуске каждой сессии пользователя (до начала задач)
     def on_start(self) -> None:
         super().on_start()
 
-        # Получаем следующего пользователя из списка (по порядку!)
-        self.seed_user = self.user.environment.seeds.get_next_user()
+        # Получаем следующего пользователя со сберегательным счётом (по порядку!)
+        self.seed_user = self.user.environment.seeds.get_next_user(SAVINGS_ACCOUNT_QUERY)
+        self.savings_account = SAVINGS_ACCOUNT_QUERY.get_account(self.seed_user)
+        self.debit_card_account = DEBIT_CARD_ACCOUNT_QUERY.get_account(self.seed_user)
 
     @task(1)
     def get_accounts(self):
@@ -42,14 +47,14 @@ class GetDocumentsTaskSet(GatewayHTTPTaskSet):
     def get_tariff_document(self):
         # Загружаем тарифный документ по сберегательному счёту
         self.documents_gateway_client.get_tariff_document(
-            account_id=self.seed_user.savings_accounts[0].account_id
+            account_id=self.savings_account.account_id
         )
 
     @task(2)
     def get_contract_document(self):
         # Загружаем договор по дебетовой карте
         self.documents_gateway_client.get_contract_document(
-            account_id=self.seed_user.debit_card_accounts[0].account_id
+            account_id=self.debit_card_account.account_id
         )
 
 
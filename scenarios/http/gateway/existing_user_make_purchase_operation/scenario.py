@@ -1,38 +1,66 @@
+import logging
+
 from locust import task, events
 from locust.env import Environment
 
 from clients.http.gateway.locust import GatewayHTTPTaskSet
-from seeds.scenarios.existing_user_make_purchase_operation import ExistingUserMakePurchaseOperationSeedsScenario
-from seeds.schema.result import SeedUserResult
+from seeds.locust import init_locust_seeds
+from seeds.scenarios.existing_user_make_purchase_operation import (
+    CREDIT_CARD_ACCOUNT_QUERY,
+    ExistingUserMakePurchaseOperationSeedsScenario
+)
+from seeds.schema.result import SeedUserResult, SeedAccountResult
 from tools.locust.user import LocustBaseUser
 
+logger = logging.getLogger(__name__)
+
 
 # Хук инициализации — вызывается перед началом запуска нагрузки
 @events.init.add_listener
 def init(environment: Environment, **kwargs):
-    # Выполняем сидинг
-    seeds_scenario = ExistingUserMakePurchaseOperationSeedsScenario()
-    seeds_scenario.build()  # создаём пользователей, счета, карты и операции
-
-    # Загружаем результат сидинга (из файла JSON)
-    environment.seeds = seeds_scenario.load()
+    # Сидинг выполняется один раз (в распределённом режиме — только на мастере),
+    # а в environment.seeds попадают пользователи этого процесса
+    init_locust_seeds(
+        environment, ExistingUserMakePurchaseOperationSeedsScenario(), queries=[CREDIT_CARD_ACCOUNT_QUERY]
+    )
 
 
 # TaskSet — сценарий пользователя. Каждый виртуальный пользователь выполняет эти задачи
 class MakePurchaseOperationTaskSet(GatewayHTTPTaskSet):
     seed_user: SeedUserResult  # Типизированная ссылка на данные из сидинга
+    credit_card_account: SeedAccountResult  # Кредитный счёт пользователя с физической картой
+    is_leased: bool = False  # Арендован ли seed_user (иначе он общий и возвращать его не нужно)
 
     def on_start(self) -> None:
         super().on_start()
-        # Получаем случайного пользователя из подготовленного списка
-        self.seed_user = self.user.environment.seeds.get_random_user()
+        # Арендуем пользователя эксклюзивно: покупки меняют баланс счёта,
+        # и два виртуальных пользователя на одном счёте создавали бы лишнюю конкуренцию за блокировки
+        try:
+            self.seed_user = self.user.environment.seeds.lease_user(CREDIT_CARD_ACCOUNT_QUERY)
+            self.is_leased = True
+        except IndexError:
+            # Виртуальных пользователей больше, чем сидов: продолжаем на общем пользователе,
+            # чтобы не терять нагрузку, но предупреждаем — нужно увеличить количество сидов
+            logger.warning(
+                "Свободные сидинговые пользователи закончились, виртуальный пользователь работает "
+                "с общим пользователем. Увеличьте количество пользователей в сценарии сидинга"
+            )
+            self.seed_user = self.user.environment.seeds.get_random_user(CREDIT_CARD_ACCOUNT_QUERY)
+
+        self.credit_card_account = CREDIT_CARD_ACCOUNT_QUERY.get_account(self.seed_user)
+
+    def on_stop(self) -> None:
+        # Возвращаем пользователя в пул, чтобы его мог получить следующий виртуальный пользователь
+        if self.is_leased:
+            self.user.environment.seeds.release_user(self.seed_user)
+            self.is_leased = False
 
     @task(1)
     def make_purchase_operation(self):
         # Совершаем покупку по первой карте пользователя
         self.operations_gateway_client.make_purchase_operation(
-            card_id=self.seed_user.credit_card_accounts[0].physical_cards[0].card_id,
-            account_id=self.seed_user.credit_card_accounts[0].account_id
+            card_id=self.credit_card_account.physical_cards[0].card_id,
+            account_id=self.credit_card_account.account_id
         )
 
     @task(2)
@@ -44,14 +72,14 @@ class MakePurchaseOperationTaskSet(GatewayHTTPTaskSet):
     def get_operations(self):
         # Получаем список операций по счёту
         self.operations_gateway_client.get_operations(
-            account_id=self.seed_user.credit_card_accounts[0].account_id
+            account_id=self.credit_card_account.account_id
         )
 
     @task(2)
     def get_operations_summary(self):
         # Получаем статистику по операциям пользователя
         self.operations_gateway_client.get_operations_summary(
-            account_id=self.seed_user.credit_card_accounts[0].account_id
+            account_id=self.credit_card_account.account_id
         )
 
 
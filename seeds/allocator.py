@@ -0,0 +1,359 @@
+import random
+import threading
+from typing import Iterable, Sequence
+
+from seeds.schema.query import SeedsQuery
+from seeds.schema.result import SeedUserResult
+
+
+class SeedsFreeIndexes:
+    """
+    Список индексов свободных пользователей с удалением за O(1).
+
+    Один и тот же пользователь может находиться сразу в нескольких списках (общем и индексах запросов),
+    поэтому занятые пользователи удаляются из списков лениво: запись остаётся на месте, пока её не встретит
+    pop, и тогда отбрасывается. Флаги present не дают добавить пользователя в список повторно,
+    так что размер списка не растёт при многократной аренде и возврате.
+    """
+
+    def __init__(self, indexes: Iterable[int] = ()):
+        """
+        :param indexes: Начальные индексы. Последний выдаётся первым.
+        """
+        self.items: list[int] = []
+        self.present = bytearray()
+        for index in indexes:
+            self.add(index)
+
+    def add(self, index: int) -> None:
+        """
+        Добавляет индекс в конец списка, если его там ещё нет.
+        """
+        if index >= len(self.present):
+            self.present.extend(bytes(index + 1 - len(self.present)))
+
+        if not self.present[index]:
+            self.present[index] = 1
+            self.items.append(index)
+
+    def pop(self, states: bytearray, is_random: bool = False) -> int | None:
+        """
+        Снимает со списка свободный индекс — последний или случайный. Занятые индексы по пути отбрасываются.
+        Каждый индекс отбрасывается не чаще одного раза на добавление, поэтому амортизированно O(1).
+
+        :param states: Флаги свободы пользователей (1 — свободен) по сквозному индексу.
+        :param is_random: Выбирать случайный индекс вместо последнего.
+        :return: Индекс свободного пользователя или None, если свободных в списке нет.
+        """
+        while self.items:
+            # Меняем выбранный элемент местами с последним и снимаем его с конца — O(1)
+            position = random.randrange(len(self.items)) if is_random else len(self.items) - 1
+            self.items[position], self.items[-1] = self.items[-1], self.items[position]
+
+            index = self.items.pop()
+            self.present[index] = 0
+            if states[index]:
+                return index
+
+        return None
+
+
+class SeedsQueryIndex:
+    """
+    Вторичный индекс SeedsAllocator по одному запросу SeedsQuery.
+
+    Attributes:
+        members (list[int]): Индексы всех пользователей, подходящих под запрос (для get_random_user).
+        free (SeedsFreeIndexes): Индексы подходящих пользователей, которые могут быть свободны.
+    """
+
+    def __init__(self):
+        self.members: list[int] = []
+        self.free = SeedsFreeIndexes()
+
+
+class SeedsAllocator:
+    """
+    Распределитель сидинговых пользователей между виртуальными пользователями Locust.
+
+    Все операции выполняются за O(1) (амортизированно) и защищены блокировкой, поэтому allocator
+    можно безопасно использовать из множества гринлетов (потоков) одновременно.
+
+    Поддерживаются три режима выдачи:
+    - get_next_user — пользователь выдаётся один раз и больше не возвращается в пул;
+    - get_random_user — случайный пользователь без удаления (общий доступ);
+    - lease_user / release_user — эксклюзивная аренда: пользователь закреплён
+      за одним виртуальным пользователем, пока тот не вернёт его (обычно в on_stop).
+
+    Каждый режим принимает необязательный SeedsQuery — тогда выдаётся только пользователь,
+    подходящий под запрос (например, «дебетовый счёт и не меньше 3 покупок»). Для каждого запроса
+    один раз строится вторичный индекс: заранее для queries из конструктора или при первом обращении.
+
+    Пользователей дампа можно заменить, не создавая новый allocator (см. replace_users):
+    например, когда мастер Locust заново делит сиды между воркерами во время теста.
+
+    Attributes:
+        users (Sequence[SeedUserResult]): Пользователи, загруженные из дампа.
+        extra_users (list[SeedUserResult]): Пользователи, добавленные во время теста (см. add_users).
+        indexes (dict[SeedsQuery, SeedsQueryIndex]): Вторичные индексы по запросам.
+    """
+
+    def __init__(self, users: Sequence[SeedUserResult], queries: Iterable[SeedsQuery] = ()):
+        """
+        :param users: Пользователи из дампа сидинга.
+        :param queries: Запросы, индексы по которым нужно построить сразу при загрузке.
+        """
+        self.users = users
+        self.extra_users: list[SeedUserResult] = []
+        self.lock = threading.Lock()
+
+        # Флаги свободы пользователей по сквозному индексу: 1 — свободен, 0 — выдан или арендован
+        self.states = bytearray(b"\x01" * len(users))
+        # Индексы свободных пользователей. Хранятся в обратном порядке,
+        # чтобы pop() с конца списка выдавал пользователей по порядку дампа
+        self.free = SeedsFreeIndexes(range(len(users) - 1, -1, -1))
+        self.free_total = len(users)
+        # Арендованные пользователи: user_id -> сквозной индекс
+        # (None — пользователь убран из пула заменой, см. replace_users, и при возврате отбрасывается)
+        self.leased: dict[str, int | None] = {}
+        self.exhausted_count = 0
+
+        self.indexes: dict[SeedsQuery, SeedsQueryIndex] = {}
+        for query in queries:
+            self.get_index(query)
+
+    @property
+    def total_count(self) -> int:
+        """
+        Общее количество пользователей в пуле (из дампа и добавленных).
+        """
+        return len(self.users) + len(self.extra_users)
+
+    @property
+    def free_count(self) -> int:
+        """
+        Количество свободных пользователей, доступных для get_next_user и lease_user.
+        """
+        return self.free_total
+
+    @property
+    def leased_count(self) -> int:
+        """
+        Количество пользователей, арендованных в данный момент.
+        """
+        return len(self.leased)
+
+    def get_user(self, index: int) -> SeedUserResult:
+        """
+        Возвращает пользователя по сквозному индексу: сначала пользователи дампа, затем добавленные.
+        """
+        if index < len(self.users):
+            return self.users[index]
+
+        return self.extra_users[index - len(self.users)]
+
+    def get_index(self, query: SeedsQuery) -> SeedsQueryIndex:
+        """
+        Возвращает индекс по запросу, при первом обращении строит его одним проходом по всем пользователям.
+        """
+        index = self.indexes.get(query)
+        if index is not None:
+            return index
+
+        with self.lock:
+            # Индекс мог построить другой поток, пока мы ждали блокировку
+            if query in self.indexes:
+                return self.indexes[query]
+
+            self.indexes[query] = self.build_index(query)
+            return self.indexes[query]
+
+    def build_index(self, query: SeedsQuery) -> SeedsQueryIndex:
+        """
+        Строит индекс по запросу одним проходом по всем пользователям. Вызывается под блокировкой.
+        """
+        index = SeedsQueryIndex()
+        for position in range(self.total_count - 1, -1, -1):
+            if query.is_matched(self.get_user(position)):
+                index.members.append(position)
+                if self.states[position]:
+                    index.free.add(position)
+
+        index.members.reverse()
+        return index
+
+    def replace_users(self, users: Sequence[SeedUserResult]) -> None:
+        """
+        Заменяет пользователей дампа (например, новым шардом от мастера Locust), сохраняя состояние пула.
+
+        - Арендованные пользователи остаются арендованными. Если пользователь есть среди новых, release_user
+          вернёт его в пул, иначе при возврате он отбрасывается: он теперь принадлежит другому воркеру.
+        - Пользователи, уже выданные get_next_user, не возвращаются в пул, даже если есть среди новых.
+        - Пользователи, добавленные во время теста (add_users), остаются в пуле.
+        - Индексы по запросам перестраиваются для новых пользователей.
+
+        :param users: Новые пользователи дампа.
+        """
+        with self.lock:
+            # Выданные навсегда пользователи: заняты, но не арендованы
+            leased_positions = set(self.leased.values())
+            exhausted = {
+                self.get_user(position).user_id
+                for position in range(self.total_count)
+                if (not self.states[position]) and (position not in leased_positions)
+            }
+            leased = dict.fromkeys(self.leased)
+
+            self.users = users
+            self.states = bytearray(self.total_count)
+            self.free = SeedsFreeIndexes()
+            self.free_total = 0
+            # Порядок выдачи как у нового allocator: пользователи дампа по порядку, добавленные — раньше них
+            for position in [*range(len(users) - 1, -1, -1), *range(len(users), self.total_count)]:
+                user_id = self.get_user(position).user_id
+                if user_id in leased:
+                    leased[user_id] = position
+                elif user_id not in exhausted:
+                    self.states[position] = 1
+                    self.free_total += 1
+                    self.free.add(position)
+
+            self.leased = leased
+            self.indexes = {query: self.build_index(query) for query in self.indexes}
+
+    def put_free(self, position: int, user: SeedUserResult) -> None:
+        """
+        Помечает пользователя свободным и добавляет его в общий список и подходящие индексы.
+        Вызывается под блокировкой.
+        """
+        self.states[position] = 1
+        self.free_total += 1
+        self.free.add(position)
+        for query, index in self.indexes.items():
+            if query.is_matched(user):
+                index.free.add(position)
+
+    def take_free(self, query: SeedsQuery | None, is_random: bool) -> int:
+        """
+        Снимает свободного пользователя (подходящего под query, если задан) и помечает его занятым.
+        В остальных списках запись остаётся и будет отброшена лениво. Вызывается под блокировкой.
+
+        :raises IndexError: Если подходящих свободных пользователей не осталось.
+        """
+        free = self.free if query is None else self.indexes[query].free
+        position = free.pop(self.states, is_random=is_random)
+        if position is None:
+            raise IndexError(
+                "Свободные сидинговые пользователи закончились" if query is None else
+                f"Свободные сидинговые пользователи по запросу {query!r} закончились"
+            )
+
+        self.states[position] = 0
+        self.free_total -= 1
+        return position
+
+    def add_users(self, users: list[SeedUserResult]) -> None:
+        """
+        Добавляет новых пользователей в пул свободных (например, при пополнении пула во время теста).
+        Добавленные пользователи выдаются get_next_user раньше оставшихся пользователей дампа.
+
+        :param users: Новые пользователи.
+        """
+        with self.lock:
+            for user in users:
+                position = self.total_count
+                self.extra_users.append(user)
+                self.states.append(0)
+
+                for query, index in self.indexes.items():
+                    if query.is_matched(user):
+                        index.members.append(position)
+
+                self.put_free(position, user)
+
+    def get_next_user(self, query: SeedsQuery | None = None) -> SeedUserResult:
+        """
+        Возвращает следующего свободного пользователя и исключает его из пула навсегда.
+
+        Используется в случае, когда на каждый виртуальный юзер нужен новый тестовый пользователь.
+
+        Args:
+            query (SeedsQuery | None): Условие выбора пользователя.
+
+        Returns:
+            SeedUserResult: Следующий пользователь.
+
+        Raises:
+            IndexError: Если свободных (подходящих) пользователей не осталось.
+        """
+        if query is not None:
+            self.get_index(query)
+
+        with self.lock:
+            position = self.take_free(query, is_random=False)
+            self.exhausted_count += 1
+            return self.get_user(position)
+
+    def get_random_user(self, query: SeedsQuery | None = None) -> SeedUserResult:
+        """
+        Возвращает случайного пользователя без удаления из пула.
+
+        Используется в ситуациях, когда одного пользователя могут использовать
+        несколько виртуальных пользователей одновременно (например, только чтение).
+
+        Args:
+            query (SeedsQuery | None): Условие выбора пользователя.
+
+        Returns:
+            SeedUserResult: Случайный пользователь.
+
+        Raises:
+            IndexError: Если подходящих пользователей нет.
+        """
+        if query is None:
+            if not self.total_count:
+                raise IndexError("Нет сидинговых пользователей")
+
+            return self.get_user(random.randrange(self.total_count))
+
+        members = self.get_index(query).members
+        if not members:
+            raise IndexError(f"Нет сидинговых пользователей по запросу {query!r}")
+
+        return self.get_user(random.choice(members))
+
+    def lease_user(self, query: SeedsQuery | None = None) -> SeedUserResult:
+        """
+        Выдаёт случайного свободного пользователя в эксклюзивное пользование.
+        Пока пользователь не возвращён через release_user, он не будет выдан никому другому.
+
+        Args:
+            query (SeedsQuery | None): Условие выбора пользователя.
+
+        Returns:
+            SeedUserResult: Арендованный пользователь.
+
+        Raises:
+            IndexError: Если свободных (подходящих) пользователей не осталось.
+        """
+        if query is not None:
+            self.get_index(query)
+
+        with self.lock:
+            position = self.take_free(query, is_random=True)
+
+            user = self.get_user(position)
+            self.leased[user.user_id] = position
+            return user
+
+    def release_user(self, user: SeedUserResult) -> None:
+        """
+        Возвращает арендованного пользователя в пул свободных.
+        Повторный возврат или возврат неарендованного пользователя игнорируется.
+
+        :param user: Пользователь, ранее полученный через lease_user.
+        """
+        with self.lock:
+            position = self.leased.pop(user.user_id, None)
+            if position is not None:
+                self.put_free(position, self.get_user(position))
@@ -0,0 +1,314 @@
+"""
+Локальная заглушка gateway для бенчмарка сидинга.
+
+Реализует только методы, которые вызывает SeedsBuilder, по gRPC и HTTP одновременно.
+Каждый ответ содержит новые UUID, а задержка latency имитирует время обработки на реальном стенде.
+Запускается отдельным процессом, чтобы не делить GIL и gevent-хаб с измеряемым билдером:
+
+    python -m seeds.benchmark.gateway --grpc-port 9103 --http-port 8103 --latency 5
+"""
+import argparse
+import json
+import time
+import uuid
+from concurrent import futures
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+
+import grpc
+
+from contracts.services.gateway.accounts.accounts_gateway_service_pb2_grpc import (
+    AccountsGatewayServiceServicer,
+    add_AccountsGatewayServiceServicer_to_server
+)
+from contracts.services.gateway.accounts.rpc_open_credit_card_account_pb2 import OpenCreditCardAccountResponse
+from contracts.services.gateway.accounts.rpc_open_debit_card_account_pb2 import OpenDebitCardAccountResponse
+from contracts.services.gateway.accounts.rpc_open_deposit_account_pb2 import OpenDepositAccountResponse
+from contracts.services.gateway.accounts.rpc_open_savings_account_pb2 import OpenSavingsAccountResponse
+from contracts.services.gateway.cards.cards_gateway_service_pb2_grpc import (
+    CardsGatewayServiceServicer,
+    add_CardsGatewayServiceServicer_to_server
+)
+from contracts.services.gateway.cards.rpc_issue_physical_card_pb2 import IssuePhysicalCardResponse
+from contracts.services.gateway.cards.rpc_issue_virtual_card_pb2 import IssueVirtualCardResponse
+from contracts.services.gateway.operations.operations_gateway_service_pb2_grpc import (
+    OperationsGatewayServiceServicer,
+    add_OperationsGatewayServiceServicer_to_server
+)
+from contracts.services.gateway.operations.rpc_make_cash_withdrawal_operation_pb2 import (
+    MakeCashWithdrawalOperationResponse
+)
+from contracts.services.gateway.operations.rpc_make_purchase_operation_pb2 import MakePurchaseOperationResponse
+from contracts.services.gateway.operations.rpc_make_top_up_operation_pb2 import MakeTopUpOperationResponse
+from contracts.services.gateway.operations.rpc_make_transfer_operation_pb2 import MakeTransferOperationResponse
+from contracts.services.gateway.users.rpc_create_user_pb2 import CreateUserResponse
+from contracts.services.gateway.users.users_gateway_service_pb2_grpc import (
+    UsersGatewayServiceServicer,
+    add_UsersGatewayServiceServicer_to_server
+)
+
+
+def get_id() -> str:
+    """
+    Генерирует идентификатор сущности в формате UUID, как у реального gateway.
+    """
+    return str(uuid.uuid4())
+
+
+class StubGateway:
+    """
+    Общие настройки заглушки для обоих транспортов.
+    """
+
+    def __init__(self, latency: float = 0.0):
+        """
+        :param latency: Задержка обработки одного вызова (секунды).
+        """
+        self.latency = latency
+
+    def wait(self) -> None:
+        """
+        Имитирует время обработки вызова. Вызывается из потоков сервера, поэтому блокирующий sleep допустим.
+        """
+        if self.latency > 0:
+            time.sleep(self.latency)
+
+
+class UsersStubServicer(UsersGatewayServiceServicer):
+    def __init__(self, gateway: StubGateway):
+        self.gateway = gateway
+
+    def CreateUser(self, request, context):
+        self.gateway.wait()
+        response = CreateUserResponse()
+        response.user.id = get_id()
+        return response
+
+
+class AccountsStubServicer(AccountsGatewayServiceServicer):
+    def __init__(self, gateway: StubGateway):
+        self.gateway = gateway
+
+    def build_account(self, response, with_card: bool = False):
+        self.gateway.wait()
+        response.account.id = get_id()
+        if with_card:
+            response.account.cards.add(id=get_id(), account_id=response.account.id)
+        return response
+
+    def OpenDepositAccount(self, request, context):
+        return self.build_account(OpenDepositAccountResponse())
+
+    def OpenSavingsAccount(self, request, context):
+        return self.build_account(OpenSavingsAccountResponse())
+
+    def OpenDebitCardAccount(self, request, context):
+        return self.build_account(OpenDebitCardAccountResponse(), with_card=True)
+
+    def OpenCreditCardAccount(self, request, context):
+        return self.build_account(OpenCreditCardAccountResponse(), with_card=True)
+
+
+class CardsStubServicer(CardsGatewayServiceServicer):
+    def __init__(self, gateway: StubGateway):
+        self.gateway = gateway
+
+    def build_card(self, request, response):
+        self.gateway.wait()
+        response.card.id = get_id()
+        response.card.account_id = request.account_id
+        return response
+
+    def IssueVirtualCard(self, request, context):
+        return self.build_card(request, IssueVirtualCardResponse())
+
+    def IssuePhysicalCard(self, request, context):
+        return self.build_card(request, IssuePhysicalCardResponse())
+
+
+class OperationsStubServicer(OperationsGatewayServiceServicer):
+    def __init__(self, gateway: StubGateway):
+        self.gateway = gateway
+
+    def build_operation(self, request, response):
+        self.gateway.wait()
+        response.operation.id = get_id()
+        response.operation.card_id = request.card_id
+        response.operation.account_id = request.account_id
+        return response
+
+    def MakeTopUpOperation(self, request, context):
+        return self.build_operation(request, MakeTopUpOperationResponse())
+
+    def MakePurchaseOperation(self, request, context):
+        return self.build_operation(request, MakePurchaseOperationResponse())
+
+    def MakeTransferOperation(self, request, context):
+        return self.build_operation(request, MakeTransferOperationResponse())
+
+    def MakeCashWithdrawalOperation(self, request, context):
+        return self.build_operation(request, MakeCashWithdrawalOperationResponse())
+
+
+def build_user_payload() -> dict:
+    return {
+        "id": get_id(),
+        "email": "seeds@example.com",
+        "lastName": "Benchmark",
+        "firstName": "Seeds",
+        "middleName": "Stub",
+        "phoneNumber": "+70000000000"
+    }
+
+
+def build_card_payload(account_id: str, card_type: str) -> dict:
+    return {
+        "id": get_id(),
+        "pin": "0000",
+        "cvv": "000",
+        "type": card_type,
+        "status": "ACTIVE",
+        "accountId": account_id,
+        "cardNumber": "0000000000000000",
+        "cardHolder": "SEEDS BENCHMARK",
+        "expiryDate": "2030-01-01",
+        "paymentSystem": "VISA"
+    }
+
+
+def build_account_payload(account_type: str, with_card: bool = False) -> dict:
+    account_id = get_id()
+    cards = [build_card_payload(account_id, "PHYSICAL")] if with_card else []
+    return {"id": account_id, "type": account_type, "cards": cards, "status": "ACTIVE", "balance": 0.0}
+
+
+def build_operation_payload(request: dict, operation_type: str) -> dict:
+    return {
+        "id": get_id(),
+        "type": operation_type,
+        "status": "COMPLETED",
+        "amount": request.get("amount", 0.0),
+        "cardId": request["cardId"],
+        "category": request.get("category", "benchmark"),
+        "createdAt": "2030-01-01T00:00:00",
+        "accountId": request["accountId"]
+    }
+
+
+# Маршруты HTTP-заглушки: путь -> функция, строящая тело ответа по телу запроса
+HTTP_ROUTES = {
+    "/api/v1/users": lambda request: {"user": build_user_payload()},
+    "/api/v1/accounts/open-deposit-account": lambda request: {"account": build_account_payload("DEPOSIT")},
+    "/api/v1/accounts/open-savings-account": lambda request: {"account": build_account_payload("SAVINGS")},
+    "/api/v1/accounts/open-debit-card-account": lambda request: {
+        "account": build_account_payload("DEBIT_CARD", with_card=True)
+    },
+    "/api/v1/accounts/open-credit-card-account": lambda request: {
+        "account": build_account_payload("CREDIT_CARD", with_card=True)
+    },
+    "/api/v1/cards/issue-virtual-card": lambda request: {
+        "card": build_card_payload(request["accountId"], "VIRTUAL")
+    },
+    "/api/v1/cards/issue-physical-card": lambda request: {
+        "card": build_card_payload(request["accountId"], "PHYSICAL")
+    },
+    "/api/v1/operations/make-top-up-operation": lambda request: {
+        "operation": build_operation_payload(request, "TOP_UP")
+    },
+    "/api/v1/operations/make-purchase-operation": lambda request: {
+        "operation": build_operation_payload(request, "PURCHASE")
+    },
+    "/api/v1/operations/make-transfer-operation": lambda request: {
+        "operation": build_operation_payload(request, "TRANSFER")
+    },
+    "/api/v1/operations/make-cash-withdrawal-operation": lambda request: {
+        "operation": build_operation_payload(request, "CASH_WITHDRAWAL")
+    },
+}
+
+
+def build_http_handler(gateway: StubGateway) -> type[BaseHTTPRequestHandler]:
+    """
+    Создаёт обработчик HTTP-заглушки с keep-alive (HTTP/1.1), как у реального gateway.
+    """
+
+    class StubHTTPHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Заголовки и тело пишутся отдельно — без TCP_NODELAY каждый ответ ждёт delayed ACK клиента
+        disable_nagle_algorithm = True
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length", 0))
+            request = json.loads(self.rfile.read(length) or b"{}")
+
+            route = HTTP_ROUTES.get(self.path)
+            if route is None:
+                self.send_json(404, {"detail": "Not Found"})
+                return
+
+            gateway.wait()
+            self.send_json(200, route(request))
+
+        def send_json(self, status: int, payload: dict):
+            body = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            # Логирование каждого запроса заметно замедляет заглушку и не нужно в бенчмарке
+            pass
+
+    return StubHTTPHandler
+
+
+class StubHTTPServer(ThreadingHTTPServer):
+    """
+    HTTP-сервер заглушки: поток на соединение и увеличенная очередь подключений,
+    чтобы одновременные подключения пула клиента не отбрасывались при большом workers.
+    """
+    daemon_threads = True
+    request_queue_size = 1024
+
+
+def serve(grpc_port: int, http_port: int, latency: float = 0.0, max_workers: int = 100) -> None:
+    """
+    Запускает gRPC- и HTTP-заглушку gateway и блокируется до остановки процесса.
+
+    :param grpc_port: Порт gRPC-заглушки.
+    :param http_port: Порт HTTP-заглушки.
+    :param latency: Задержка обработки одного вызова (секунды).
+    :param max_workers: Количество потоков gRPC-сервера (ограничивает число одновременно обрабатываемых вызовов).
+    """
+    gateway = StubGateway(latency=latency)
+
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=max_workers))
+    add_UsersGatewayServiceServicer_to_server(UsersStubServicer(gateway), server)
+    add_AccountsGatewayServiceServicer_to_server(AccountsStubServicer(gateway), server)
+    add_CardsGatewayServiceServicer_to_server(CardsStubServicer(gateway), server)
+    add_OperationsGatewayServiceServicer_to_server(OperationsStubServicer(gateway), server)
+    server.add_insecure_port(f"127.0.0.1:{grpc_port}")
+    server.start()
+
+    http_server = StubHTTPServer(("127.0.0.1", http_port), build_http_handler(gateway))
+    Thread(target=http_server.serve_forever, daemon=True).start()
+
+    server.wait_for_termination()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Локальная заглушка gateway для бенчмарка сидинга")
+    parser.add_argument("--grpc-port", type=int, default=9103)
+    parser.add_argument("--http-port", type=int, default=8103)
+    parser.add_argument("--latency", type=float, default=0.0, help="Задержка ответа, мс")
+    parser.add_argument("--max-workers", type=int, default=100)
+    args = parser.parse_args()
+
+    serve(
+        grpc_port=args.grpc_port,
+        http_port=args.http_port,
+        latency=args.latency / 1000,
+        max_workers=args.max_workers
+    )
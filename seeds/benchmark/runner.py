@@ -0,0 +1,381 @@
+import argparse
+import math
+import os
+import socket
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Any
+
+from grpc import insecure_channel
+from httpx import Client
+
+from clients.grpc.gateway.accounts.client import AccountsGatewayGRPCClient
+from clients.grpc.gateway.cards.client import CardsGatewayGRPCClient
+from clients.grpc.gateway.operations.client import OperationsGatewayGRPCClient
+from clients.grpc.gateway.users.client import UsersGatewayGRPCClient
+from clients.http.gateway.accounts.client import AccountsGatewayHTTPClient
+from clients.http.gateway.cards.client import CardsGatewayHTTPClient
+from clients.http.gateway.operations.client import OperationsGatewayHTTPClient
+from clients.http.gateway.users.client import UsersGatewayHTTPClient
+from config import settings
+from seeds.benchmark.schema import (
+    SeedsBenchmarkCase,
+    SeedsBenchmarkReport,
+    SeedsBenchmarkRPCStats,
+    SeedsBenchmarkTransport
+)
+from seeds.builder import SeedsBuilder
+from seeds.schema.plan import SeedsPlan, SeedUsersPlan, SeedAccountsPlan, SeedCardsPlan, SeedOperationsPlan
+from seeds.schema.result import SeedsResult
+
+# Стандартные формы плана: от одних пользователей до счетов с картами и операциями.
+# Количество пользователей задаётся размером прогона
+SEEDS_BENCHMARK_PLANS: dict[str, SeedUsersPlan] = {
+    "users": SeedUsersPlan(),
+    "accounts": SeedUsersPlan(
+        savings_accounts=SeedAccountsPlan(count=1),
+        debit_card_accounts=SeedAccountsPlan(count=1)
+    ),
+    "cards": SeedUsersPlan(
+        debit_card_accounts=SeedAccountsPlan(
+            count=1,
+            physical_cards=SeedCardsPlan(count=1),
+            virtual_cards=SeedCardsPlan(count=1)
+        )
+    ),
+    "operations": SeedUsersPlan(
+        credit_card_accounts=SeedAccountsPlan(
+            count=1,
+            purchase_operations=SeedOperationsPlan(count=5),
+            top_up_operations=SeedOperationsPlan(count=1),
+            cash_withdrawal_operations=SeedOperationsPlan(count=1)
+        )
+    ),
+}
+
+DEFAULT_OUTPUT_PATH = "./reports/seeds_benchmark.json"
+
+
+class SeedsBenchmarkRecorder:
+    """
+    Накопитель времени ответа вызовов gateway, сгруппированных по методу клиента.
+    """
+
+    def __init__(self):
+        self.durations: dict[str, list[float]] = defaultdict(list)
+        self.failures: dict[str, int] = defaultdict(int)
+
+    @property
+    def count(self) -> int:
+        """
+        Общее количество записанных вызовов.
+        """
+        return sum(len(durations) for durations in self.durations.values())
+
+    def record(self, name: str, duration: float, failed: bool = False) -> None:
+        """
+        :param name: Метод клиента.
+        :param duration: Время ответа (секунды).
+        :param failed: Вызов завершился ошибкой.
+        """
+        self.durations[name].append(duration)
+        if failed:
+            self.failures[name] += 1
+
+    def get_stats(self) -> list[SeedsBenchmarkRPCStats]:
+        """
+        Возвращает статистику по методам в миллисекундах.
+        """
+        return [
+            SeedsBenchmarkRPCStats(
+                name=name,
+                count=len(durations),
+                failures=self.failures[name],
+                p50=get_percentile(durations, 50) * 1000,
+                p99=get_percentile(durations, 99) * 1000,
+                average=sum(durations) / len(durations) * 1000
+            )
+            for name, durations in sorted(self.durations.items())
+        ]
+
+
+class SeedsBenchmarkClient:
+    """
+    Прокси над клиентом gateway, измеряющий время каждого вызова публичного метода.
+    Передаётся в SeedsBuilder вместо клиента, поэтому билдер измеряется без изменений.
+    """
+
+    def __init__(self, client: Any, recorder: SeedsBenchmarkRecorder):
+        """
+        :param client: gRPC- или HTTP-клиент gateway.
+        :param recorder: Накопитель времени ответа.
+        """
+        self.client = client
+        self.recorder = recorder
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self.client, name)
+        if name.startswith("_") or not callable(attribute):
+            return attribute
+
+        def call(*args, **kwargs):
+            started_at, failed = time.perf_counter(), False
+            try:
+                return attribute(*args, **kwargs)
+            except Exception:
+                failed = True
+                raise
+            finally:
+                self.recorder.record(name, time.perf_counter() - started_at, failed=failed)
+
+        return call
+
+
+def get_percentile(values: list[float], percent: float) -> float:
+    """
+    Перцентиль по методу ближайшего ранга.
+    """
+    ordered = sorted(values)
+    return ordered[max(math.ceil(percent / 100 * len(ordered)) - 1, 0)]
+
+
+def count_seeds_entities(result: SeedsResult) -> int:
+    """
+    Считает все созданные сущности: пользователей, счета, карты и операции.
+    """
+    count = 0
+    for user in result.users:
+        count += 1
+        for accounts in (
+                user.deposit_accounts,
+                user.savings_accounts,
+                user.debit_card_accounts,
+                user.credit_card_accounts
+        ):
+            for account in accounts:
+                count += 1 + sum(
+                    len(items) for items in (
+                        account.physical_cards,
+                        account.virtual_cards,
+                        account.top_up_operations,
+                        account.purchase_operations,
+                        account.transfer_operations,
+                        account.cash_withdrawal_operations
+                    )
+                )
+
+    return count
+
+
+def build_benchmark_seeds_builder(
+        transport: SeedsBenchmarkTransport,
+        url: str,
+        workers: int,
+        recorder: SeedsBenchmarkRecorder
+) -> SeedsBuilder:
+    """
+    Создаёт SeedsBuilder с клиентами на заданный адрес, обёрнутыми в SeedsBenchmarkClient.
+
+    :param transport: Транспорт клиентов.
+    :param url: Адрес gateway (host:port для gRPC, base URL для HTTP).
+    :param workers: Параллельность билдера.
+    :param recorder: Накопитель времени ответа.
+    :return: SeedsBuilder для одного прогона.
+    """
+    if transport == "grpc":
+        channel = insecure_channel(url)
+        clients = (
+            UsersGatewayGRPCClient(channel),
+            CardsGatewayGRPCClient(channel),
+            AccountsGatewayGRPCClient(channel),
+            OperationsGatewayGRPCClient(channel)
+        )
+    else:
+        client = Client(timeout=settings.gateway_http_client.timeout, base_url=url)
+        clients = (
+            UsersGatewayHTTPClient(client=client),
+            CardsGatewayHTTPClient(client=client),
+            AccountsGatewayHTTPClient(client=client),
+            OperationsGatewayHTTPClient(client=client)
+        )
+
+    users_client, cards_client, accounts_client, operations_client = (
+        SeedsBenchmarkClient(client, recorder) for client in clients
+    )
+    return SeedsBuilder(
+        users_gateway_client=users_client,
+        cards_gateway_client=cards_client,
+        accounts_gateway_client=accounts_client,
+        operations_gateway_client=operations_client,
+        workers=workers
+    )
+
+
+def run_seeds_benchmark_case(
+        transport: SeedsBenchmarkTransport,
+        url: str,
+        shape: str,
+        users: int,
+        workers: int
+) -> SeedsBenchmarkCase:
+    """
+    Выполняет один прогон сидинга и собирает его метрики.
+    Ошибка сидинга не прерывает бенчмарк, а сохраняется в результате прогона.
+    """
+    recorder = SeedsBenchmarkRecorder()
+    builder = build_benchmark_seeds_builder(transport=transport, url=url, workers=workers, recorder=recorder)
+    plan = SeedsPlan(users=SEEDS_BENCHMARK_PLANS[shape].model_copy(update={"count": users}))
+
+    result, error = SeedsResult(), None
+    started_at = time.perf_counter()
+    try:
+        result = builder.build(plan)
+    except Exception as exception:
+        error = repr(exception)
+    elapsed = time.perf_counter() - started_at
+
+    entities = count_seeds_entities(result)
+    return SeedsBenchmarkCase(
+        transport=transport,
+        shape=shape,
+        users=users,
+        workers=workers,
+        elapsed=elapsed,
+        entities=entities,
+        entities_per_second=entities / elapsed,
+        rpcs=recorder.count,
+        rpcs_per_second=recorder.count / elapsed,
+        methods=recorder.get_stats(),
+        error=error
+    )
+
+
+def get_free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_stub_gateway(latency: float, timeout: float = 10.0) -> tuple[subprocess.Popen, str, str]:
+    """
+    Запускает локальную заглушку gateway (seeds.benchmark.gateway) отдельным процессом на свободных портах.
+
+    :param latency: Задержка ответа заглушки (мс).
+    :param timeout: Сколько ждать готовности портов (секунды).
+    :return: Процесс заглушки, адрес gRPC и адрес HTTP.
+    :raises RuntimeError: Если заглушка не открыла порты за timeout.
+    """
+    grpc_port, http_port = get_free_port(), get_free_port()
+    process = subprocess.Popen([
+        sys.executable, "-m", "seeds.benchmark.gateway",
+        "--grpc-port", str(grpc_port),
+        "--http-port", str(http_port),
+        "--latency", str(latency)
+    ])
+
+    deadline = time.monotonic() + timeout
+    for port in (grpc_port, http_port):
+        while True:
+            try:
+                socket.create_connection(("127.0.0.1", port), timeout=1).close()
+                break
+            except OSError:
+                if time.monotonic() > deadline or process.poll() is not None:
+                    process.kill()
+                    raise RuntimeError("Заглушка gateway не запустилась")
+                time.sleep(0.1)
+
+    return process, f"127.0.0.1:{grpc_port}", f"http://127.0.0.1:{http_port}"
+
+
+def run_seeds_benchmark(
+        transports: list[SeedsBenchmarkTransport],
+        shapes: list[str],
+        sizes: list[int],
+        workers: list[int],
+        stub: bool = False,
+        latency: float = 0.0,
+        output: str = DEFAULT_OUTPUT_PATH
+) -> SeedsBenchmarkReport:
+    """
+    Прогоняет все сочетания транспорта, формы плана, размера и параллельности
+    и сохраняет отчёт в JSON.
+
+    :param transports: Транспорты ("grpc", "http").
+    :param shapes: Формы плана из SEEDS_BENCHMARK_PLANS.
+    :param sizes: Количества пользователей.
+    :param workers: Значения параллельности билдера.
+    :param stub: Запустить локальную заглушку gateway вместо стенда из настроек.
+    :param latency: Задержка ответа заглушки (мс).
+    :param output: Путь к JSON-отчёту.
+    :return: Отчёт бенчмарка.
+    """
+    process = None
+    grpc_url, http_url = settings.gateway_grpc_client.client_url, settings.gateway_http_client.client_url
+    if stub:
+        process, grpc_url, http_url = start_stub_gateway(latency=latency)
+
+    report = SeedsBenchmarkReport(
+        created_at=datetime.now(timezone.utc),
+        grpc_url=grpc_url,
+        http_url=http_url,
+        stub=stub
+    )
+    try:
+        for transport in transports:
+            for shape in shapes:
+                for users in sizes:
+                    for count in workers:
+                        case = run_seeds_benchmark_case(
+                            transport=transport,
+                            url=grpc_url if transport == "grpc" else http_url,
+                            shape=shape,
+                            users=users,
+                            workers=count
+                        )
+                        report.cases.append(case)
+                        print(
+                            f"{transport:<4} {shape:<10} users={users:<6} workers={count:<4} "
+                            f"{case.entities_per_second:>9.1f} entities/s {case.rpcs_per_second:>9.1f} rpc/s"
+                            + (f" error={case.error}" if case.error else "")
+                        )
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w", encoding="utf-8") as file:
+        file.write(report.model_dump_json(indent=2))
+
+    return report
+
+
+if __name__ == '__main__':
+    """
+    Запуск бенчмарка сидинга, например на локальной заглушке gateway:
+
+        python -m seeds.benchmark.runner --stub --latency 5 --sizes 10 100 --workers 1 10 50
+    """
+    parser = argparse.ArgumentParser(description="Бенчмарк пропускной способности SeedsBuilder")
+    parser.add_argument("--transports", nargs="+", choices=["grpc", "http"], default=["grpc", "http"])
+    parser.add_argument("--shapes", nargs="+", choices=list(SEEDS_BENCHMARK_PLANS), default=list(SEEDS_BENCHMARK_PLANS))
+    parser.add_argument("--sizes", nargs="+", type=int, default=[10, 100])
+    parser.add_argument("--workers", nargs="+", type=int, default=[1, 10])
+    parser.add_argument("--stub", action="store_true", help="Запустить локальную заглушку gateway")
+    parser.add_argument("--latency", type=float, default=0.0, help="Задержка ответа заглушки, мс")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT_PATH)
+    args = parser.parse_args()
+
+    run_seeds_benchmark(
+        transports=args.transports,
+        shapes=args.shapes,
+        sizes=args.sizes,
+        workers=args.workers,
+        stub=args.stub,
+        latency=args.latency,
+        output=args.output
+    )
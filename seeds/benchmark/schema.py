@@ -0,0 +1,74 @@
+from datetime import datetime
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+SeedsBenchmarkTransport = Literal["grpc", "http"]
+
+
+class SeedsBenchmarkRPCStats(BaseModel):
+    """
+    Статистика вызовов одного метода gateway за прогон бенчмарка.
+
+    Attributes:
+        name (str): Метод клиента (например, open_debit_card_account).
+        count (int): Количество вызовов.
+        failures (int): Количество вызовов, завершившихся ошибкой.
+        p50 (float): Медиана времени ответа (мс).
+        p99 (float): 99-й перцентиль времени ответа (мс).
+        average (float): Среднее время ответа (мс).
+    """
+    name: str
+    count: int
+    failures: int = 0
+    p50: float
+    p99: float
+    average: float
+
+
+class SeedsBenchmarkCase(BaseModel):
+    """
+    Результат одного прогона: транспорт × форма плана × размер × параллельность.
+
+    Attributes:
+        transport (SeedsBenchmarkTransport): Транспорт клиентов билдера.
+        shape (str): Название формы плана.
+        users (int): Количество пользователей в плане.
+        workers (int): Параллельность билдера (SeedsBuilder.workers).
+        elapsed (float): Время сидинга (секунды).
+        entities (int): Количество созданных сущностей (пользователи, счета, карты, операции).
+        entities_per_second (float): Пропускная способность по сущностям.
+        rpcs (int): Количество вызовов gateway.
+        rpcs_per_second (float): Пропускная способность по вызовам.
+        methods (list[SeedsBenchmarkRPCStats]): Статистика по методам gateway.
+        error (str | None): Ошибка, прервавшая прогон.
+    """
+    transport: SeedsBenchmarkTransport
+    shape: str
+    users: int
+    workers: int
+    elapsed: float
+    entities: int
+    entities_per_second: float
+    rpcs: int
+    rpcs_per_second: float
+    methods: list[SeedsBenchmarkRPCStats] = Field(default_factory=list)
+    error: str | None = None
+
+
+class SeedsBenchmarkReport(BaseModel):
+    """
+    Отчёт бенчмарка сидинга.
+
+    Attributes:
+        created_at (datetime): Время запуска бенчмарка.
+        grpc_url (str): Адрес gRPC gateway.
+        http_url (str): Адрес HTTP gateway.
+        stub (bool): Прогон выполнялся на локальной заглушке gateway.
+        cases (list[SeedsBenchmarkCase]): Результаты прогонов.
+    """
+    created_at: datetime
+    grpc_url: str
+    http_url: str
+    stub: bool
+    cases: list[SeedsBenchmarkCase] = Field(default_factory=list)
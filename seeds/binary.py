@@ -0,0 +1,233 @@
+import copy
+import mmap
+import struct
+import uuid
+from collections.abc import Sequence
+from typing import Iterable
+
+from seeds.schema.result import SeedsResult, SeedUserResult, SeedAccountResult, SeedCardResult, SeedOperationResult
+
+# Сигнатура и версия формата — первые байты файла
+MAGIC = b"SEEDSBN1"
+
+# Типы счетов пользователя и вложенные сущности счёта в фиксированном порядке колонок
+ACCOUNT_FIELDS = ("deposit_accounts", "savings_accounts", "debit_card_accounts", "credit_card_accounts")
+CARD_FIELDS = ("physical_cards", "virtual_cards")
+OPERATION_FIELDS = (
+    "top_up_operations",
+    "purchase_operations",
+    "transfer_operations",
+    "cash_withdrawal_operations"
+)
+NESTED_FIELDS = CARD_FIELDS + OPERATION_FIELDS
+
+UUID_SIZE = 16
+OFFSET_FORMAT = "<I"
+OFFSET_SIZE = struct.calcsize(OFFSET_FORMAT)
+RANGE_FORMAT = "<II"
+HEADER_FORMAT = "<8sI"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+SECTION_FORMAT = "<Q"
+SECTION_SIZE = struct.calcsize(SECTION_FORMAT)
+
+
+def get_section_names() -> list[str]:
+    """
+    Возвращает имена секций файла в порядке их расположения.
+
+    Секции:
+    - users — идентификаторы пользователей;
+    - {account}.offsets / {account}.ids — таблица смещений (N + 1 значений) и идентификаторы счетов;
+    - {account}.{nested}.offsets / {account}.{nested}.ids — то же для карт и операций каждого счёта.
+    """
+    names = ["users"]
+    for account_field in ACCOUNT_FIELDS:
+        names += [f"{account_field}.offsets", f"{account_field}.ids"]
+        for nested_field in NESTED_FIELDS:
+            names += [f"{account_field}.{nested_field}.offsets", f"{account_field}.{nested_field}.ids"]
+
+    return names
+
+
+def save_seeds_binary(users: Iterable[SeedUserResult], path: str) -> int:
+    """
+    Сохраняет пользователей в компактный колоночный бинарный формат.
+
+    Идентификаторы хранятся как 16-байтные UUID, вложенные списки — через таблицы смещений:
+    для i-го элемента родительской колонки его дочерние элементы лежат в диапазоне
+    [offsets[i], offsets[i + 1]) дочерней колонки идентификаторов.
+
+    :param users: Пользователи (итератор читается один раз, целиком в память не загружается).
+    :param path: Путь к файлу.
+    :return: Количество сохранённых пользователей.
+    :raises ValueError: Если какой-либо идентификатор не является UUID.
+    """
+    names = get_section_names()
+    sections = {name: bytearray() for name in names}
+
+    for name in names:
+        if name.endswith(".offsets"):
+            sections[name] += struct.pack(OFFSET_FORMAT, 0)
+
+    count = 0
+    for user in users:
+        count += 1
+        sections["users"] += uuid.UUID(user.user_id).bytes
+
+        for account_field in ACCOUNT_FIELDS:
+            accounts: list[SeedAccountResult] = getattr(user, account_field)
+            for account in accounts:
+                sections[f"{account_field}.ids"] += uuid.UUID(account.account_id).bytes
+
+                for nested_field in NESTED_FIELDS:
+                    ids = sections[f"{account_field}.{nested_field}.ids"]
+                    for item in getattr(account, nested_field):
+                        item_id = item.card_id if nested_field in CARD_FIELDS else item.operation_id
+                        ids += uuid.UUID(item_id).bytes
+
+                    sections[f"{account_field}.{nested_field}.offsets"] += struct.pack(
+                        OFFSET_FORMAT, len(ids) // UUID_SIZE
+                    )
+
+            sections[f"{account_field}.offsets"] += struct.pack(
+                OFFSET_FORMAT, len(sections[f"{account_field}.ids"]) // UUID_SIZE
+            )
+
+    with open(path, "wb") as file:
+        file.write(struct.pack(HEADER_FORMAT, MAGIC, count))
+
+        position = HEADER_SIZE + SECTION_SIZE * len(names)
+        for name in names:
+            file.write(struct.pack(SECTION_FORMAT, position))
+            position += len(sections[name])
+
+        for name in names:
+            file.write(sections[name])
+
+    return count
+
+
+class SeedsBinaryResult(Sequence):
+    """
+    Результат сидинга, читаемый из бинарного дампа через mmap.
+
+    Файл не разбирается при загрузке: открытие занимает O(1) по времени и памяти,
+    а страницы файла разделяются через page cache между всеми процессами (воркерами Locust)
+    на одной машине. SeedUserResult собирается по запросу при обращении по индексу.
+
+    Поддерживает интерфейс последовательности (len, индекс, итерация), поэтому
+    может использоваться везде, где ожидается список пользователей, например в SeedsAllocator.
+    """
+
+    def __init__(self, path: str):
+        """
+        :param path: Путь к бинарному дампу.
+        :raises ValueError: Если файл не является бинарным дампом сидинга.
+        """
+        with open(path, "rb") as file:
+            self.buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, self.count = struct.unpack_from(HEADER_FORMAT, self.buffer, 0)
+        if magic != MAGIC:
+            raise ValueError(f"Файл {path} не является бинарным дампом сидинга")
+
+        self.sections = {
+            name: struct.unpack_from(SECTION_FORMAT, self.buffer, HEADER_SIZE + SECTION_SIZE * index)[0]
+            for index, name in enumerate(get_section_names())
+        }
+        # Номера пользователей дампа, видимые через этот объект (см. select)
+        self.positions = range(self.count)
+
+    @property
+    def users(self) -> "SeedsBinaryResult":
+        """
+        Совместимость с SeedsResult.users: сам результат является последовательностью пользователей.
+        """
+        return self
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.read_user(position) for position in self.positions[index]]
+
+        return self.read_user(self.positions[index])
+
+    def select(
+            self,
+            offset: int = 0,
+            limit: int | None = None,
+            shard_index: int = 0,
+            shard_count: int = 1
+    ) -> "SeedsBinaryResult":
+        """
+        Возвращает ленивое представление части дампа без чтения пользователей.
+        Семантика выборки такая же, как у iter_seed_user_results: окно, затем шард внутри окна.
+
+        :param offset: Сколько пользователей пропустить с начала.
+        :param limit: Максимальный размер окна (None — до конца).
+        :param shard_index: Номер шарда внутри окна.
+        :param shard_count: Количество шардов.
+        :return: SeedsBinaryResult, разделяющий с исходным объектом отображение файла.
+        """
+        stop = None if limit is None else offset + limit
+
+        view = copy.copy(self)
+        view.positions = self.positions[offset:stop][shard_index::shard_count]
+        return view
+
+    def read_user(self, index: int) -> SeedUserResult:
+        """
+        Собирает SeedUserResult пользователя с номером index в дампе.
+        """
+        # Данные в дампе уже проверены при записи, поэтому модели собираются без повторной валидации
+        accounts = {}
+        for account_field in ACCOUNT_FIELDS:
+            start, end = self.read_range(f"{account_field}.offsets", index)
+            accounts[account_field] = [self.read_account(account_field, position) for position in range(start, end)]
+
+        return SeedUserResult.model_construct(user_id=self.read_id("users", index), **accounts)
+
+    def read_id(self, section: str, index: int) -> str:
+        """
+        Читает UUID с номером index из колонки идентификаторов.
+        """
+        position = self.sections[section] + index * UUID_SIZE
+        return str(uuid.UUID(bytes=bytes(self.buffer[position:position + UUID_SIZE])))
+
+    def read_range(self, section: str, index: int) -> tuple[int, int]:
+        """
+        Возвращает диапазон дочерних элементов для элемента index из таблицы смещений.
+        """
+        position = self.sections[section] + index * OFFSET_SIZE
+        return struct.unpack_from(RANGE_FORMAT, self.buffer, position)
+
+    def read_account(self, account_field: str, index: int) -> SeedAccountResult:
+        """
+        Собирает SeedAccountResult счёта с номером index в колонке счетов account_field.
+        """
+        nested = {}
+        for nested_field in NESTED_FIELDS:
+            section = f"{account_field}.{nested_field}"
+            start, end = self.read_range(f"{section}.offsets", index)
+            ids = [self.read_id(f"{section}.ids", position) for position in range(start, end)]
+
+            if nested_field in CARD_FIELDS:
+                nested[nested_field] = [SeedCardResult.model_construct(card_id=item_id) for item_id in ids]
+            else:
+                nested[nested_field] = [SeedOperationResult.model_construct(operation_id=item_id) for item_id in ids]
+
+        return SeedAccountResult.model_construct(account_id=self.read_id(f"{account_field}.ids", index), **nested)
+
+    def get_shards(self, count: int) -> list[SeedsResult]:
+        """
+        Делит пользователей на count непересекающихся шардов, как SeedsResult.get_shards.
+        """
+        return [SeedsResult(users=self[index::count]) for index in range(count)]
+
+    def close(self) -> None:
+        """
+        Освобождает отображение файла в память.
+        """
+        self.buffer.close()
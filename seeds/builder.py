@@ -1,15 +1,28 @@
+from functools import partial
+from typing import Any, Callable, Iterable, Iterator
+
+from gevent import joinall, killall, spawn
+from gevent.lock import BoundedSemaphore
+from gevent.pool import Pool
+from grpc import intercept_channel
+from locust.env import Environment
+
 from clients.grpc.gateway.accounts.client import build_accounts_gateway_grpc_client, AccountsGatewayGRPCClient
 from clients.grpc.gateway.cards.client import build_cards_gateway_grpc_client, CardsGatewayGRPCClient
+from clients.grpc.gateway.client import build_gateway_grpc_channel
 from clients.grpc.gateway.operations.client import build_operations_gateway_grpc_client, OperationsGatewayGRPCClient
 from clients.grpc.gateway.users.client import build_users_gateway_grpc_client, UsersGatewayGRPCClient
+from clients.grpc.interceptors.locust_interceptor import LocustInterceptor
 from clients.http.gateway.accounts.client import build_accounts_gateway_http_client, AccountsGatewayHTTPClient
 from clients.http.gateway.cards.client import build_cards_gateway_http_client, CardsGatewayHTTPClient
 from clients.http.gateway.operations.client import build_operations_gateway_http_client, OperationsGatewayHTTPClient
 from clients.http.gateway.users.client import build_users_gateway_http_client, UsersGatewayHTTPClient
+from config import settings
 from seeds.schema.plan import (
     SeedsPlan,
     SeedUsersPlan,
     SeedAccountsPlan,
+    SEED_COUNT_FIELDS,
 )
 from seeds.schema.result import (
     SeedsResult,
@@ -19,6 +32,9 @@ from seeds.schema.result import (
     SeedOperationResult
 )
 
+# Тип запроса в статистике Locust для вызовов, которые сидер делает во время теста (см. build_locust_grpc_seeds_builder)
+SEEDS_REQUEST_TYPE = "gRPC seeds"
+
 
 class SeedsBuilder:
     """
@@ -30,6 +46,10 @@ class SeedsBuilder:
         cards_gateway_client: Клиент для выпуска карт
         accounts_gateway_client: Клиент для открытия счетов
         operations_gateway_client: Клиент для операций (топ-ап, покупки и т.д.)
+        workers: Количество пользователей, создаваемых параллельно. При значении больше 1
+            независимые вызовы (счета пользователя, карты и операции счёта) выполняются
+            в отдельных гринлетах, а пользователи — в gevent-пуле указанного размера.
+            Одновременно к gateway выполняется не больше workers вызовов (см. request).
     """
 
     def __init__(
@@ -37,12 +57,70 @@ class SeedsBuilder:
             users_gateway_client: UsersGatewayGRPCClient | UsersGatewayHTTPClient,
             cards_gateway_client: CardsGatewayGRPCClient | CardsGatewayHTTPClient,
             accounts_gateway_client: AccountsGatewayGRPCClient | AccountsGatewayHTTPClient,
-            operations_gateway_client: OperationsGatewayGRPCClient | OperationsGatewayHTTPClient
+            operations_gateway_client: OperationsGatewayGRPCClient | OperationsGatewayHTTPClient,
+            workers: int = 1
     ):
         self.users_gateway_client = users_gateway_client
         self.cards_gateway_client = cards_gateway_client
         self.accounts_gateway_client = accounts_gateway_client
         self.operations_gateway_client = operations_gateway_client
+        self.workers = workers
+        # Общий для всех гринлетов билдера лимит одновременных вызовов gateway
+        self.semaphore = BoundedSemaphore(max(workers, 1))
+
+    def request(self, method: Callable[..., Any], **kwargs) -> Any:
+        """
+        Выполняет вызов gateway, занимая место в общем лимите workers.
+
+        Гринлеты run_groups только ждут результатов, а лимит занимают лишь сами вызовы gateway,
+        поэтому вложенные группы (счёт -> карты и операции) не могут заблокировать друг друга,
+        а реальная параллельность не превышает workers.
+
+        Args:
+            method: Метод клиента gateway
+            **kwargs: Аргументы вызова
+
+        Returns:
+            Any: Ответ gateway
+        """
+        with self.semaphore:
+            return method(**kwargs)
+
+    def run_groups(self, groups: list[list[Callable[[], Any]]]) -> list[list[Any]]:
+        """
+        Выполняет группы независимых вызовов и возвращает их результаты, сгруппированные
+        так же, как входные данные, с сохранением порядка внутри каждой группы.
+
+        В последовательном режиме (workers == 1) вызовы выполняются по очереди.
+        В параллельном — каждый вызов запускается в отдельном гринлете (вызовы gateway внутри
+        ограничены общим лимитом, см. request), ошибка любого из них пробрасывается наружу,
+        а остальные гринлеты останавливаются.
+
+        Args:
+            groups: Список групп вызовов без аргументов
+
+        Returns:
+            list[list[Any]]: Результаты вызовов для каждой группы
+        """
+        calls = [call for group in groups for call in group]
+        if self.workers > 1 and len(calls) > 1:
+            greenlets = [spawn(call) for call in calls]
+            try:
+                joinall(greenlets, raise_error=True)
+            except BaseException:
+                # Пользователь с ошибкой отбрасывается — остальные вызовы не должны создавать для него сущности
+                killall(greenlets)
+                raise
+            results = [greenlet.value for greenlet in greenlets]
+        else:
+            results = [call() for call in calls]
+
+        grouped, offset = [], 0
+        for group in groups:
+            grouped.append(results[offset:offset + len(group)])
+            offset += len(group)
+
+        return grouped
 
     def build_physical_card_result(self, user_id: str, account_id: str) -> SeedCardResult:
         """
@@ -55,7 +133,8 @@ class SeedsBuilder:
         Returns:
             SeedCardResult: Результат с ID выпущенной карты
         """
-        response = self.cards_gateway_client.issue_physical_card(
+        response = self.request(
+            self.cards_gateway_client.issue_physical_card,
             user_id=user_id,
             account_id=account_id
         )
@@ -72,7 +151,8 @@ class SeedsBuilder:
         Returns:
             SeedCardResult: Результат с ID выпущенной карты
         """
-        response = self.cards_gateway_client.issue_virtual_card(
+        response = self.request(
+            self.cards_gateway_client.issue_virtual_card,
             user_id=user_id,
             account_id=account_id
         )
@@ -89,7 +169,8 @@ class SeedsBuilder:
         Returns:
             SeedOperationResult: Результат с ID выполненной операции
         """
-        response = self.operations_gateway_client.make_top_up_operation(
+        response = self.request(
+            self.operations_gateway_client.make_top_up_operation,
             card_id=card_id,
             account_id=account_id
         )
@@ -106,7 +187,8 @@ class SeedsBuilder:
         Returns:
             SeedOperationResult: Результат с ID выполненной операции
         """
-        response = self.operations_gateway_client.make_transfer_operation(
+        response = self.request(
+            self.operations_gateway_client.make_transfer_operation,
             card_id=card_id,
             account_id=account_id
         )
@@ -123,7 +205,8 @@ class SeedsBuilder:
         Returns:
             SeedOperationResult: Результат с ID выполненной операции
         """
-        response = self.operations_gateway_client.make_cash_withdrawal_operation(
+        response = self.request(
+            self.operations_gateway_client.make_cash_withdrawal_operation,
             card_id=card_id,
             account_id=account_id
         )
@@ -140,7 +223,8 @@ class SeedsBuilder:
         Returns:
             SeedOperationResult: Результат с ID выполненной операции
         """
-        response = self.operations_gateway_client.make_purchase_operation(
+        response = self.request(
+            self.operations_gateway_client.make_purchase_operation,
             card_id=card_id,
             account_id=account_id
         )
@@ -156,7 +240,7 @@ class SeedsBuilder:
         Returns:
             SeedAccountResult: Результат с ID созданного счёта
         """
-        response = self.accounts_gateway_client.open_savings_account(user_id=user_id)
+        response = self.request(self.accounts_gateway_client.open_savings_account, user_id=user_id)
         return SeedAccountResult(account_id=response.account.id)
 
     def build_deposit_account_result(self, user_id: str) -> SeedAccountResult:
@@ -169,9 +253,61 @@ class SeedsBuilder:
         Returns:
             SeedAccountResult: Результат с ID созданного счёта
         """
-        response = self.accounts_gateway_client.open_deposit_account(user_id=user_id)
+        response = self.request(self.accounts_gateway_client.open_deposit_account, user_id=user_id)
         return SeedAccountResult(account_id=response.account.id)
 
+    def build_card_account_result(
+            self,
+            plan: SeedAccountsPlan,
+            user_id: str,
+            card_id: str,
+            account_id: str
+    ) -> SeedAccountResult:
+        """
+        Наполняет уже открытый карточный счёт картами и операциями согласно плану.
+        Все выпуски карт и операции независимы друг от друга, поэтому
+        в параллельном режиме выполняются одновременно.
+
+        Args:
+            plan: План наполнения счёта
+            user_id: Идентификатор пользователя
+            card_id: Идентификатор карты, выпущенной вместе со счётом
+            account_id: Идентификатор счёта
+
+        Returns:
+            SeedAccountResult: Результат с ID счёта, картами и операциями
+        """
+        card_kwargs = {"user_id": user_id, "account_id": account_id}
+        operation_kwargs = {"card_id": card_id, "account_id": account_id}
+
+        (
+            physical_cards,
+            virtual_cards,
+            top_up_operations,
+            transfer_operations,
+            cash_withdrawal_operations,
+            purchase_operations
+        ) = self.run_groups([
+            [partial(self.build_physical_card_result, **card_kwargs)] * plan.physical_cards.count,
+            [partial(self.build_virtual_card_result, **card_kwargs)] * plan.virtual_cards.count,
+            [partial(self.build_top_up_operation_result, **operation_kwargs)] * plan.top_up_operations.count,
+            [partial(self.build_transfer_operation_result, **operation_kwargs)] * plan.transfer_operations.count,
+            [
+                partial(self.build_cash_withdrawal_operation_result, **operation_kwargs)
+            ] * plan.cash_withdrawal_operations.count,
+            [partial(self.build_purchase_operation_result, **operation_kwargs)] * plan.purchase_operations.count,
+        ])
+
+        return SeedAccountResult(
+            account_id=account_id,
+            physical_cards=physical_cards,
+            virtual_cards=virtual_cards,
+            top_up_operations=top_up_operations,
+            transfer_operations=transfer_operations,
+            cash_withdrawal_operations=cash_withdrawal_operations,
+            purchase_operations=purchase_operations
+        )
+
     def build_debit_card_account_result(self, plan: SeedAccountsPlan, user_id: str) -> SeedAccountResult:
         """
         Открывает дебетовый счёт для пользователя и при необходимости:
@@ -189,36 +325,12 @@ class SeedsBuilder:
         Returns:
             SeedAccountResult: Результат с ID счёта и дополнительными действиями (карты, операции)
         """
-        response = self.accounts_gateway_client.open_debit_card_account(user_id=user_id)
-        card_id = response.account.cards[0].id
-        account_id = response.account.id
-
-        return SeedAccountResult(
-            account_id=response.account.id,
-            physical_cards=[
-                self.build_physical_card_result(user_id=user_id, account_id=response.account.id)
-                for _ in range(plan.physical_cards.count)
-            ],
-            virtual_cards=[
-                self.build_virtual_card_result(user_id=user_id, account_id=response.account.id)
-                for _ in range(plan.virtual_cards.count)
-            ],
-            top_up_operations=[
-                self.build_top_up_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.top_up_operations.count)
-            ],
-            transfer_operations=[
-                self.build_transfer_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.transfer_operations.count)
-            ],
-            cash_withdrawal_operations=[
-                self.build_cash_withdrawal_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.cash_withdrawal_operations.count)
-            ],
-            purchase_operations=[
-                self.build_purchase_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.purchase_operations.count)
-            ]
+        response = self.request(self.accounts_gateway_client.open_debit_card_account, user_id=user_id)
+        return self.build_card_account_result(
+            plan=plan,
+            user_id=user_id,
+            card_id=response.account.cards[0].id,
+            account_id=response.account.id
         )
 
     def build_credit_card_account_result(self, plan: SeedAccountsPlan, user_id: str) -> SeedAccountResult:
@@ -238,72 +350,256 @@ class SeedsBuilder:
         Returns:
             SeedAccountResult: Результат с ID счёта и деталями операций
         """
-        response = self.accounts_gateway_client.open_credit_card_account(user_id=user_id)
-        card_id = response.account.cards[0].id
-        account_id = response.account.id
-
-        return SeedAccountResult(
-            account_id=response.account.id,
-            physical_cards=[
-                self.build_physical_card_result(user_id=user_id, account_id=account_id)
-                for _ in range(plan.physical_cards.count)
-            ],
-            virtual_cards=[
-                self.build_virtual_card_result(user_id=user_id, account_id=response.account.id)
-                for _ in range(plan.virtual_cards.count)
-            ],
-            top_up_operations=[
-                self.build_top_up_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.top_up_operations.count)
-            ],
-            transfer_operations=[
-                self.build_transfer_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.transfer_operations.count)
-            ],
-            cash_withdrawal_operations=[
-                self.build_cash_withdrawal_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.cash_withdrawal_operations.count)
-            ],
-            purchase_operations=[
-                self.build_purchase_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.purchase_operations.count)
-            ]
+        response = self.request(self.accounts_gateway_client.open_credit_card_account, user_id=user_id)
+        return self.build_card_account_result(
+            plan=plan,
+            user_id=user_id,
+            card_id=response.account.cards[0].id,
+            account_id=response.account.id
         )
 
-    def build_user(self, plan: SeedUsersPlan) -> SeedUserResult:
+    def build_user(self, plan: SeedUsersPlan, index: int = 0) -> SeedUserResult:
         """
         Создаёт пользователя и согласно переданному плану:
         - открывает сберегательные и депозитные счета
         - создаёт дебетовые и кредитные счета с картами и операциями
 
+        Количества карт и операций, заданные распределениями, выбираются для каждого счёта
+        заранее отдельным генератором по номеру пользователя, типу и позиции счёта
+        (см. SeedUsersPlan.resolve_accounts), поэтому форма данных пользователя
+        воспроизводима и не зависит от параллельного выполнения вызовов.
+        Сущности диапазонов плана создаются, только если номер попадает в диапазон (см. SeedUsersPlan.at).
+
         Args:
             plan: План генерации пользователя
+            index: Номер пользователя в плане
 
         Returns:
             SeedUserResult: Результат с ID пользователя и всеми созданными сущностями
         """
-        response = self.users_gateway_client.create_user()
-
-        return SeedUserResult(
-            user_id=response.user.id,
-            savings_accounts=[
-                self.build_savings_account_result(user_id=response.user.id)
-                for _ in range(plan.savings_accounts.count)
-            ],
-            deposit_accounts=[
-                self.build_deposit_account_result(user_id=response.user.id)
-                for _ in range(plan.deposit_accounts.count)
+        plan = plan.at(index)
+        debit_card_account_plans = plan.resolve_accounts(index, "debit_card_accounts")
+        credit_card_account_plans = plan.resolve_accounts(index, "credit_card_accounts")
+
+        response = self.request(self.users_gateway_client.create_user)
+        user_id = response.user.id
+
+        savings_accounts, deposit_accounts, debit_card_accounts, credit_card_accounts = self.run_groups([
+            [partial(self.build_savings_account_result, user_id=user_id)] * plan.savings_accounts.count,
+            [partial(self.build_deposit_account_result, user_id=user_id)] * plan.deposit_accounts.count,
+            [
+                partial(self.build_debit_card_account_result, plan=account_plan, user_id=user_id)
+                for account_plan in debit_card_account_plans
             ],
-            debit_card_accounts=[
-                self.build_debit_card_account_result(plan=plan.debit_card_accounts, user_id=response.user.id)
-                for _ in range(plan.debit_card_accounts.count)
+            [
+                partial(self.build_credit_card_account_result, plan=account_plan, user_id=user_id)
+                for account_plan in credit_card_account_plans
             ],
-            credit_card_accounts=[
-                self.build_credit_card_account_result(plan=plan.credit_card_accounts, user_id=response.user.id)
-                for _ in range(plan.credit_card_accounts.count)
+        ])
+
+        return SeedUserResult(
+            user_id=user_id,
+            savings_accounts=savings_accounts,
+            deposit_accounts=deposit_accounts,
+            debit_card_accounts=debit_card_accounts,
+            credit_card_accounts=credit_card_accounts
+        )
+
+    def iter_users(self, plan: SeedUsersPlan, count: int | None = None, offset: int = 0) -> Iterator[SeedUserResult]:
+        """
+        Лениво создаёт пользователей по плану и отдаёт их по одному, как только они готовы.
+
+        В параллельном режиме пользователи создаются в gevent-пуле размером workers,
+        но отдаются в порядке запуска — так же, как в последовательном режиме.
+
+        Args:
+            plan: План генерации пользователя
+            count: Количество пользователей (по умолчанию plan.count)
+            offset: Номер первого создаваемого пользователя в плане
+                (при продолжении сидинга или делении плана между процессами)
+
+        Returns:
+            Iterator[SeedUserResult]: Итератор созданных пользователей
+        """
+        count = plan.count if count is None else count
+        indexes = range(offset, offset + count)
+
+        yield from self.imap(lambda index: self.build_user(plan=plan, index=index), indexes)
+
+    def imap(self, function: Callable[[Any], Any], items: Iterable[Any]) -> Iterator[Any]:
+        """
+        Применяет function к элементам items и отдаёт результаты в порядке элементов.
+        В параллельном режиме вызовы выполняются в gevent-пуле размером workers.
+
+        Args:
+            function: Функция одного элемента (например, создание пользователя)
+            items: Элементы
+
+        Returns:
+            Iterator[Any]: Итератор результатов
+        """
+        if self.workers <= 1:
+            for item in items:
+                yield function(item)
+            return
+
+        pool = Pool(self.workers)
+        results = pool.imap(function, items)
+        try:
+            yield from results
+        finally:
+            # При ошибке или досрочном выходе не даём пулу создавать оставшихся пользователей в фоне
+            results.kill()
+            pool.kill()
+
+    def get_missing_account_plan(self, plan: SeedAccountsPlan, account: SeedAccountResult) -> SeedAccountsPlan:
+        """
+        Возвращает план недостающих карт и операций существующего счёта.
+
+        Args:
+            plan: План счёта с уже выбранными количествами (SeedAccountsPlan.resolve)
+            account: Счёт из дампа
+
+        Returns:
+            SeedAccountsPlan: План с разницей количеств (не меньше нуля)
+        """
+        return plan.model_copy(update={
+            field: type(getattr(plan, field))(count=max(getattr(plan, field).count - len(getattr(account, field)), 0))
+            for field in SEED_COUNT_FIELDS
+        })
+
+    def top_up_card_account_result(
+            self,
+            plan: SeedAccountsPlan,
+            user_id: str,
+            card_id: str | None,
+            account: SeedAccountResult
+    ) -> SeedAccountResult:
+        """
+        Досоздаёт на существующем карточном счёте недостающие карты и операции.
+
+        Args:
+            plan: План недостающих сущностей (get_missing_account_plan)
+            user_id: Идентификатор пользователя
+            card_id: Идентификатор карты счёта (нужен только для операций)
+            account: Счёт из дампа
+
+        Returns:
+            SeedAccountResult: Счёт с прежними и новыми картами и операциями
+        """
+        if not any(getattr(plan, field).count for field in SEED_COUNT_FIELDS):
+            return account
+
+        created = self.build_card_account_result(
+            plan=plan,
+            user_id=user_id,
+            card_id=card_id,
+            account_id=account.account_id
+        )
+        return SeedAccountResult(
+            account_id=account.account_id,
+            **{field: getattr(account, field) + getattr(created, field) for field in SEED_COUNT_FIELDS}
+        )
+
+    def top_up_user(self, user: SeedUserResult, plan: SeedUsersPlan, index: int) -> SeedUserResult:
+        """
+        Дополняет существующего пользователя до плана: открывает недостающие счета,
+        выпускает карты и выполняет операции на уже открытых счетах.
+
+        Операции требуют карту счёта, которой нет в дампе, поэтому при необходимости
+        карты счетов пользователя запрашиваются одним вызовом get_accounts.
+
+        Args:
+            user: Пользователь из дампа
+            plan: Новый (увеличенный) план генерации пользователя
+            index: Номер пользователя в плане
+
+        Returns:
+            SeedUserResult: Пользователь с прежними и новыми сущностями
+        """
+        plan = plan.at(index)
+        account_plans = {
+            field: plan.resolve_accounts(index, field) for field in ("debit_card_accounts", "credit_card_accounts")
+        }
+
+        missing_plans = {
+            field: [
+                self.get_missing_account_plan(plan=account_plan, account=account)
+                for account_plan, account in zip(account_plans[field], getattr(user, field))
             ]
+            for field in account_plans
+        }
+
+        card_ids = {}
+        operation_fields = [field for field in SEED_COUNT_FIELDS if field.endswith("_operations")]
+        if any(
+                getattr(missing_plan, field).count
+                for missing_plans_group in missing_plans.values()
+                for missing_plan in missing_plans_group
+                for field in operation_fields
+        ):
+            response = self.request(self.accounts_gateway_client.get_accounts, user_id=user.user_id)
+            card_ids = {account.id: account.cards[0].id for account in response.accounts if account.cards}
+
+        def get_card_id(missing_plan: SeedAccountsPlan, account: SeedAccountResult) -> str | None:
+            if card_ids.get(account.account_id) is None and any(
+                    getattr(missing_plan, field).count for field in operation_fields
+            ):
+                raise ValueError(
+                    f"Нельзя выполнить операции на счёте {account.account_id} пользователя {user.user_id}: "
+                    f"у счёта нет карт"
+                )
+
+            return card_ids.get(account.account_id)
+
+        def get_card_account_calls(field: str, build: Callable[..., SeedAccountResult]) -> list[Callable]:
+            existing = getattr(user, field)
+            return [
+                partial(
+                    self.top_up_card_account_result,
+                    plan=missing_plan,
+                    user_id=user.user_id,
+                    card_id=get_card_id(missing_plan, account),
+                    account=account
+                )
+                for missing_plan, account in zip(missing_plans[field], existing)
+            ] + [
+                partial(build, plan=account_plan, user_id=user.user_id)
+                for account_plan in account_plans[field][len(existing):]
+            ]
+
+        savings_accounts, deposit_accounts, debit_card_accounts, credit_card_accounts = self.run_groups([
+            [
+                partial(self.build_savings_account_result, user_id=user.user_id)
+            ] * max(plan.savings_accounts.count - len(user.savings_accounts), 0),
+            [
+                partial(self.build_deposit_account_result, user_id=user.user_id)
+            ] * max(plan.deposit_accounts.count - len(user.deposit_accounts), 0),
+            get_card_account_calls("debit_card_accounts", self.build_debit_card_account_result),
+            get_card_account_calls("credit_card_accounts", self.build_credit_card_account_result),
+        ])
+
+        return SeedUserResult(
+            user_id=user.user_id,
+            savings_accounts=user.savings_accounts + savings_accounts,
+            deposit_accounts=user.deposit_accounts + deposit_accounts,
+            debit_card_accounts=debit_card_accounts,
+            credit_card_accounts=credit_card_accounts
         )
 
+    def iter_top_up_users(self, users: Iterable[SeedUserResult], plan: SeedUsersPlan) -> Iterator[SeedUserResult]:
+        """
+        Дополняет существующих пользователей до плана (см. top_up_user) и отдаёт их в исходном порядке.
+
+        Args:
+            users: Пользователи из дампа в порядке дампа (номер пользователя в плане — его позиция)
+            plan: Новый (увеличенный) план генерации пользователя
+
+        Returns:
+            Iterator[SeedUserResult]: Итератор дополненных пользователей
+        """
+        yield from self.imap(lambda item: self.top_up_user(user=item[1], plan=plan, index=item[0]), enumerate(users))
+
     def build(self, plan: SeedsPlan) -> SeedsResult:
         """
         Генерирует полную структуру данных на основе плана:
@@ -316,13 +612,16 @@ class SeedsBuilder:
         Returns:
             SeedsResult: Результат с данными всех созданных пользователей
         """
-        return SeedsResult(users=[self.build_user(plan=plan.users) for _ in range(plan.users.count)])
+        return SeedsResult(users=list(self.iter_users(plan=plan.users)))
 
 
-def build_grpc_seeds_builder() -> SeedsBuilder:
+def build_grpc_seeds_builder(workers: int | None = None) -> SeedsBuilder:
     """
     Фабрика для создания сидера с использованием gRPC-клиентов.
 
+    Args:
+        workers: Количество параллельно создаваемых пользователей (по умолчанию из settings.seeds)
+
     Returns:
         SeedsBuilder: Инициализированный сидер с gRPC-клиентами
     """
@@ -330,14 +629,18 @@ def build_grpc_seeds_builder() -> SeedsBuilder:
         users_gateway_client=build_users_gateway_grpc_client(),
         cards_gateway_client=build_cards_gateway_grpc_client(),
         accounts_gateway_client=build_accounts_gateway_grpc_client(),
-        operations_gateway_client=build_operations_gateway_grpc_client()
+        operations_gateway_client=build_operations_gateway_grpc_client(),
+        workers=workers or settings.seeds.workers
     )
 
 
-def build_http_seeds_builder():
+def build_http_seeds_builder(workers: int | None = None) -> SeedsBuilder:
     """
     Фабрика для создания сидера с использованием HTTP-клиентов.
 
+    Args:
+        workers: Количество параллельно создаваемых пользователей (по умолчанию из settings.seeds)
+
     Returns:
         SeedsBuilder: Инициализированный сидер с HTTP-клиентами
     """
@@ -345,5 +648,33 @@ def build_http_seeds_builder():
         users_gateway_client=build_users_gateway_http_client(),
         cards_gateway_client=build_cards_gateway_http_client(),
         accounts_gateway_client=build_accounts_gateway_http_client(),
-        operations_gateway_client=build_operations_gateway_http_client()
+        operations_gateway_client=build_operations_gateway_http_client(),
+        workers=workers or settings.seeds.workers
+    )
+
+
+def build_locust_grpc_seeds_builder(environment: Environment, workers: int | None = None) -> SeedsBuilder:
+    """
+    Фабрика для создания сидера, который работает во время нагрузки (например, пополнение пула).
+
+    Вызовы попадают в статистику Locust с типом SEEDS_REQUEST_TYPE: нагрузка от сидинга видна
+    в отчёте, но не смешивается с вызовами сценария.
+
+    Args:
+        environment: Окружение Locust
+        workers: Количество параллельно создаваемых пользователей (по умолчанию из settings.seeds)
+
+    Returns:
+        SeedsBuilder: Сидер с gRPC-клиентами на общем канале с LocustInterceptor
+    """
+    channel = intercept_channel(
+        build_gateway_grpc_channel(),
+        LocustInterceptor(environment=environment, request_type=SEEDS_REQUEST_TYPE)
+    )
+    return SeedsBuilder(
+        users_gateway_client=UsersGatewayGRPCClient(channel=channel),
+        cards_gateway_client=CardsGatewayGRPCClient(channel=channel),
+        accounts_gateway_client=AccountsGatewayGRPCClient(channel=channel),
+        operations_gateway_client=OperationsGatewayGRPCClient(channel=channel),
+        workers=workers or settings.seeds.workers
     )
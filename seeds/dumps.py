@@ -1,35 +1,351 @@
 import os
+from array import array
+from itertools import islice
 from pathlib import Path
-from seeds.schema.result import SeedsResult
+from typing import Iterable, Iterator
+
+from seeds.binary import save_seeds_binary, SeedsBinaryResult
+from seeds.schema.meta import SeedsDumpMeta, SeedsRange
+from seeds.schema.result import SeedsResult, SeedUserResult
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 DUMPS_PATH = PROJECT_ROOT / "dumps"
 
+
+def get_seeds_result_path(scenario: str) -> str:
+    """
+    Возвращает путь к дампу сидинга в старом формате (один JSON-документ).
+
+    :param scenario: Название сценария нагрузки.
+    :return: Путь к файлу {scenario}_seeds.json.
+    """
+    return os.path.join(DUMPS_PATH, f"{scenario}_seeds.json")
+
+
+def get_seeds_stream_path(scenario: str) -> str:
+    """
+    Возвращает путь к потоковому дампу сидинга (JSONL: один SeedUserResult на строку).
+
+    :param scenario: Название сценария нагрузки.
+    :return: Путь к файлу {scenario}_seeds.jsonl.
+    """
+    return os.path.join(DUMPS_PATH, f"{scenario}_seeds.jsonl")
+
+
+def get_seeds_binary_path(scenario: str) -> str:
+    """
+    Возвращает путь к бинарному колоночному дампу сидинга.
+
+    :param scenario: Название сценария нагрузки.
+    :return: Путь к файлу {scenario}_seeds.bin.
+    """
+    return os.path.join(DUMPS_PATH, f"{scenario}_seeds.bin")
+
+
+def get_seeds_part_path(scenario: str, index: int) -> str:
+    """
+    Возвращает путь к частичному дампу, который пишет один процесс при многопроцессном сидинге.
+
+    :param scenario: Название сценария нагрузки.
+    :param index: Номер процесса (части).
+    :return: Путь к файлу {scenario}_seeds.part{index}.jsonl.
+    """
+    return os.path.join(DUMPS_PATH, f"{scenario}_seeds.part{index}.jsonl")
+
+
+def seeds_result_exists(scenario: str) -> bool:
+    """
+    Проверяет, есть ли для сценария дамп в любом из поддерживаемых форматов.
+
+    :param scenario: Название сценария нагрузки.
+    """
+    return os.path.exists(get_seeds_stream_path(scenario)) or os.path.exists(get_seeds_result_path(scenario))
+
+
+def get_seeds_meta_path(scenario: str) -> str:
+    """
+    Возвращает путь к файлу метаданных дампа сидинга для сценария.
+
+    :param scenario: Название сценария нагрузки.
+    :return: Путь к файлу {scenario}_seeds.meta.json.
+    """
+    return os.path.join(DUMPS_PATH, f"{scenario}_seeds.meta.json")
+
+
 def save_seeds_result(result: SeedsResult, scenario: str):
     """
-    Сохраняет результат сидинга (SeedsResult) в JSON-файл.
+    Сохраняет результат сидинга (SeedsResult) в потоковый дамп JSONL, перезаписывая его.
 
     :param result: Результат сидинга, сгенерированный билдером.
     :param scenario: Название сценария нагрузки, для которого создаются данные.
                      Используется для генерации имени файла (например, "credit_card_test").
     """
+    clear_seeds_stream(scenario)
+    append_seed_user_results(result.users, scenario)
+
+
+def clear_seeds_stream(scenario: str):
+    """
+    Создаёт пустой потоковый дамп (или очищает существующий) перед новым сидингом.
+
+    :param scenario: Название сценария нагрузки.
+    """
     # Убедимся, что папка dumps существует
     if not os.path.exists(DUMPS_PATH):
         os.mkdir(DUMPS_PATH)
 
-    # Сохраняем результат сидинга в файл с именем {scenario}_seeds.json
-    filename = os.path.join(DUMPS_PATH, f"{scenario}_seeds.json")
-    with open(filename, "w+", encoding="utf-8") as file:
-        file.write(result.model_dump_json())
+    with open(get_seeds_stream_path(scenario), "w", encoding="utf-8"):
+        pass
+
+
+def append_seed_user_results(users: Iterable[SeedUserResult], scenario: str, part: int | None = None) -> int:
+    """
+    Дописывает пользователей в потоковый дамп по мере их появления.
+
+    Каждый пользователь записывается отдельной строкой и сразу сбрасывается на диск,
+    поэтому при падении сидинга все уже созданные пользователи остаются в дампе,
+    а в памяти не нужно держать весь результат.
+
+    :param users: Итератор пользователей (например, SeedsBuilder.iter_users).
+    :param scenario: Название сценария нагрузки.
+    :param part: Номер частичного дампа (см. get_seeds_part_path) вместо основного.
+    :return: Количество записанных пользователей.
+    """
+    if not os.path.exists(DUMPS_PATH):
+        os.mkdir(DUMPS_PATH)
+
+    filename = get_seeds_stream_path(scenario) if part is None else get_seeds_part_path(scenario, part)
+
+    count = 0
+    with open(filename, "a", encoding="utf-8") as file:
+        for user in users:
+            file.write(user.model_dump_json() + "\n")
+            file.flush()
+            count += 1
+
+    return count
+
+
+def replace_seeds_stream(users: Iterable[SeedUserResult], scenario: str) -> int:
+    """
+    Перезаписывает потоковый дамп новыми пользователями атомарно: пользователи пишутся во временный файл,
+    который заменяет дамп только после успешной записи. Пользователей можно читать из заменяемого дампа.
+
+    :param users: Итератор пользователей.
+    :param scenario: Название сценария нагрузки.
+    :return: Количество записанных пользователей.
+    """
+    if not os.path.exists(DUMPS_PATH):
+        os.mkdir(DUMPS_PATH)
+
+    filename = get_seeds_stream_path(scenario)
+    temp_filename = f"{filename}.tmp"
+
+    count = 0
+    with open(temp_filename, "w", encoding="utf-8") as file:
+        for user in users:
+            file.write(user.model_dump_json() + "\n")
+            count += 1
+
+    os.replace(temp_filename, filename)
+    return count
+
+
+def repair_seeds_stream(scenario: str) -> int:
+    """
+    Подготавливает потоковый дамп к продолжению сидинга после сбоя.
+    Обрезает недописанную последнюю строку (если процесс упал во время записи).
+
+    :param scenario: Название сценария нагрузки.
+    :return: Количество полностью записанных пользователей.
+    """
+    filename = get_seeds_stream_path(scenario)
+    if not os.path.exists(filename):
+        clear_seeds_stream(scenario)
+        return 0
+
+    count, complete_size = 0, 0
+    with open(filename, "rb") as file:
+        for line in file:
+            if not line.endswith(b"\n"):
+                break
+
+            count += 1
+            complete_size += len(line)
+
+    with open(filename, "r+b") as file:
+        file.truncate(complete_size)
+
+    return count
+
+
+def sort_seeds_stream(scenario: str, ranges: list[SeedsRange]) -> bool:
+    """
+    Упорядочивает потоковый дамп по номерам пользователей плана, если строки дописывались не по порядку
+    (продолжение сидинга после сбоя, части многопроцессного сидинга).
+
+    Строки копируются без разбора целыми диапазонами во временный файл, который заменяет дамп.
+
+    :param scenario: Название сценария нагрузки.
+    :param ranges: Номера пользователей плана в порядке строк дампа (см. SeedsDumpMeta.get_built_ranges).
+    :return: Был ли дамп переписан.
+    """
+    if ranges == sorted(ranges):
+        return False
+
+    filename = get_seeds_stream_path(scenario)
+
+    # Смещения начала строк дампа (и конца последней)
+    offsets = array("q", [0])
+    with open(filename, "rb") as file:
+        for line in file:
+            offsets.append(offsets[-1] + len(line))
+
+    # Номер первого пользователя диапазона -> первая строка диапазона в дампе
+    spans, line = [], 0
+    for start, end in ranges:
+        spans.append((start, line, end - start))
+        line += end - start
+
+    temp_filename = f"{filename}.tmp"
+    with open(filename, "rb") as source, open(temp_filename, "wb") as target:
+        for _, line, count in sorted(spans):
+            source.seek(offsets[line])
+            remaining = offsets[line + count] - offsets[line]
+            while remaining > 0:
+                chunk = source.read(min(remaining, 1 << 20))
+                target.write(chunk)
+                remaining -= len(chunk)
+
+    os.replace(temp_filename, filename)
+    return True
+
+
+def merge_seeds_parts(scenario: str, count: int) -> list[int]:
+    """
+    Дописывает частичные дампы в основной потоковый дамп по порядку номеров и удаляет их.
+    Строки копируются без разбора; недописанная последняя строка части (процесс упал во время записи) отбрасывается.
+
+    :param scenario: Название сценария нагрузки.
+    :param count: Количество частей.
+    :return: Количество перенесённых пользователей по каждой части.
+    """
+    merged = [0] * count
+    with open(get_seeds_stream_path(scenario), "ab") as stream:
+        for index in range(count):
+            filename = get_seeds_part_path(scenario, index)
+            if not os.path.exists(filename):
+                continue
+
+            with open(filename, "rb") as part:
+                for line in part:
+                    if not line.endswith(b"\n"):
+                        break
+
+                    stream.write(line)
+                    merged[index] += 1
+
+            os.remove(filename)
+
+    return merged
+
+
+def iter_seed_user_results(
+        scenario: str,
+        offset: int = 0,
+        limit: int | None = None,
+        shard_index: int = 0,
+        shard_count: int = 1
+) -> Iterator[SeedUserResult]:
+    """
+    Лениво читает пользователей из дампа сценария.
+
+    Можно прочитать только часть дампа: сначала выбирается окно [offset, offset + limit),
+    затем внутри окна — шард shard_index из shard_count (каждый shard_count-й пользователь,
+    как в SeedsResult.get_shards). Строки потокового дампа вне выборки не разбираются.
+    Дамп старого формата (один JSON-документ) приходится разбирать целиком.
+
+    :param scenario: Название сценария нагрузки.
+    :param offset: Сколько пользователей пропустить с начала дампа.
+    :param limit: Максимальный размер окна (None — до конца дампа).
+    :param shard_index: Номер шарда внутри окна.
+    :param shard_count: Количество шардов.
+    :return: Итератор по SeedUserResult в порядке дампа.
+    """
+    stop = None if limit is None else offset + limit
+
+    filename = get_seeds_stream_path(scenario)
+    if not os.path.exists(filename):
+        yield from load_seeds_result(scenario).users[offset:stop][shard_index::shard_count]
+        return
+
+    with open(filename, "r", encoding="utf-8") as file:
+        for position, line in enumerate(islice(file, offset, stop)):
+            if position % shard_count == shard_index:
+                yield SeedUserResult.model_validate_json(line)
 
 
 def load_seeds_result(scenario: str) -> SeedsResult:
     """
-    Загружает результат сидинга из JSON-файла.
+    Загружает результат сидинга из дампа.
+    Потоковый дамп (JSONL) имеет приоритет над дампом старого формата (JSON).
 
     :param scenario: Название сценария нагрузки.
     :return: Объект SeedsResult.
     """
-    filename = os.path.join(DUMPS_PATH, f"{scenario}_seeds.json")
+    if os.path.exists(get_seeds_stream_path(scenario)):
+        return SeedsResult(users=list(iter_seed_user_results(scenario)))
+
+    filename = get_seeds_result_path(scenario)
     with open(filename, "r", encoding="utf-8") as file:
         return SeedsResult.model_validate_json(file.read())
+
+
+def save_seeds_result_binary(scenario: str) -> int:
+    """
+    Конвертирует дамп сценария в бинарный колоночный формат.
+    Пользователи читаются из дампа построчно, поэтому весь SeedsResult в памяти не собирается.
+
+    :param scenario: Название сценария нагрузки.
+    :return: Количество сохранённых пользователей.
+    """
+    return save_seeds_binary(users=iter_seed_user_results(scenario), path=get_seeds_binary_path(scenario))
+
+
+def load_seeds_result_binary(scenario: str) -> SeedsBinaryResult:
+    """
+    Открывает бинарный дамп сценария через mmap без разбора всего файла.
+
+    :param scenario: Название сценария нагрузки.
+    :return: Объект SeedsBinaryResult с доступом к пользователям по индексу.
+    """
+    return SeedsBinaryResult(get_seeds_binary_path(scenario))
+
+
+def save_seeds_meta(meta: SeedsDumpMeta, scenario: str):
+    """
+    Сохраняет метаданные дампа (отпечаток плана и время создания) рядом с дампом.
+
+    :param meta: Метаданные дампа.
+    :param scenario: Название сценария нагрузки.
+    """
+    if not os.path.exists(DUMPS_PATH):
+        os.mkdir(DUMPS_PATH)
+
+    with open(get_seeds_meta_path(scenario), "w+", encoding="utf-8") as file:
+        file.write(meta.model_dump_json())
+
+
+def load_seeds_meta(scenario: str) -> SeedsDumpMeta | None:
+    """
+    Загружает метаданные дампа сидинга.
+
+    :param scenario: Название сценария нагрузки.
+    :return: Объект SeedsDumpMeta или None, если метаданных нет (например, дамп создан старой версией).
+    """
+    filename = get_seeds_meta_path(scenario)
+    if not os.path.exists(filename):
+        return None
+
+    with open(filename, "r", encoding="utf-8") as file:
+        return SeedsDumpMeta.model_validate_json(file.read())
@@ -0,0 +1,233 @@
+"""
+Сбор сидов во время нагрузки (harvest).
+
+Сценарии new_user_* создают за прогон тысячи пользователей со счетами, картами и операциями
+и тут же забывают их идентификаторы. При settings.seeds.harvest клиенты gateway в базовых
+TaskSet оборачиваются в SeedsHarvestClient: созданные сущности собираются в SeedUserResult
+и в фоне дописываются в потоковый дамп dumps/<harvest>_seeds.jsonl. Сценарий сидинга
+с SeedsScenario.harvest = "<harvest>" забирает этих пользователей вместо создания новых.
+"""
+import inspect
+from typing import Any
+
+import gevent
+from gevent.queue import Queue, Empty
+from locust import TaskSet
+from locust.env import Environment
+
+from config import settings
+from seeds.dumps import append_seed_user_results
+from seeds.schema.result import SeedUserResult, SeedAccountResult, SeedCardResult, SeedOperationResult
+
+# Метод клиента gateway -> поле SeedUserResult (счета) или SeedAccountResult (карты и операции)
+SEEDS_HARVEST_ACCOUNT_METHODS = {
+    "open_deposit_account": "deposit_accounts",
+    "open_savings_account": "savings_accounts",
+    "open_debit_card_account": "debit_card_accounts",
+    "open_credit_card_account": "credit_card_accounts",
+}
+SEEDS_HARVEST_CARD_METHODS = {
+    "issue_physical_card": "physical_cards",
+    "issue_virtual_card": "virtual_cards",
+}
+SEEDS_HARVEST_OPERATION_METHODS = {
+    "make_top_up_operation": "top_up_operations",
+    "make_purchase_operation": "purchase_operations",
+    "make_transfer_operation": "transfer_operations",
+    "make_cash_withdrawal_operation": "cash_withdrawal_operations",
+}
+
+
+class SeedsHarvester:
+    """
+    Фоновая запись собранных пользователей в потоковый дамп.
+
+    Задачи Locust только кладут пользователя в очередь (submit), а гринлет раз в flush_interval
+    дописывает накопленных пользователей в дамп, поэтому запись на диск не влияет на время ответов.
+
+    Attributes:
+        harvested_count (int): Сколько пользователей записано в дамп.
+    """
+
+    def __init__(self, scenario: str, flush_interval: float = 1.0):
+        """
+        :param scenario: Имя дампа, в который собираются пользователи.
+        :param flush_interval: Период записи накопленных пользователей (секунды).
+        """
+        self.scenario = scenario
+        self.flush_interval = flush_interval
+
+        self.queue: Queue = Queue()
+        self.greenlet: gevent.Greenlet | None = None
+        self.harvested_count = 0
+
+    def submit(self, user: SeedUserResult) -> None:
+        """
+        Ставит пользователя в очередь на запись.
+        """
+        self.queue.put(user)
+
+    def start(self) -> None:
+        """
+        Запускает фоновую запись (повторный вызов ничего не делает).
+        """
+        if self.greenlet is None:
+            self.greenlet = gevent.spawn(self.run)
+
+    def stop(self) -> None:
+        """
+        Останавливает фоновую запись и дописывает оставшихся в очереди пользователей.
+        """
+        if self.greenlet is not None:
+            self.greenlet.kill()
+            self.greenlet = None
+
+        self.flush()
+
+    def flush(self) -> None:
+        """
+        Дописывает в дамп всех пользователей, накопленных в очереди.
+        """
+        users = []
+        while True:
+            try:
+                users.append(self.queue.get_nowait())
+            except Empty:
+                break
+
+        if users:
+            self.harvested_count += append_seed_user_results(users=users, scenario=self.scenario)
+
+    def run(self) -> None:
+        while True:
+            gevent.sleep(self.flush_interval)
+            self.flush()
+
+
+class SeedsHarvestSession:
+    """
+    Сущности, созданные одним виртуальным пользователем Locust.
+
+    Счета привязываются к пользователю по user_id, карты и операции — к счёту по account_id.
+    Когда виртуальный пользователь создаёт следующего пользователя (или останавливается),
+    собранные пользователи считаются завершёнными и передаются в SeedsHarvester.
+    """
+
+    def __init__(self, harvester: SeedsHarvester):
+        self.harvester = harvester
+        self.users: dict[str, SeedUserResult] = {}
+        self.accounts: dict[str, SeedAccountResult] = {}
+
+    def record(self, name: str, kwargs: dict, response: Any) -> None:
+        """
+        Запоминает сущность из ответа метода клиента gateway (остальные методы игнорируются).
+
+        :param name: Метод клиента.
+        :param kwargs: Аргументы вызова по именам параметров метода (включая переданные позиционно).
+        :param response: Ответ gateway (gRPC или HTTP — поля ответа у них совпадают).
+        """
+        if name == "create_user":
+            self.finish()
+            self.users[response.user.id] = SeedUserResult(user_id=response.user.id)
+        elif name in SEEDS_HARVEST_ACCOUNT_METHODS:
+            user = self.users.get(kwargs.get("user_id"))
+            if user is not None:
+                account = SeedAccountResult(account_id=response.account.id)
+                getattr(user, SEEDS_HARVEST_ACCOUNT_METHODS[name]).append(account)
+                self.accounts[account.account_id] = account
+        elif name in SEEDS_HARVEST_CARD_METHODS:
+            account = self.accounts.get(kwargs.get("account_id"))
+            if account is not None:
+                getattr(account, SEEDS_HARVEST_CARD_METHODS[name]).append(SeedCardResult(card_id=response.card.id))
+        elif name in SEEDS_HARVEST_OPERATION_METHODS:
+            account = self.accounts.get(kwargs.get("account_id"))
+            if account is not None:
+                getattr(account, SEEDS_HARVEST_OPERATION_METHODS[name]).append(
+                    SeedOperationResult(operation_id=response.operation.id)
+                )
+
+    def finish(self) -> None:
+        """
+        Передаёт собранных пользователей на запись и очищает сессию.
+        """
+        for user in self.users.values():
+            self.harvester.submit(user)
+
+        self.users.clear()
+        self.accounts.clear()
+
+
+class SeedsHarvestClient:
+    """
+    Прокси над клиентом gateway, записывающий созданные сущности в SeedsHarvestSession.
+    Неудачные вызовы (исключения) не записываются.
+
+    Аргументы вызова сопоставляются с параметрами метода по его сигнатуре, поэтому сущность
+    записывается, даже если user_id или account_id переданы позиционно.
+    """
+
+    def __init__(self, client: Any, session: SeedsHarvestSession):
+        """
+        :param client: gRPC- или HTTP-клиент gateway.
+        :param session: Сессия виртуального пользователя.
+        """
+        self.client = client
+        self.session = session
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self.client, name)
+        if name.startswith("_") or not callable(attribute):
+            return attribute
+
+        def call(*args, **kwargs):
+            response = attribute(*args, **kwargs)
+            arguments = kwargs if not args else inspect.signature(attribute).bind(*args, **kwargs).arguments
+            self.session.record(name, arguments, response)
+            return response
+
+        return call
+
+
+def get_locust_seeds_harvester(environment: Environment) -> SeedsHarvester:
+    """
+    Возвращает общий для процесса SeedsHarvester (создаётся при первом обращении)
+    и останавливает его вместе с тестом, дописывая оставшихся пользователей.
+    """
+    harvester = getattr(environment, "seeds_harvester", None)
+    if harvester is None:
+        harvester = SeedsHarvester(
+            scenario=settings.seeds.harvest,
+            flush_interval=settings.seeds.harvest_flush_interval
+        )
+        harvester.start()
+        environment.seeds_harvester = harvester
+
+        def on_test_stop(**kwargs):
+            # При повторном запуске теста (например, из веб-интерфейса) создаётся новый SeedsHarvester
+            if environment.seeds_harvester is harvester:
+                environment.seeds_harvester = None
+            harvester.stop()
+
+        environment.events.test_stop.add_listener(on_test_stop)
+
+    return harvester
+
+
+def init_locust_seeds_harvest(task_set: TaskSet) -> SeedsHarvestSession | None:
+    """
+    Включает сбор сидов для TaskSet, если задан settings.seeds.harvest: клиенты gateway
+    (атрибуты *_gateway_client) оборачиваются в SeedsHarvestClient.
+    Вызывается в on_start базовых TaskSet после создания клиентов.
+
+    :param task_set: TaskSet виртуального пользователя.
+    :return: Сессия сбора (её нужно завершить в on_stop) или None, если сбор выключен.
+    """
+    if settings.seeds.harvest is None:
+        return None
+
+    session = SeedsHarvestSession(harvester=get_locust_seeds_harvester(task_set.user.environment))
+    for name, client in list(vars(task_set).items()):
+        if name.endswith("_gateway_client"):
+            setattr(task_set, name, SeedsHarvestClient(client, session))
+
+    return session
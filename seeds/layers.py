@@ -0,0 +1,355 @@
+"""
+Общая базовая популяция и слои сценариев.
+
+Сценарии existing_user_* нужны пользователи почти одинаковой формы (дебетовый или кредитный счёт),
+но раньше каждый сценарий создавал своих. Теперь одна базовая популяция (SeedsBaseScenario)
+сидится один раз, а сценарий (SeedsOverlayScenario) объявляет только то, что ему нужно сверх базы.
+План базы — объединение (SeedsPlan.union) плана базы и слоёв всех сценариев, причём сущности слоя
+нужны только пользователям его диапазона базы (SeedUsersRangePlan). Так база покрывает каждый
+сценарий, её пользователи и общие счета создаются один раз, а сидинг базы дешевле отдельных популяций:
+
+    python -m seeds.layers base --dry-run
+
+Собрать базу и дампы всех сценариев за один проход (имя базы — все сценарии на ней),
+при необходимости — сидингом базы в нескольких процессах:
+
+    python -m seeds.layers existing_user_get_documents existing_user_issue_virtual_card
+    python -m seeds.layers base --processes 8
+"""
+import argparse
+import hashlib
+import pkgutil
+import sys
+from abc import abstractmethod
+from itertools import islice
+from typing import Sequence
+
+import seeds.scenarios
+from config import settings
+from seeds.dumps import (
+    load_seeds_meta,
+    replace_seeds_stream,
+    iter_seed_user_results,
+    save_seeds_result_binary,
+)
+from seeds.planner import estimate_seeds_plan, estimate_seeds_top_up
+from seeds.scenario import SeedsScenario
+from seeds.schema.estimate import SeedsPlanEstimate
+from seeds.schema.plan import SeedsPlan, SeedUsersPlan, SeedUsersRangePlan
+from seeds.sharded import build_seeds_scenario_sharded, load_seeds_scenario_class
+from seeds.verifier import SeedsVerificationResult
+
+
+class SeedsBaseScenario(SeedsScenario):
+    """
+    Базовая популяция пользователей, общая для нескольких сценариев.
+
+    Дамп базы только растёт: требования новых слоёв объединяются с планом существующего дампа,
+    и дамп дополняется (см. SeedsScenario.build_top_up) вместо создания новых пользователей.
+    """
+
+    def __init__(self, plan: SeedsPlan, scenario: str = "base"):
+        """
+        :param plan: Минимальный план базы (общая форма пользователей).
+        :param scenario: Имя дампа базы.
+        """
+        super().__init__()
+        self.base_plan = plan
+        self.base_scenario = scenario
+        # План, до которого дополняется база: base_plan, объединённый с планом дампа и требованиями слоёв
+        # (см. cover). План дампа учитывается сразу, чтобы build и verify базы без слоёв не сокращали её
+        self.required_plan = plan
+        self.cover(plan)
+
+    @property
+    def plan(self) -> SeedsPlan:
+        return self.required_plan
+
+    @property
+    def scenario(self) -> str:
+        return self.base_scenario
+
+    def cover(self, plan: SeedsPlan) -> None:
+        """
+        Расширяет план базы так, чтобы он покрывал plan и план существующего дампа
+        (если дамп можно дополнить), не выполняя сидинг.
+
+        :param plan: План, который должна покрывать база (обычно слой сценария).
+        """
+        self.required_plan = self.required_plan.union(plan)
+
+        meta = load_seeds_meta(scenario=self.scenario)
+        if (meta is not None) and meta.completed and (meta.gateway_url == self.gateway_url):
+            try:
+                self.required_plan = self.required_plan.union(meta.plan)
+            except ValueError:
+                # План дампа несовместим с текущим (другое зерно или распределения) — база пересоздаётся
+                pass
+
+    def require(self, plan: SeedsPlan, force: bool = False, processes: int | None = None) -> None:
+        """
+        Гарантирует, что дамп базы покрывает план (см. cover), и выполняет сидинг базы.
+
+        :param plan: План, который должна покрывать база (обычно план слоя сценария).
+        :param force: Пересоздать базу независимо от существующего дампа.
+        :param processes: Количество процессов сидинга (см. seeds.sharded), None — в текущем процессе.
+        """
+        self.cover(plan)
+
+        if processes is None:
+            self.build(force=force)
+        else:
+            build_seeds_scenario_sharded(seeds_scenario=self, processes=processes, force=force)
+
+
+class SeedsOverlayScenario(SeedsScenario):
+    """
+    Сценарий сидинга поверх базовой популяции.
+
+    Сценарий объявляет слой (overlay) — что ему нужно сверх базы, например пять покупок
+    на кредитном счёте. Слой объединяется с планом базы, база дополняется до объединения,
+    а дамп сценария — overlay.users.count пользователей базы, начиная с offset. Сущности слоя создаются
+    только у пользователей базы из этого диапазона, а пользователи и общие счета — один раз на все сценарии.
+
+    Сценарии, которые только читают данные, могут делить одних и тех же пользователей базы.
+    Сценарии, которые изменяют своих пользователей во время нагрузки (выполняют операции,
+    выпускают карты), должны задавать offset так, чтобы их диапазоны не пересекались с другими.
+
+    Сам сценарий пользователей не создаёт, поэтому собранные во время нагрузки пользователи
+    (settings.seeds.harvest) попадают в него через базу: база забирает их, когда создаёт
+    новых пользователей — при первом сидинге и при дополнении (см. SeedsScenario.build_top_up).
+    """
+
+    @property
+    @abstractmethod
+    def base(self) -> SeedsBaseScenario:
+        """
+        Базовая популяция, на которой строится сценарий.
+        """
+        ...
+
+    @property
+    @abstractmethod
+    def overlay(self) -> SeedsPlan:
+        """
+        Слой сценария: количество пользователей и сущности, которые нужны сверх базы.
+        """
+        ...
+
+    @property
+    def offset(self) -> int:
+        """
+        Номер первого пользователя базы, с которого берутся пользователи сценария.
+        """
+        return 0
+
+    @property
+    def base_overlay(self) -> SeedsPlan:
+        """
+        Слой, который должна покрывать база: пользователи до конца диапазона сценария,
+        а сущности слоя — только у пользователей диапазона [offset, offset + overlay.users.count).
+        """
+        return SeedsPlan(
+            users=SeedUsersPlan(
+                count=self.offset + self.overlay.users.count,
+                seed=self.base.base_plan.users.seed,
+                ranges=[SeedUsersRangePlan(offset=self.offset, plan=self.overlay.users)]
+            )
+        )
+
+    @property
+    def plan(self) -> SeedsPlan:
+        """
+        Полный план пользователей сценария: база, объединённая со слоем,
+        с количеством пользователей из слоя.
+        """
+        plan = self.base.base_plan.union(self.overlay)
+        return plan.model_copy(update={"users": plan.users.model_copy(update={"count": self.overlay.users.count})})
+
+    @property
+    def fingerprint(self) -> str:
+        """
+        Отпечаток включает отпечаток и время создания дампа базы: дамп сценария — выборка из дампа базы,
+        и после любого изменения базы он собирается заново (это только копирование пользователей).
+        """
+        meta = load_seeds_meta(scenario=self.base.scenario)
+        base = "" if meta is None else f"{meta.fingerprint}:{meta.created_at.isoformat()}"
+        payload = f"{self.plan.model_dump_json()}|{self.gateway_url}|{self.base.scenario}|{self.offset}|{base}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def build(self, force: bool = False) -> None:
+        """
+        Дополняет базу до слоя сценария (при необходимости) и собирает дамп сценария из пользователей базы.
+
+        :param force: Пересоздать дамп сценария вместе с базой (также включается через settings.seeds.force_rebuild).
+        """
+        force = force or settings.seeds.force_rebuild
+        if (not force) and self.is_dump_actual() and self.is_binary_actual():
+            return
+
+        self.derive(self.base, force=force)
+
+    def verify(
+            self,
+            sample: int | None = None,
+            threshold: float = 0.0,
+            workers: int = 50
+    ) -> SeedsVerificationResult:
+        """
+        Проверяет и восстанавливает базу (см. SeedsScenario.verify), затем собирает дамп сценария заново.
+
+        Дамп сценария — копия пользователей базы, поэтому неживые пользователи удаляются из базы
+        и создаются в ней заново, а при доле живых ниже threshold пересоздаётся вся база.
+
+        :param sample: Сколько случайных пользователей базы проверить (None — всех).
+        :param threshold: Минимальная доля живых пользователей.
+        :param workers: Количество пользователей, проверяемых одновременно.
+        :return: Результат проверки базы.
+        """
+        self.base.require(self.base_overlay)
+        result = self.base.verify(sample=sample, threshold=threshold, workers=workers)
+        self.build()
+        return result
+
+    def derive(self, base: SeedsBaseScenario, force: bool = False) -> None:
+        """
+        Собирает дамп сценария из overlay.users.count пользователей базы, начиная с offset.
+
+        :param base: База, дамп которой нужно дополнить до слоя сценария.
+        :param force: Пересоздать базу независимо от существующего дампа.
+        """
+        base.require(self.base_overlay, force=force)
+
+        replace_seeds_stream(
+            users=islice(
+                iter_seed_user_results(scenario=base.scenario), self.offset, self.offset + self.overlay.users.count
+            ),
+            scenario=self.scenario
+        )
+
+        if settings.seeds.dump_format == "binary":
+            save_seeds_result_binary(scenario=self.scenario)
+
+        self.save_meta(completed=True)
+
+
+def get_seeds_layers_plan(scenarios: Sequence[SeedsOverlayScenario]) -> SeedsPlan:
+    """
+    Возвращает план базы, покрывающий слои всех сценариев: объединение базы и слоёв,
+    в котором сущности каждого слоя заданы только на диапазоне его сценария (см. SeedsOverlayScenario.base_overlay).
+    """
+    plan = scenarios[0].base.base_plan
+    for seeds_scenario in scenarios:
+        plan = plan.union(seeds_scenario.base_overlay)
+
+    return plan
+
+
+def get_seeds_layers_base(scenarios: Sequence[SeedsOverlayScenario]) -> SeedsBaseScenario:
+    """
+    Возвращает общую базу сценариев.
+
+    :raises ValueError: Если у сценариев разные базы.
+    """
+    base = scenarios[0].base
+    if any(seeds_scenario.base.scenario != base.scenario for seeds_scenario in scenarios):
+        raise ValueError("Сценарии построены на разных базовых популяциях")
+
+    return base
+
+
+def load_seeds_layers(names: Sequence[str]) -> list[SeedsOverlayScenario]:
+    """
+    Загружает сценарии слоёв по именам модулей в seeds/scenarios.
+    Имя базы заменяется всеми сценариями, построенными на ней.
+
+    :param names: Имена модулей сценариев или баз.
+    :return: Сценарии слоёв без повторов.
+    :raises ValueError: Если модуль объявляет сценарий, который не строится на базе.
+    """
+    scenarios: dict[str, SeedsOverlayScenario] = {}
+    for name in names:
+        seeds_scenario = load_seeds_scenario_class(name)()
+        if isinstance(seeds_scenario, SeedsBaseScenario):
+            for module in pkgutil.iter_modules(seeds.scenarios.__path__):
+                layer = load_seeds_scenario_class(module.name)()
+                if isinstance(layer, SeedsOverlayScenario) and (layer.base.scenario == seeds_scenario.scenario):
+                    scenarios.setdefault(layer.scenario, layer)
+        elif isinstance(seeds_scenario, SeedsOverlayScenario):
+            scenarios.setdefault(seeds_scenario.scenario, seeds_scenario)
+        else:
+            raise ValueError(f"Сценарий {name} не строится на базовой популяции")
+
+    return list(scenarios.values())
+
+
+def build_seeds_layers(
+        scenarios: Sequence[SeedsOverlayScenario],
+        force: bool = False,
+        processes: int | None = None
+) -> None:
+    """
+    Собирает базу и дампы нескольких сценариев: сначала база дополняется до объединения
+    слоёв всех сценариев (один проход сидинга), затем дампы сценариев собираются из неё.
+
+    :param scenarios: Сценарии с общей базой.
+    :param force: Пересоздать базу независимо от существующего дампа.
+    :param processes: Количество процессов сидинга базы (см. seeds.sharded), None — в текущем процессе.
+    :raises ValueError: Если у сценариев разные базы.
+    """
+    if not scenarios:
+        return
+
+    base = get_seeds_layers_base(scenarios)
+    base.require(get_seeds_layers_plan(scenarios), force=force, processes=processes)
+    for seeds_scenario in scenarios:
+        seeds_scenario.derive(base)
+
+
+def estimate_seeds_layers(scenarios: Sequence[SeedsOverlayScenario]) -> SeedsPlanEstimate:
+    """
+    Оценивает сидинг, который выполнит build_seeds_layers: дополнение существующего дампа базы
+    до объединения слоёв (или сидинг базы с нуля, если дамп нельзя дополнить).
+    Сборка дампов сценариев из базы вызовов gateway не требует.
+
+    :param scenarios: Сценарии с общей базой.
+    :return: Оценка без измеренной скорости.
+    """
+    base = get_seeds_layers_base(scenarios)
+    base.cover(get_seeds_layers_plan(scenarios))
+
+    if base.is_dump_actual():
+        return SeedsPlanEstimate(users=0, methods=[])
+
+    if base.is_dump_extendable():
+        return estimate_seeds_top_up(plan=base.plan, built=load_seeds_meta(scenario=base.scenario).plan)
+
+    return estimate_seeds_plan(base.plan)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Сидинг общей базы и сценариев поверх неё")
+    parser.add_argument("scenarios", nargs="+", help="Имена модулей сценариев (или базы) в seeds/scenarios")
+    parser.add_argument("--dry-run", action="store_true", help="Только сравнить количество вызовов gateway")
+    parser.add_argument("--processes", type=int, default=None, help="Количество процессов сидинга базы")
+    parser.add_argument("--force", action="store_true", help="Пересоздать базу независимо от дампа")
+    args = parser.parse_args()
+
+    # Сценарии наследуют классы модуля seeds.layers, а не __main__, поэтому isinstance в load_seeds_layers
+    # должен использовать их
+    from seeds.layers import build_seeds_layers, estimate_seeds_layers, get_seeds_layers_plan, load_seeds_layers
+
+    layers = load_seeds_layers(args.scenarios)
+    if args.dry_run:
+        separate = sum(estimate_seeds_plan(seeds_scenario.plan).rpcs for seeds_scenario in layers)
+        layered = estimate_seeds_plan(get_seeds_layers_plan(layers))
+        top_up = estimate_seeds_layers(layers)
+        print(f"Отдельные популяции: {separate} вызовов gateway")
+        print(f"Общая база с нуля: {layered.users} пользователей, {layered.rpcs} вызовов gateway")
+        print(f"Общая база по текущему дампу: {top_up.users} новых пользователей, {top_up.rpcs} вызовов gateway")
+
+        if layered.rpcs >= separate:
+            print("Общая база не дешевле отдельных популяций: проверьте offset и слои сценариев")
+            sys.exit(1)
+    else:
+        build_seeds_layers(layers, force=args.force, processes=args.processes)
@@ -0,0 +1,252 @@
+import logging
+from typing import Sequence
+
+from locust.env import Environment
+from locust.rpc import Message
+from locust.runners import MasterRunner, WorkerRunner
+
+from config import settings
+from seeds.allocator import SeedsAllocator
+from seeds.builder import build_locust_grpc_seeds_builder
+from seeds.scenario import SeedsScenario
+from seeds.schema.query import SeedsQuery
+from seeds.schema.result import SeedsResult
+
+logger = logging.getLogger(__name__)
+
+# Тип пользовательского сообщения Locust, которым мастер отправляет воркеру его часть сидов
+SEEDS_SHARD_MESSAGE = "seeds_shard"
+# Тип сообщения, которым воркер запрашивает свой шард, если не получил его к старту теста
+SEEDS_SHARD_REQUEST_MESSAGE = "seeds_shard_request"
+
+
+def init_locust_seeds(
+        environment: Environment,
+        seeds_scenario: SeedsScenario,
+        queries: Sequence[SeedsQuery] = ()
+) -> None:
+    """
+    Подготавливает сиды для запуска Locust и сохраняет их в environment.seeds
+    в виде SeedsAllocator.
+
+    - Локальный запуск: сидинг и загрузка дампа (первые settings.seeds.load_limit пользователей, если задано).
+      При settings.seeds.verify перед загрузкой сиды проверяются на gateway (см. SeedsScenario.verify).
+    - Мастер (--master): сидинг выполняется один раз, а при старте теста пользователи
+      делятся на непересекающиеся шарды и рассылаются воркерам через custom messages.
+    - Воркер (--worker): сидинг не выполняется, воркер ждёт свой шард от мастера.
+
+    Мастер отправляет шарды в обработчике test_start, то есть до сообщений spawn,
+    поэтому к моменту запуска виртуальных пользователей шард на воркере уже загружен.
+    Воркеры, подключившиеся во время теста, тоже получают шард (см. init_locust_seeds_shards).
+
+    При settings.seeds.store == "redis" вместо SeedsAllocator используется общее хранилище
+    в Redis (см. init_locust_seeds_store), и шарды воркерам не рассылаются.
+
+    Если задан settings.seeds.replenish_min_free, пул пополняется в фоне на время теста
+    (см. init_locust_seeds_replenishment).
+
+    :param environment: Окружение Locust.
+    :param seeds_scenario: Сценарий сидинга, данные которого нужны нагрузочному сценарию.
+    :param queries: Запросы, по которым SeedsAllocator строит индексы сразу при загрузке сидов,
+        чтобы не строить их при первом обращении из задач сценария.
+    """
+    if settings.seeds.replenish_min_free > 0:
+        init_locust_seeds_replenishment(environment, seeds_scenario)
+
+    if settings.seeds.store == "redis":
+        init_locust_seeds_store(environment, seeds_scenario)
+        return
+
+    if isinstance(environment.runner, WorkerRunner):
+        environment.seeds = SeedsAllocator(users=[], queries=queries)
+        received = []
+
+        def on_seeds_shard(msg: Message, **kwargs):
+            received.append(True)
+            # Шард может прийти и во время теста (перебалансировка): allocator заменяет пользователей на месте,
+            # поэтому текущие аренды сохраняются, а пополнение (см. init_locust_seeds_replenishment)
+            # продолжает добавлять пользователей в тот же пул
+            environment.seeds.replace_users(SeedsResult.model_validate(msg.data).users)
+
+        def on_test_start(environment: Environment, **kwargs):
+            # Шард не пришёл (например, мастер отправил его раньше, чем воркер подключился) — запрашиваем сами
+            if not received:
+                environment.runner.send_message(SEEDS_SHARD_REQUEST_MESSAGE)
+
+        environment.runner.register_message(SEEDS_SHARD_MESSAGE, on_seeds_shard)
+        environment.events.test_start.add_listener(on_test_start)
+        return
+
+    prepare_locust_seeds(seeds_scenario)
+
+    result = seeds_scenario.load(limit=settings.seeds.load_limit)
+    environment.seeds = SeedsAllocator(users=result.users, queries=queries)
+
+    if isinstance(environment.runner, MasterRunner):
+        init_locust_seeds_shards(environment, result)
+
+
+def init_locust_seeds_shards(environment: Environment, result: SeedsResult) -> None:
+    """
+    Рассылает шарды сидов воркерам с мастера.
+
+    - При старте теста пользователи делятся на шарды по числу подключённых воркеров.
+    - Воркер, подключившийся во время теста (сообщение client_ready), получает шард до того,
+      как мастер перебалансирует на него виртуальных пользователей. Ему отдаются шарды
+      отключившихся воркеров, а если таких нет — пользователи заново делятся между всеми воркерами
+      (пользователи, которые сейчас в работе, могут ненадолго оказаться у двух воркеров сразу).
+    - Воркер, не получивший шард к своему test_start, запрашивает его сам (SEEDS_SHARD_REQUEST_MESSAGE).
+
+    :param environment: Окружение Locust с MasterRunner.
+    :param result: Все пользователи сценария.
+    """
+    runner: MasterRunner = environment.runner
+    # Шарды, выданные воркерам в текущем тесте: id воркера -> шард
+    shards: dict[str, SeedsResult] = {}
+
+    def get_workers() -> list[str]:
+        return [worker.id for worker in runner.clients.ready + runner.clients.running + runner.clients.spawning]
+
+    def send_shard(worker_id: str) -> None:
+        runner.send_message(SEEDS_SHARD_MESSAGE, shards[worker_id].model_dump(mode="json"), worker_id)
+
+    def split_shards(workers: list[str]) -> None:
+        shards.clear()
+        shards.update(zip(workers, result.get_shards(len(workers))))
+        for worker_id in workers:
+            send_shard(worker_id)
+
+    def assign_shard(worker_id: str) -> None:
+        if worker_id in shards:
+            send_shard(worker_id)
+            return
+
+        workers = get_workers()
+        orphaned = [worker for worker in shards if worker not in workers]
+        if orphaned:
+            shards[worker_id] = SeedsResult(users=[user for worker in orphaned for user in shards.pop(worker).users])
+            send_shard(worker_id)
+            return
+
+        logger.warning(f"Воркер {worker_id} подключился во время теста: сиды заново делятся между всеми воркерами")
+        split_shards([*workers, worker_id])
+
+    def on_test_start(environment: Environment, **kwargs):
+        split_shards(get_workers())
+
+    def on_test_stop(environment: Environment, **kwargs):
+        shards.clear()
+
+    def on_worker_connect(client_id: str, **kwargs):
+        # До старта теста шарды раздаст on_test_start, а уже получившему шард воркеру повторно слать его не нужно
+        if shards and client_id not in shards:
+            assign_shard(client_id)
+
+    def on_seeds_shard_request(msg: Message, **kwargs):
+        if shards:
+            assign_shard(msg.node_id)
+
+    environment.events.test_start.add_listener(on_test_start)
+    environment.events.test_stop.add_listener(on_test_stop)
+    environment.events.worker_connect.add_listener(on_worker_connect)
+    runner.register_message(SEEDS_SHARD_REQUEST_MESSAGE, on_seeds_shard_request)
+
+
+def prepare_locust_seeds(seeds_scenario: SeedsScenario) -> None:
+    """
+    Выполняет сидинг сценария (или переиспользует дамп) и при settings.seeds.verify проверяет сиды на gateway.
+    """
+    seeds_scenario.build()
+    if settings.seeds.verify:
+        verification = seeds_scenario.verify(
+            sample=settings.seeds.verify_sample,
+            threshold=settings.seeds.verify_threshold,
+            workers=settings.seeds.verify_workers
+        )
+        logger.info(
+            f"Проверка сидов {seeds_scenario.scenario}: живых {verification.alive} из {verification.checked} "
+            f"({verification.live_fraction:.1%})"
+        )
+
+
+def init_locust_seeds_store(environment: Environment, seeds_scenario: SeedsScenario) -> None:
+    """
+    Подключает environment.seeds к общему хранилищу сидов в Redis (settings.seeds.redis_url).
+
+    Локальный процесс и мастер выполняют сидинг и публикуют дамп в хранилище, воркеры только
+    подключаются к нему. Каждый пользователь выдаётся один раз во всём кластере,
+    независимо от количества воркеров и хостов.
+
+    Процессы, запускающие виртуальных пользователей (локальный и воркеры), на время теста
+    продлевают свои аренды (см. RedisSeedsStore.start_heartbeat): аренды живого процесса
+    не истекают, а аренды упавшего возвращаются в пул через settings.seeds.lease_ttl.
+
+    :param environment: Окружение Locust.
+    :param seeds_scenario: Сценарий сидинга.
+    """
+    # redis — необязательная зависимость, нужна только в этом режиме
+    from seeds.store import build_redis_seeds_store
+
+    environment.seeds = build_redis_seeds_store(
+        scenario=seeds_scenario.scenario,
+        url=settings.seeds.redis_url,
+        lease_ttl=settings.seeds.lease_ttl
+    )
+
+    if not isinstance(environment.runner, MasterRunner):
+        def on_test_start(environment: Environment, **kwargs):
+            environment.seeds.start_heartbeat()
+
+        def on_test_stop(environment: Environment, **kwargs):
+            environment.seeds.stop_heartbeat()
+
+        environment.events.test_start.add_listener(on_test_start)
+        environment.events.test_stop.add_listener(on_test_stop)
+
+    if isinstance(environment.runner, WorkerRunner):
+        return
+
+    prepare_locust_seeds(seeds_scenario)
+    seeds_scenario.publish(environment.seeds)
+
+
+def init_locust_seeds_replenishment(environment: Environment, seeds_scenario: SeedsScenario) -> None:
+    """
+    Запускает фоновое пополнение environment.seeds при старте теста и останавливает при завершении.
+
+    - memory: у каждого процесса, запускающего виртуальных пользователей (локальный и воркеры), свой
+      непересекающийся шард, поэтому каждый пополняет свой пул, а порог min_free действует на процесс.
+    - redis: пул общий для кластера, поэтому его пополняет только мастер (или локальный процесс).
+      Если пополняли бы все воркеры, каждый видел бы одну и ту же нехватку, и пользователей
+      создавалось бы в N раз больше нужного.
+
+    Пользователи создаются через build_locust_grpc_seeds_builder, поэтому вызовы пополнения видны
+    в статистике Locust отдельно от вызовов сценария.
+
+    :param environment: Окружение Locust.
+    :param seeds_scenario: Сценарий сидинга, по плану которого создаются новые пользователи.
+    """
+    if settings.seeds.store == "redis":
+        if isinstance(environment.runner, WorkerRunner):
+            return
+    elif isinstance(environment.runner, MasterRunner):
+        return
+
+    replenishers = []
+
+    def on_test_start(environment: Environment, **kwargs):
+        replenishers.append(
+            seeds_scenario.replenish(
+                allocator=environment.seeds,
+                min_free=settings.seeds.replenish_min_free,
+                rate=settings.seeds.replenish_rate,
+                builder=build_locust_grpc_seeds_builder(environment)
+            )
+        )
+
+    def on_test_stop(environment: Environment, **kwargs):
+        while replenishers:
+            replenishers.pop().stop()
+
+    environment.events.test_start.add_listener(on_test_start)
+    environment.events.test_stop.add_listener(on_test_stop)
@@ -0,0 +1,268 @@
+"""
+Оценка стоимости сидинга плана до запуска.
+
+План с count=5000 и вложенными операциями легко превращается в сотни тысяч вызовов gateway.
+Планировщик проходит по дереву SeedsPlan так же, как SeedsBuilder, и считает точное количество
+вызовов каждого метода (количества из распределений выбираются тем же SeedUsersPlan.resolve_accounts,
+поэтому результат совпадает с реальным сидингом). Если задан пробный сидинг, скорость вызовов
+измеряется на нескольких пользователях при заданной параллельности и по ней оценивается время:
+
+    python -m seeds.planner existing_user_get_operations --probe 50 --workers 20 --window 1800
+
+Для сценариев поверх общей базы (seeds.layers) оценивается то, что сидинг выполнит на самом деле:
+дополнение существующего дампа базы до слоёв сценариев (см. estimate_seeds_top_up).
+"""
+import argparse
+import sys
+import time
+from collections import Counter
+
+from seeds.benchmark.runner import SeedsBenchmarkClient, SeedsBenchmarkRecorder
+from seeds.builder import SeedsBuilder
+from seeds.schema.estimate import SeedsPlanEstimate, SeedsRPCEstimate
+from seeds.schema.plan import SeedsPlan, SeedUsersPlan, SEED_COUNT_FIELDS
+from seeds.sharded import load_seeds_scenario_class
+
+# Метод gateway, который SeedsBuilder вызывает для каждой сущности плана
+SEED_RPC_METHODS = {
+    "users": "create_user",
+    "deposit_accounts": "open_deposit_account",
+    "savings_accounts": "open_savings_account",
+    "debit_card_accounts": "open_debit_card_account",
+    "credit_card_accounts": "open_credit_card_account",
+    "physical_cards": "issue_physical_card",
+    "virtual_cards": "issue_virtual_card",
+    "top_up_operations": "make_top_up_operation",
+    "purchase_operations": "make_purchase_operation",
+    "transfer_operations": "make_transfer_operation",
+    "cash_withdrawal_operations": "make_cash_withdrawal_operation",
+}
+# Счета, которые билдер наполняет картами и операциями (у депозитных и сберегательных вложенные планы не используются)
+SEED_CARD_ACCOUNT_FIELDS = ("debit_card_accounts", "credit_card_accounts")
+# Метод, которым SeedsBuilder.top_up_user получает карты счетов, если на существующих счетах нужны операции
+SEED_TOP_UP_CARDS_METHOD = "get_accounts"
+
+
+def has_seed_distributions(plan: SeedUsersPlan) -> bool:
+    """
+    Проверяет, заданы ли в плане (или в его диапазонах) распределения количеств
+    (тогда форма пользователей различается).
+    """
+    return any(
+        getattr(getattr(plan, account_field), field).distribution is not None
+        for account_field in SEED_CARD_ACCOUNT_FIELDS
+        for field in SEED_COUNT_FIELDS
+    ) or any(has_seed_distributions(range_plan.plan) for range_plan in plan.ranges)
+
+
+def count_seed_user_rpcs(plan: SeedUsersPlan, index: int = 0) -> Counter:
+    """
+    Считает вызовы gateway, которые SeedsBuilder.build_user выполнит для пользователя с номером index.
+
+    :param plan: План пользователей.
+    :param index: Номер пользователя в плане.
+    :return: Количество вызовов по методам клиента.
+    """
+    plan = plan.at(index)
+    rpcs = Counter({SEED_RPC_METHODS["users"]: 1})
+    for account_field in ("deposit_accounts", "savings_accounts", *SEED_CARD_ACCOUNT_FIELDS):
+        rpcs[SEED_RPC_METHODS[account_field]] += getattr(plan, account_field).count
+
+    for account_field in SEED_CARD_ACCOUNT_FIELDS:
+        for resolved in plan.resolve_accounts(index, account_field):
+            for field in SEED_COUNT_FIELDS:
+                rpcs[SEED_RPC_METHODS[field]] += getattr(resolved, field).count
+
+    return rpcs
+
+
+def count_seed_user_top_up_rpcs(plan: SeedUsersPlan, built: SeedUsersPlan, index: int) -> Counter:
+    """
+    Считает вызовы gateway, которые SeedsBuilder.top_up_user выполнит, дополняя пользователя с номером index,
+    созданного по плану built, до плана plan.
+
+    :param plan: Новый (увеличенный) план пользователей.
+    :param built: План, по которому создан пользователь.
+    :param index: Номер пользователя в плане.
+    :return: Количество вызовов по методам клиента.
+    """
+    plan, built = plan.at(index), built.at(index)
+    rpcs = Counter()
+    for account_field in ("deposit_accounts", "savings_accounts"):
+        missing = getattr(plan, account_field).count - getattr(built, account_field).count
+        rpcs[SEED_RPC_METHODS[account_field]] += max(missing, 0)
+
+    needs_cards = False
+    for account_field in SEED_CARD_ACCOUNT_FIELDS:
+        built_accounts = built.resolve_accounts(index, account_field)
+        for position, resolved in enumerate(plan.resolve_accounts(index, account_field)):
+            if position >= len(built_accounts):
+                rpcs[SEED_RPC_METHODS[account_field]] += 1
+
+            for field in SEED_COUNT_FIELDS:
+                existing = getattr(built_accounts[position], field).count if position < len(built_accounts) else 0
+                missing = max(getattr(resolved, field).count - existing, 0)
+                rpcs[SEED_RPC_METHODS[field]] += missing
+                needs_cards = needs_cards or (
+                    position < len(built_accounts) and field.endswith("_operations") and missing > 0
+                )
+
+    rpcs[SEED_TOP_UP_CARDS_METHOD] += int(needs_cards)
+    return rpcs
+
+
+def build_seeds_estimate(users: int, rpcs: Counter) -> SeedsPlanEstimate:
+    """
+    Собирает оценку из количества вызовов по методам (методы без вызовов не попадают в оценку).
+    """
+    return SeedsPlanEstimate(
+        users=users,
+        methods=[
+            SeedsRPCEstimate(name=name, count=rpcs[name])
+            for name in (*SEED_RPC_METHODS.values(), SEED_TOP_UP_CARDS_METHOD) if rpcs[name] > 0
+        ]
+    )
+
+
+def estimate_seeds_plan(plan: SeedsPlan, count: int | None = None, offset: int = 0) -> SeedsPlanEstimate:
+    """
+    Считает точное количество вызовов gateway, которые выполнит сидинг плана, не обращаясь к gateway.
+
+    :param plan: План сидинга.
+    :param count: Количество пользователей (по умолчанию plan.users.count).
+    :param offset: Номер первого пользователя (например, при продолжении сидинга).
+    :return: Оценка без измеренной скорости.
+    """
+    count = plan.users.count if count is None else count
+
+    rpcs = Counter()
+    # Внутри отрезка у всех пользователей один план (диапазоны плана не начинаются и не заканчиваются в нём)
+    for start, end in plan.users.split(offset, offset + count):
+        users = plan.users.at(start)
+        if has_seed_distributions(users):
+            for index in range(start, end):
+                rpcs.update(count_seed_user_rpcs(users, index))
+        else:
+            # Без распределений все пользователи отрезка одинаковые — достаточно посчитать одного
+            rpcs.update({name: value * (end - start) for name, value in count_seed_user_rpcs(users, start).items()})
+
+    return build_seeds_estimate(users=count, rpcs=rpcs)
+
+
+def estimate_seeds_top_up(plan: SeedsPlan, built: SeedsPlan) -> SeedsPlanEstimate:
+    """
+    Считает вызовы gateway, которые выполнит дополнение дампа, созданного по плану built, до плана plan
+    (см. SeedsScenario.build_top_up): существующим пользователям досоздаются недостающие сущности,
+    а недостающие пользователи создаются заново.
+
+    :param plan: Новый план (plan.is_extension_of(built)).
+    :param built: План существующего дампа.
+    :return: Оценка без измеренной скорости; users — количество новых пользователей.
+    """
+    built_count = min(built.users.count, plan.users.count)
+
+    rpcs = Counter()
+    for start, end in plan.users.split(0, built_count, built.users):
+        users, built_users = plan.users.at(start), built.users.at(start)
+        if has_seed_distributions(users) or has_seed_distributions(built_users):
+            for index in range(start, end):
+                rpcs.update(count_seed_user_top_up_rpcs(users, built_users, index))
+        else:
+            # Без распределений все существующие пользователи отрезка дополняются одинаково
+            rpcs.update({
+                name: value * (end - start)
+                for name, value in count_seed_user_top_up_rpcs(users, built_users, start).items()
+            })
+
+    created = estimate_seeds_plan(plan, count=plan.users.count - built_count, offset=built_count)
+    rpcs.update({method.name: method.count for method in created.methods})
+
+    return build_seeds_estimate(users=created.users, rpcs=rpcs)
+
+
+def calibrate_seeds_rate(builder: SeedsBuilder, plan: SeedUsersPlan, users: int, workers: int) -> float:
+    """
+    Измеряет скорость вызовов gateway пробным сидингом нескольких пользователей плана.
+
+    Пробные пользователи реально создаются на gateway (с номерами после plan.count, чтобы
+    их форма соответствовала распределениям плана), но в дамп не попадают.
+    Для устойчивого результата users должно быть заметно больше workers.
+
+    :param builder: Билдер сценария — используются его клиенты gateway.
+    :param plan: План пользователей.
+    :param users: Количество пробных пользователей.
+    :param workers: Параллельность, для которой оценивается время сидинга.
+    :return: Количество вызовов gateway в секунду.
+    """
+    recorder = SeedsBenchmarkRecorder()
+    probe_builder = SeedsBuilder(
+        users_gateway_client=SeedsBenchmarkClient(builder.users_gateway_client, recorder),
+        cards_gateway_client=SeedsBenchmarkClient(builder.cards_gateway_client, recorder),
+        accounts_gateway_client=SeedsBenchmarkClient(builder.accounts_gateway_client, recorder),
+        operations_gateway_client=SeedsBenchmarkClient(builder.operations_gateway_client, recorder),
+        workers=workers
+    )
+
+    started_at = time.perf_counter()
+    for _ in probe_builder.iter_users(plan=plan, count=users, offset=plan.count):
+        pass
+    elapsed = time.perf_counter() - started_at
+
+    return recorder.count / elapsed
+
+
+def estimate_seeds_scenario(name: str, probe: int = 0, workers: int | None = None) -> SeedsPlanEstimate:
+    """
+    Оценивает сидинг сценария: количество вызовов по плану и, если задан пробный сидинг, время.
+
+    :param name: Имя модуля сценария в seeds/scenarios.
+    :param probe: Количество пробных пользователей для измерения скорости (0 — без измерения).
+    :param workers: Параллельность сидинга (по умолчанию параллельность билдера сценария).
+    :return: Оценка стоимости сидинга.
+    """
+    # seeds.layers сам импортирует этот модуль, поэтому импортируется при вызове
+    from seeds.layers import SeedsBaseScenario, SeedsOverlayScenario, estimate_seeds_layers, load_seeds_layers
+
+    seeds_scenario = load_seeds_scenario_class(name)()
+    if isinstance(seeds_scenario, (SeedsBaseScenario, SeedsOverlayScenario)):
+        # Пользователей создаёт только база: оценивается её дополнение до слоёв сценариев
+        layers = load_seeds_layers([name])
+        estimate = estimate_seeds_layers(layers)
+        seeds_scenario = layers[0].base
+    else:
+        estimate = estimate_seeds_plan(seeds_scenario.plan)
+
+    workers = seeds_scenario.builder.workers if workers is None else workers
+    if probe > 0:
+        estimate.workers = workers
+        estimate.rpcs_per_second = calibrate_seeds_rate(
+            builder=seeds_scenario.builder,
+            plan=seeds_scenario.plan.users,
+            users=probe,
+            workers=workers
+        )
+
+    return estimate
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Оценка стоимости сидинга сценария")
+    parser.add_argument("scenario", help="Имя модуля сценария в seeds/scenarios")
+    parser.add_argument("--probe", type=int, default=0, help="Количество пробных пользователей для замера скорости")
+    parser.add_argument("--workers", type=int, default=None, help="Параллельность сидинга")
+    parser.add_argument("--window", type=float, default=None, help="Допустимое время сидинга, секунды")
+    args = parser.parse_args()
+
+    result = estimate_seeds_scenario(name=args.scenario, probe=args.probe, workers=args.workers)
+
+    print(f"{args.scenario}: {result.users} пользователей, {result.rpcs} вызовов gateway")
+    for method in result.methods:
+        print(f"  {method.name:<32} {method.count:>10}")
+
+    if result.seconds is not None:
+        print(f"Скорость при workers={result.workers}: {result.rpcs_per_second:.1f} rpc/s, "
+              f"ожидаемое время: {result.seconds:.0f} с")
+
+        if (args.window is not None) and (result.seconds > args.window):
+            print(f"Сидинг не укладывается в окно {args.window:.0f} с")
+            sys.exit(1)
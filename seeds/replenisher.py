@@ -0,0 +1,105 @@
+import logging
+import time
+from typing import TYPE_CHECKING
+
+import gevent
+
+from seeds.allocator import SeedsAllocator
+from seeds.builder import SeedsBuilder
+from seeds.schema.plan import SeedUsersPlan
+
+if TYPE_CHECKING:
+    # redis нужен только при settings.seeds.store == "redis"
+    from seeds.store import RedisSeedsStore
+
+logger = logging.getLogger(__name__)
+
+
+class SeedsReplenisher:
+    """
+    Фоновое пополнение пула сидинговых пользователей во время теста.
+
+    Гринлет следит за количеством свободных пользователей в SeedsAllocator и, когда оно
+    опускается ниже min_free, создаёт новых пользователей через SeedsBuilder.build_user
+    по тому же плану, что и исходный сидинг.
+
+    Во время теста билдер создаётся через build_locust_grpc_seeds_builder: вызовы попадают
+    в статистику Locust с отдельным типом запроса (SEEDS_REQUEST_TYPE). Скорость создания ограничена rate
+    пользователями в секунду — то есть нагрузка на gateway не превышает
+    rate × (количество вызовов на одного пользователя плана) RPC в секунду.
+
+    Пул может быть как SeedsAllocator процесса, так и общим RedisSeedsStore: нужны только
+    free_count и add_users.
+
+    Attributes:
+        created_count (int): Сколько пользователей создано и добавлено в пул.
+        failed_count (int): Сколько попыток создать пользователя завершились ошибкой.
+    """
+
+    def __init__(
+            self,
+            allocator: "SeedsAllocator | RedisSeedsStore",
+            builder: SeedsBuilder,
+            plan: SeedUsersPlan,
+            min_free: int,
+            rate: float = 1.0,
+            check_interval: float = 1.0
+    ):
+        """
+        :param allocator: Пул пользователей (SeedsAllocator или RedisSeedsStore), который нужно пополнять.
+        :param builder: Билдер для создания пользователей.
+        :param plan: План создания одного пользователя.
+        :param min_free: Порог свободных пользователей, ниже которого начинается пополнение.
+        :param rate: Максимальная скорость создания пользователей (пользователей в секунду).
+        :param check_interval: Пауза между проверками пула, когда пополнение не требуется (секунды).
+        """
+        self.allocator = allocator
+        self.builder = builder
+        self.plan = plan
+        self.min_free = min_free
+        self.rate = rate
+        self.check_interval = check_interval
+
+        self.greenlet: gevent.Greenlet | None = None
+        self.created_count = 0
+        self.failed_count = 0
+
+    def start(self) -> None:
+        """
+        Запускает фоновый гринлет пополнения (повторный вызов ничего не делает).
+        """
+        if self.greenlet is None or self.greenlet.dead:
+            self.greenlet = gevent.spawn(self.run)
+
+    def stop(self) -> None:
+        """
+        Останавливает фоновый гринлет пополнения.
+        """
+        if self.greenlet is not None:
+            self.greenlet.kill()
+            self.greenlet = None
+
+    def run(self) -> None:
+        """
+        Основной цикл: пока свободных пользователей меньше порога, создаёт их по одному
+        не чаще rate в секунду, иначе ждёт check_interval.
+        """
+        while True:
+            if self.allocator.free_count >= self.min_free:
+                gevent.sleep(self.check_interval)
+                continue
+
+            started_at = time.perf_counter()
+            try:
+                # Номера после пользователей дампа, чтобы формы счетов из распределений не повторялись
+                user = self.builder.build_user(
+                    plan=self.plan, index=self.plan.count + self.created_count + self.failed_count
+                )
+                self.allocator.add_users([user])
+                self.created_count += 1
+            except Exception as error:
+                # Ошибка пополнения не должна останавливать тест — пробуем снова после паузы
+                self.failed_count += 1
+                logger.warning(f"Не удалось создать сидингового пользователя: {error}")
+
+            gevent.sleep(max(1 / self.rate - (time.perf_counter() - started_at), 0))
@@ -1,9 +1,47 @@
+import hashlib
+import os
 from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from itertools import islice
+from typing import Iterable, Iterator, TYPE_CHECKING
 
-from seeds.builder import build_grpc_seeds_builder
-from seeds.dumps import save_seeds_result, load_seeds_result
+from config import settings
+from seeds.builder import SeedsBuilder, build_grpc_seeds_builder
+from seeds.dumps import (
+    save_seeds_result,
+    save_seeds_meta,
+    load_seeds_meta,
+    clear_seeds_stream,
+    repair_seeds_stream,
+    replace_seeds_stream,
+    sort_seeds_stream,
+    seeds_result_exists,
+    append_seed_user_results,
+    get_seeds_binary_path,
+    get_seeds_stream_path,
+    get_seeds_result_path,
+    save_seeds_result_binary,
+    load_seeds_result_binary,
+    iter_seed_user_results
+)
+from seeds.allocator import SeedsAllocator
+from seeds.binary import SeedsBinaryResult
+from seeds.replenisher import SeedsReplenisher
+from seeds.verifier import SeedsVerifier, SeedsVerificationResult
+from seeds.schema.meta import (
+    SeedsDumpMeta,
+    SeedsRange,
+    chain_seeds_ranges,
+    get_seeds_ranges_size,
+    subtract_seeds_ranges,
+    take_seeds_ranges
+)
 from seeds.schema.plan import SeedsPlan
-from seeds.schema.result import SeedsResult
+from seeds.schema.result import SeedsResult, SeedUserResult
+
+if TYPE_CHECKING:
+    # redis нужен только при settings.seeds.store == "redis"
+    from seeds.store import RedisSeedsStore
 
 
 class SeedsScenario(ABC):
@@ -37,23 +75,390 @@ class SeedsScenario(ABC):
         """
         ...
 
+    @property
+    def harvest(self) -> str | None:
+        """
+        Имя дампа с пользователями, собранными во время нагрузки (см. seeds.harvester).
+        Если задано, сидинг сначала забирает пользователей оттуда и только недостающих создаёт заново.
+        Дамп должен быть собран на том же gateway.
+        """
+        return settings.seeds.harvest
+
+    @property
+    def gateway_url(self) -> str:
+        """
+        Адрес gateway, на котором билдер создаёт данные.
+        Входит в отпечаток дампа: данные одного стенда не переиспользуются на другом.
+        """
+        return settings.gateway_grpc_client.client_url
+
+    @property
+    def fingerprint(self) -> str:
+        """
+        Отпечаток сидинга — sha256 от плана и адреса gateway.
+        Совпадение отпечатков означает, что дамп построен по тому же плану на том же стенде.
+        """
+        payload = f"{self.plan.model_dump_json()}|{self.gateway_url}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def is_dump_actual(self) -> bool:
+        """
+        Проверяет, можно ли переиспользовать существующий дамп:
+        - файл дампа и его метаданные существуют, сидинг завершён,
+        - отпечаток плана совпадает с текущим,
+        - возраст дампа не превышает settings.seeds.max_age (если задан).
+        """
+        meta = load_seeds_meta(scenario=self.scenario)
+        if (meta is None) or (not seeds_result_exists(self.scenario)):
+            return False
+
+        return meta.completed and (meta.fingerprint == self.fingerprint) and self.is_meta_fresh(meta)
+
+    def is_meta_fresh(self, meta: SeedsDumpMeta) -> bool:
+        """
+        Проверяет, что возраст дампа не превышает settings.seeds.max_age (если задан).
+        """
+        max_age = settings.seeds.max_age
+        age = (datetime.now(timezone.utc) - meta.created_at).total_seconds()
+        return (max_age is None) or (age <= max_age)
+
+    def is_dump_extendable(self) -> bool:
+        """
+        Проверяет, можно ли дополнить существующий дамп до текущего плана вместо полного пересоздания:
+        - дамп завершён, не устарел и создан на том же gateway,
+        - текущий план получен из плана дампа только увеличением количеств (SeedsPlan.is_extension_of).
+        """
+        meta = load_seeds_meta(scenario=self.scenario)
+        if (meta is None) or (not seeds_result_exists(self.scenario)):
+            return False
+
+        if (not meta.completed) or (meta.gateway_url != self.gateway_url) or (not self.is_meta_fresh(meta)):
+            return False
+
+        return self.plan.is_extension_of(meta.plan)
+
+    def save_meta(self, completed: bool, built_ranges: list[SeedsRange] | None = None) -> None:
+        """
+        Сохраняет метаданные дампа (отпечаток плана, время и признак завершения сидинга).
+        :param completed: Сидинг завершён и дамп можно переиспользовать.
+        :param built_ranges: Номера пользователей плана, которые уже есть в незавершённом дампе
+                             (см. SeedsDumpMeta.built_ranges).
+        """
+        save_seeds_meta(
+            meta=SeedsDumpMeta(
+                plan=self.plan,
+                created_at=datetime.now(timezone.utc),
+                completed=completed,
+                fingerprint=self.fingerprint,
+                gateway_url=self.gateway_url,
+                built_ranges=built_ranges or []
+            ),
+            scenario=self.scenario
+        )
+
     def save(self, result: SeedsResult) -> None:
         """
-        Сохраняет результат сидинга в файл.
+        Сохраняет результат сидинга в файл вместе с метаданными (отпечаток плана и время создания).
         :param result: Объект SeedsResult, содержащий сгенерированные данные.
         """
         save_seeds_result(result=result, scenario=self.scenario)
+        self.save_meta(completed=True)
+
+    def load(
+            self,
+            offset: int = 0,
+            limit: int | None = None,
+            shard_index: int = 0,
+            shard_count: int = 1
+    ) -> SeedsResult | SeedsBinaryResult:
+        """
+        Загружает результаты сидинга из файла — целиком или только нужную часть.
+
+        Выборка: окно [offset, offset + limit), затем шард shard_index из shard_count внутри окна.
+        При settings.seeds.dump_format == "binary" дамп открывается через mmap,
+        и пользователи собираются по запросу, иначе в SeedsResult разбирается только выбранная часть.
+        :param offset: Сколько пользователей пропустить с начала дампа.
+        :param limit: Максимальное количество пользователей в окне (None — до конца дампа).
+        :param shard_index: Номер шарда внутри окна.
+        :param shard_count: Количество шардов.
+        :return: Объект SeedsResult (или SeedsBinaryResult), содержащий данные, загруженные из файла.
+        """
+        if settings.seeds.dump_format == "binary":
+            return load_seeds_result_binary(scenario=self.scenario).select(
+                offset=offset, limit=limit, shard_index=shard_index, shard_count=shard_count
+            )
 
-    def load(self) -> SeedsResult:
+        return SeedsResult(
+            users=list(self.iter_users(offset=offset, limit=limit, shard_index=shard_index, shard_count=shard_count))
+        )
+
+    def iter_users(
+            self,
+            offset: int = 0,
+            limit: int | None = None,
+            shard_index: int = 0,
+            shard_count: int = 1
+    ) -> Iterator[SeedUserResult]:
         """
-        Загружает результаты сидинга из файла.
-        :return: Объект SeedsResult, содержащий данные, загруженные из файла.
+        Лениво перебирает пользователей из дампа, не загружая весь SeedsResult в память.
+        Параметры выборки такие же, как у load.
+        :return: Итератор по SeedUserResult в порядке дампа.
         """
-        return load_seeds_result(scenario=self.scenario)
+        if settings.seeds.dump_format == "binary":
+            yield from self.load(offset=offset, limit=limit, shard_index=shard_index, shard_count=shard_count)
+            return
+
+        yield from iter_seed_user_results(
+            scenario=self.scenario, offset=offset, limit=limit, shard_index=shard_index, shard_count=shard_count
+        )
 
-    def build(self) -> None:
+    def replenish(
+            self,
+            allocator: "SeedsAllocator | RedisSeedsStore",
+            min_free: int,
+            rate: float = 1.0,
+            builder: SeedsBuilder | None = None
+    ) -> SeedsReplenisher:
+        """
+        Запускает фоновое пополнение пула пользователей по плану сценария.
+        Используется в длительных тестах, которые расходуют сидинговых пользователей.
+
+        :param allocator: Пул пользователей, загруженный из дампа сценария, или общее хранилище в Redis.
+        :param min_free: Порог свободных пользователей, ниже которого создаются новые.
+        :param rate: Максимальная скорость создания пользователей (пользователей в секунду).
+        :param builder: Сидер для создания пользователей (по умолчанию — сидер сценария, без метрик Locust).
+        :return: Запущенный SeedsReplenisher (для остановки и чтения счётчиков).
+        """
+        replenisher = SeedsReplenisher(
+            allocator=allocator,
+            builder=builder or self.builder,
+            plan=self.plan.users,
+            min_free=min_free,
+            rate=rate
+        )
+        replenisher.start()
+        return replenisher
+
+    def publish(self, store: "RedisSeedsStore") -> None:
+        """
+        Публикует пользователей дампа в общее хранилище для распределённого запуска.
+        Отпечаток публикации включает время создания дампа, поэтому пересозданный или исправленный
+        (см. verify) дамп публикуется заново, а повторный запуск с тем же дампом хранилище не трогает.
+
+        :param store: Хранилище сидов в Redis.
+        """
+        meta = load_seeds_meta(scenario=self.scenario)
+        fingerprint = self.fingerprint if meta is None else f"{meta.fingerprint}:{meta.created_at.isoformat()}"
+        store.publish(users=self.iter_users(), fingerprint=fingerprint)
+
+    def verify(
+            self,
+            sample: int | None = None,
+            threshold: float = 0.0,
+            workers: int = 50
+    ) -> SeedsVerificationResult:
+        """
+        Проверяет, что пользователи дампа существуют на gateway, и восстанавливает дамп.
+
+        - Доля живых пользователей ниже threshold — дамп пересоздаётся полностью
+          (например, база gateway была сброшена).
+        - Иначе неживые пользователи удаляются из дампа, и сидинг продолжается
+          как прерванный: пользователи создаются заново на номерах удалённых, и дамп
+          снова упорядочивается по номерам, поэтому остальные пользователи не сдвигаются
+          и сохраняют форму данных своих номеров.
+
+        :param sample: Сколько случайных пользователей проверить (None — всех).
+        :param threshold: Минимальная доля живых пользователей.
+        :param workers: Количество пользователей, проверяемых одновременно.
+        :return: Результат проверки.
+        """
+        users = self.load()
+        try:
+            result = SeedsVerifier(builder=self.builder, workers=workers).verify(users=users.users, sample=sample)
+        finally:
+            if isinstance(users, SeedsBinaryResult):
+                users.close()
+
+        if result.live_fraction < threshold:
+            self.build(force=True)
+        elif result.dead_user_ids:
+            dead_user_ids = set(result.dead_user_ids)
+            # В завершённом дампе номер пользователя в плане — его позиция. Номера живых пользователей
+            # сохраняются в метаданных, чтобы продолжение сидинга создало неживых заново на их же номерах
+            built_ranges: list[SeedsRange] = []
+
+            def iter_alive_users():
+                for index, user in enumerate(iter_seed_user_results(scenario=self.scenario)):
+                    if user.user_id not in dead_user_ids:
+                        built_ranges.append((index, index + 1))
+                        yield user
+
+            replace_seeds_stream(users=iter_alive_users(), scenario=self.scenario)
+            self.save_meta(completed=False, built_ranges=chain_seeds_ranges(built_ranges))
+            self.build()
+
+        return result
+
+    def build(self, force: bool = False) -> None:
         """
         Генерирует данные с помощью билдера, используя план сидинга, и сохраняет результат.
+
+        Пользователи пишутся в потоковый дамп по мере создания. Если предыдущий сидинг
+        с тем же отпечатком был прерван, он продолжается с последнего записанного пользователя.
+        Если уже существует актуальный дамп (см. is_dump_actual), сидинг пропускается,
+        а если план только вырос относительно дампа (см. is_dump_extendable) — дамп дополняется.
+        :param force: Пересоздать данные независимо от существующего дампа
+                      (также включается через settings.seeds.force_rebuild).
+        """
+        force = force or settings.seeds.force_rebuild
+        if (not force) and self.is_dump_actual():
+            if not self.is_binary_actual():
+                save_seeds_result_binary(scenario=self.scenario)
+        elif (not force) and self.is_dump_extendable():
+            self.build_top_up()
+        else:
+            self.build_stream(force=force)
+
+    def is_binary_actual(self) -> bool:
+        """
+        Проверяет, нужен ли бинарный дамп и не устарел ли он относительно основного дампа.
+        """
+        if settings.seeds.dump_format != "binary":
+            return True
+
+        path = get_seeds_binary_path(self.scenario)
+        source = get_seeds_stream_path(self.scenario)
+        if not os.path.exists(source):
+            source = get_seeds_result_path(self.scenario)
+
+        return os.path.exists(path) and (os.path.getmtime(path) >= os.path.getmtime(source))
+
+    def build_top_up(self) -> None:
+        """
+        Дополняет существующий дамп до текущего плана: существующим пользователям досоздаются
+        недостающие счета, карты и операции, затем добавляются новые пользователи
+        (сначала собранные во время нагрузки, см. load_harvested_users).
+
+        Новый дамп пишется во временный файл и заменяет прежний только целиком, а метаданные
+        обновляются в конце — при сбое остаётся прежний дамп, и дополнение можно повторить.
+        """
+        meta = load_seeds_meta(scenario=self.scenario)
+        built = meta.plan.users.count
+        harvested = self.load_harvested_users(self.plan.users.count - built)
+
+        def iter_users() -> Iterator[SeedUserResult]:
+            yield from self.builder.iter_top_up_users(
+                users=iter_seed_user_results(scenario=self.scenario), plan=self.plan.users
+            )
+            yield from self.iter_harvested_users(harvested, range(built, built + len(harvested)))
+            yield from self.builder.iter_users(
+                plan=self.plan.users,
+                count=self.plan.users.count - built - len(harvested),
+                offset=built + len(harvested)
+            )
+
+        replace_seeds_stream(users=iter_users(), scenario=self.scenario)
+        # Дамп сценария заменён целиком — собранные пользователи теперь в нём
+        self.drop_harvested_users(len(harvested))
+
+        if settings.seeds.dump_format == "binary":
+            save_seeds_result_binary(scenario=self.scenario)
+
+        self.save_meta(completed=True)
+
+    def load_harvested_users(self, count: int) -> list[SeedUserResult]:
+        """
+        Читает из дампа harvest до count первых пользователей, не удаляя их оттуда.
+        Удалить их нужно после того, как они записаны в дамп сценария (см. drop_harvested_users).
+
+        :param count: Сколько пользователей нужно.
+        :return: Собранные пользователи (могут не соответствовать плану — их нужно дополнить).
         """
-        result = self.builder.build(self.plan)
-        self.save(result)
+        if (self.harvest is None) or (count <= 0) or (not os.path.exists(get_seeds_stream_path(self.harvest))):
+            return []
+
+        repair_seeds_stream(scenario=self.harvest)
+        return list(islice(iter_seed_user_results(scenario=self.harvest), count))
+
+    def drop_harvested_users(self, count: int) -> None:
+        """
+        Удаляет из дампа harvest первых count пользователей, уже записанных в дамп сценария,
+        чтобы они не достались другому сценарию.
+
+        :param count: Сколько пользователей из load_harvested_users записано в дамп сценария.
+        """
+        if count <= 0:
+            return
+
+        replace_seeds_stream(
+            users=islice(iter_seed_user_results(scenario=self.harvest), count, None),
+            scenario=self.harvest
+        )
+
+    def iter_harvested_users(self, users: list[SeedUserResult], indexes: Iterable[int]) -> Iterator[SeedUserResult]:
+        """
+        Дополняет собранных пользователей до плана так же, как пользователей дампа при его дополнении.
+
+        :param users: Пользователи из load_harvested_users.
+        :param indexes: Номера в плане, которые они получают.
+        :return: Итератор дополненных пользователей в порядке users.
+        """
+        return self.builder.imap(
+            lambda item: self.builder.top_up_user(user=item[1], plan=self.plan.users, index=item[0]),
+            zip(indexes, users)
+        )
+
+    def build_stream(self, force: bool) -> None:
+        """
+        Создаёт (или продолжает) потоковый дамп по плану сценария.
+        Если задан harvest, сначала используются собранные во время нагрузки пользователи (см. load_harvested_users).
+        При settings.seeds.dump_format == "binary" по завершении дамп конвертируется в бинарный формат.
+        :param force: Не продолжать прерванный сидинг, а начать заново.
+        """
+        meta = load_seeds_meta(scenario=self.scenario)
+        resume = (not force) and (meta is not None) and (not meta.completed) and (meta.fingerprint == self.fingerprint)
+
+        if resume:
+            built_ranges = meta.get_built_ranges(repair_seeds_stream(scenario=self.scenario))
+        else:
+            built_ranges = []
+            # Метаданные незавершённого сидинга: дамп не считается актуальным, но его можно продолжить
+            self.save_meta(completed=False)
+            clear_seeds_stream(scenario=self.scenario)
+
+        # Недостающие номера создаются по порядку — так, как их ожидает SeedsDumpMeta.get_built_ranges
+        missing = subtract_seeds_ranges(self.plan.users.count, built_ranges)
+        # Номера пользователей в порядке строк дампа после сидинга
+        order = built_ranges + missing
+        harvested = self.load_harvested_users(get_seeds_ranges_size(missing))
+        harvested_ranges, missing = take_seeds_ranges(missing, len(harvested))
+
+        appended = 0
+
+        def iter_harvested() -> Iterator[SeedUserResult]:
+            nonlocal appended
+            indexes = (index for start, end in harvested_ranges for index in range(start, end))
+            for user in self.iter_harvested_users(harvested, indexes):
+                yield user
+                # Генератор продолжается после записи пользователя в дамп сценария
+                appended += 1
+
+        try:
+            append_seed_user_results(users=iter_harvested(), scenario=self.scenario)
+        finally:
+            # Из дампа harvest удаляются только записанные пользователи: при сбое остальные
+            # останутся там, а записанные не достанутся при продолжении ещё раз
+            self.drop_harvested_users(appended)
+
+        def iter_users() -> Iterator[SeedUserResult]:
+            for start, end in missing:
+                yield from self.builder.iter_users(plan=self.plan.users, count=end - start, offset=start)
+
+        append_seed_user_results(users=iter_users(), scenario=self.scenario)
+        # При продолжении недостающие номера дописаны после уже созданных — возвращаем порядок плана
+        sort_seeds_stream(scenario=self.scenario, ranges=order)
+
+        if settings.seeds.dump_format == "binary":
+            save_seeds_result_binary(scenario=self.scenario)
+
+        self.save_meta(completed=True)
@@ -0,0 +1,30 @@
+from seeds.layers import SeedsBaseScenario
+from seeds.schema.plan import SeedsPlan, SeedUsersPlan, SeedAccountsPlan
+
+# Диапазоны пользователей базы (SeedsOverlayScenario.offset). Сценарии, которые только читают данные
+# (existing_user_get_documents, existing_user_get_operations), делят первых 300 пользователей.
+# Сценарии, которые изменяют пользователей во время нагрузки, получают свои диапазоны после них.
+MAKE_PURCHASE_OPERATION_OFFSET = 300  # 300 пользователей: покупки меняют баланс и операции счёта
+ISSUE_VIRTUAL_CARD_OFFSET = 600  # 300 пользователей: у них появляются новые карты
+
+
+class BaseSeedsScenario(SeedsBaseScenario):
+    """
+    Базовая популяция для сценариев existing_user_*.
+    Каждый пользователь получает дебетовый и кредитный счёт — то, что нужно почти всем сценариям.
+    Количество пользователей и остальные сущности добавляются слоями сценариев.
+
+    Сидинг базы вместе с дампами всех сценариев на ней: python -m seeds.layers base
+    """
+
+    def __init__(self):
+        super().__init__(
+            plan=SeedsPlan(
+                users=SeedUsersPlan(
+                    debit_card_accounts=SeedAccountsPlan(count=1),  # Дебетовый счёт на пользователя
+                    credit_card_accounts=SeedAccountsPlan(count=1)  # Кредитный счёт на пользователя
+                ),
+            ),
+            scenario="base"
+        )
+
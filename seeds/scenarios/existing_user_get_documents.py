@@ -1,24 +1,39 @@
-from seeds.scenario import SeedsScenario
+from functools import cached_property
+
+from seeds.layers import SeedsOverlayScenario, SeedsBaseScenario
+from seeds.scenarios.base import BaseSeedsScenario
 from seeds.schema.plan import SeedsPlan, SeedUsersPlan, SeedAccountsPlan
+from seeds.schema.query import SeedsQuery
+
+# Запросы, по которым нагрузочный сценарий выбирает пользователя и его счета:
+# сберегательный счёт добавляет слой сценария, дебетовый счёт есть в базе
+SAVINGS_ACCOUNT_QUERY = SeedsQuery(account="savings_accounts")
+DEBIT_CARD_ACCOUNT_QUERY = SeedsQuery(account="debit_card_accounts")
 
 
-class ExistingUserGetDocumentsSeedsScenario(SeedsScenario):
+class ExistingUserGetDocumentsSeedsScenario(SeedsOverlayScenario):
     """
     Сценарий сидинга для существующего пользователя, который просматривает свои счета и документы.
-    Создаём 100 пользователей, каждому из которых открываются дебетовый и сберегательный счёт.
+    100 пользователей базы, каждому дополнительно к дебетовому счёту базы открывается сберегательный счёт.
     """
 
+    @cached_property
+    def base(self) -> SeedsBaseScenario:
+        """
+        Общая база пользователей сценариев existing_user_*.
+        """
+        return BaseSeedsScenario()
+
     @property
-    def plan(self) -> SeedsPlan:
+    def overlay(self) -> SeedsPlan:
         """
-        Возвращает план сидинга для создания пользователей и их счетов.
-        Мы создаём 100 пользователей, каждый получит дебетовый и сберегательный счёт.
+        Возвращает слой сценария поверх базы.
+        Нужны 100 пользователей, каждому сверх базы нужен сберегательный счёт (дебетовый есть в базе).
         """
         return SeedsPlan(
             users=SeedUsersPlan(
-                count=100,  # Создаём 100 пользователей
+                count=100,  # 100 пользователей базы
                 savings_accounts=SeedAccountsPlan(count=1),  # Сберегательный счёт на пользователя
-                debit_card_accounts=SeedAccountsPlan(count=1)  # Дебетовый счёт на пользователя
             ),
         )
 
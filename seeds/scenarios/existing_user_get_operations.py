@@ -1,21 +1,35 @@
-from seeds.scenario import SeedsScenario
+from functools import cached_property
+
+from seeds.layers import SeedsOverlayScenario, SeedsBaseScenario
+from seeds.scenarios.base import BaseSeedsScenario
 from seeds.schema.plan import SeedsPlan, SeedUsersPlan, SeedAccountsPlan, SeedOperationsPlan
+from seeds.schema.query import SeedsQuery
+
+# Запрос, по которому нагрузочный сценарий выбирает пользователя и счёт: кредитный счёт с покупками
+CREDIT_CARD_ACCOUNT_QUERY = SeedsQuery(account="credit_card_accounts", operation="purchase_operations")
 
 
-class ExistingUserGetOperationsSeedsScenario(SeedsScenario):
+class ExistingUserGetOperationsSeedsScenario(SeedsOverlayScenario):
     """
     Сценарий сидинга для существующего пользователя.
-    Создаём 300 пользователей, каждому из которых открываются кредитный счет, пять операций покупок,
-    1 операцию пополнения и 1 операцию снятия наличных.
+    300 пользователей базы, на кредитном счёте каждого дополнительно пять операций покупок,
+    1 операция пополнения и 1 операция снятия наличных.
     """
 
+    @cached_property
+    def base(self) -> SeedsBaseScenario:
+        """
+        Общая база пользователей сценариев existing_user_*.
+        """
+        return BaseSeedsScenario()
+
     @property
-    def plan(self) -> SeedsPlan:
+    def overlay(self) -> SeedsPlan:
         """
-        Возвращает план сидинга для создания загрузки списка операций по своему кредитному счёту и
+        Возвращает слой сценария для загрузки списка операций по своему кредитному счёту и
         просмотра статистики по этим операциям.
-        Мы создаём 300 пользователей, каждый получит кредитный счет, пять операций покупок,
-        1 операцию пополнения и 1 операцию снятия наличных
+        Нужны 300 пользователей, на кредитном счёте базы — пять операций покупок,
+        1 операция пополнения и 1 операция снятия наличных
         """
         return SeedsPlan(
             users=SeedUsersPlan(
@@ -1,26 +1,46 @@
-from seeds.scenario import SeedsScenario
-from seeds.schema.plan import SeedsPlan, SeedUsersPlan, SeedAccountsPlan
+from functools import cached_property
 
+from seeds.layers import SeedsOverlayScenario, SeedsBaseScenario
+from seeds.scenarios.base import BaseSeedsScenario, ISSUE_VIRTUAL_CARD_OFFSET
+from seeds.schema.plan import SeedsPlan, SeedUsersPlan
+from seeds.schema.query import SeedsQuery
 
-class ExistingUserIssueVirtualCardSeedsScenario(SeedsScenario):
+# Запрос, по которому нагрузочный сценарий выбирает пользователя и счёт для выпуска карты
+DEBIT_CARD_ACCOUNT_QUERY = SeedsQuery(account="debit_card_accounts")
+
+
+class ExistingUserIssueVirtualCardSeedsScenario(SeedsOverlayScenario):
     """
-    Сценарий сидинга для существующего пользователя, который создает счет.
-    Создаём 300 пользователей, каждому из которых открываем дебетовый счет.
+    Сценарий сидинга для существующего пользователя, который выпускает виртуальную карту.
+    Нужны 300 пользователей из своего диапазона базы (см. offset) — дебетовый счёт у них уже есть.
     """
 
+    @cached_property
+    def base(self) -> SeedsBaseScenario:
+        """
+        Общая база пользователей сценариев existing_user_*.
+        """
+        return BaseSeedsScenario()
+
     @property
-    def plan(self) -> SeedsPlan:
+    def overlay(self) -> SeedsPlan:
         """
-        Возвращает план сидинга для создания пользователей и их счетов.
-        Мы создаём 300 пользователей, каждый получит дебетовый счет.
+        Возвращает слой сценария поверх базы.
+        Нужны 300 пользователей, сверх базы ничего не требуется.
         """
         return SeedsPlan(
             users=SeedUsersPlan(
                 count=300,
-                debit_card_accounts=SeedAccountsPlan(count=1),
             ),
         )
 
+    @property
+    def offset(self) -> int:
+        """
+        Сценарий изменяет своих пользователей (выпуск карт), поэтому берёт их из своего диапазона базы.
+        """
+        return ISSUE_VIRTUAL_CARD_OFFSET
+
     @property
     def scenario(self) -> str:
         """
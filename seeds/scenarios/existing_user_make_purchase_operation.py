@@ -1,30 +1,52 @@
-from seeds.scenario import SeedsScenario
+from functools import cached_property
+
+from seeds.layers import SeedsOverlayScenario, SeedsBaseScenario
+from seeds.scenarios.base import BaseSeedsScenario, MAKE_PURCHASE_OPERATION_OFFSET
 from seeds.schema.plan import SeedsPlan, SeedUsersPlan, SeedCardsPlan, SeedAccountsPlan
+from seeds.schema.query import SeedsQuery
+
+# Запрос, по которому нагрузочный сценарий выбирает пользователя и счёт: кредитный счёт с физической картой
+CREDIT_CARD_ACCOUNT_QUERY = SeedsQuery(account="credit_card_accounts", card="physical_cards")
 
 
-class ExistingUserMakePurchaseOperationSeedsScenario(SeedsScenario):
+class ExistingUserMakePurchaseOperationSeedsScenario(SeedsOverlayScenario):
     """
     Сценарий сидинга для существующего пользователя, который выполняет операцию покупки.
-    Создаёт 300 пользователей, открывает кредитный счёт и выдаёт карты.
+    300 пользователей из своего диапазона базы (см. offset), на кредитном счёте каждого дополнительно
+    выпускается физическая карта.
     """
 
+    @cached_property
+    def base(self) -> SeedsBaseScenario:
+        """
+        Общая база пользователей сценариев existing_user_*.
+        """
+        return BaseSeedsScenario()
+
     @property
-    def plan(self) -> SeedsPlan:
+    def overlay(self) -> SeedsPlan:
         """
-        План сидинга, который описывает, сколько пользователей нужно создать
-        и какие именно данные для них генерировать.
-        В данном случае создаём 300 пользователей, каждому даём кредитный счёт и карту.
+        Слой сценария поверх базы: сколько пользователей нужно
+        и какие данные для них генерировать сверх базы.
+        В данном случае 300 пользователей, на кредитном счёте базы — физическая карта.
         """
         return SeedsPlan(
             users=SeedUsersPlan(
                 count=300,  # Количество пользователей
                 credit_card_accounts=SeedAccountsPlan(
-                    count=1,  # Количество счётов на пользователя
+                    count=1,  # Кредитный счёт из базы
                     physical_cards=SeedCardsPlan(count=1)  # Количество физических карт
                 )
             ),
         )
 
+    @property
+    def offset(self) -> int:
+        """
+        Сценарий изменяет своих пользователей (покупки), поэтому берёт их из своего диапазона базы.
+        """
+        return MAKE_PURCHASE_OPERATION_OFFSET
+
     @property
     def scenario(self) -> str:
         """
@@ -0,0 +1,46 @@
+from pydantic import BaseModel, Field
+
+
+class SeedsRPCEstimate(BaseModel):
+    """
+    Количество вызовов одного метода gateway, которые выполнит сидинг плана.
+
+    Attributes:
+        name (str): Метод клиента (например, open_debit_card_account).
+        count (int): Количество вызовов.
+    """
+    name: str
+    count: int
+
+
+class SeedsPlanEstimate(BaseModel):
+    """
+    Оценка стоимости сидинга плана без обращения к gateway.
+
+    Attributes:
+        users (int): Количество пользователей.
+        methods (list[SeedsRPCEstimate]): Количество вызовов по методам gateway.
+        workers (int | None): Параллельность, для которой измерена скорость.
+        rpcs_per_second (float | None): Скорость вызовов, измеренная пробным сидингом.
+    """
+    users: int
+    methods: list[SeedsRPCEstimate] = Field(default_factory=list)
+    workers: int | None = None
+    rpcs_per_second: float | None = None
+
+    @property
+    def rpcs(self) -> int:
+        """
+        Общее количество вызовов gateway.
+        """
+        return sum(method.count for method in self.methods)
+
+    @property
+    def seconds(self) -> float | None:
+        """
+        Ожидаемое время сидинга в секундах (None, если скорость не измерена).
+        """
+        if not self.rpcs_per_second:
+            return None
+
+        return self.rpcs / self.rpcs_per_second
@@ -0,0 +1,130 @@
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+from seeds.schema.plan import SeedsPlan
+
+# Диапазон номеров пользователей плана [start, end)
+SeedsRange = tuple[int, int]
+
+
+def get_seeds_ranges_size(ranges: list[SeedsRange]) -> int:
+    """
+    Возвращает количество номеров во всех диапазонах.
+    """
+    return sum(end - start for start, end in ranges)
+
+
+def union_seeds_ranges(ranges: list[SeedsRange]) -> list[SeedsRange]:
+    """
+    Сортирует диапазоны и склеивает пересекающиеся и соседние.
+    """
+    merged: list[SeedsRange] = []
+    for start, end in sorted(ranges):
+        if start >= end:
+            continue
+
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+
+    return merged
+
+
+def chain_seeds_ranges(ranges: list[SeedsRange]) -> list[SeedsRange]:
+    """
+    Склеивает идущие подряд соседние диапазоны, сохраняя порядок (в отличие от union_seeds_ranges).
+    Используется для номеров в порядке строк дампа.
+    """
+    chained: list[SeedsRange] = []
+    for start, end in ranges:
+        if start >= end:
+            continue
+
+        if chained and chained[-1][1] == start:
+            chained[-1] = (chained[-1][0], end)
+        else:
+            chained.append((start, end))
+
+    return chained
+
+
+def subtract_seeds_ranges(count: int, ranges: list[SeedsRange]) -> list[SeedsRange]:
+    """
+    Возвращает диапазоны номеров из [0, count), которые не входят в ranges.
+    """
+    missing, position = [], 0
+    for start, end in union_seeds_ranges(ranges):
+        if start > position:
+            missing.append((position, min(start, count)))
+
+        position = max(position, end)
+        if position >= count:
+            break
+
+    if position < count:
+        missing.append((position, count))
+
+    return [(start, end) for start, end in missing if start < end]
+
+
+def take_seeds_ranges(ranges: list[SeedsRange], count: int) -> tuple[list[SeedsRange], list[SeedsRange]]:
+    """
+    Делит диапазоны на первые count номеров (по порядку) и остаток.
+    """
+    taken, rest = [], []
+    for start, end in ranges:
+        size = min(max(count, 0), end - start)
+        if size > 0:
+            taken.append((start, start + size))
+            count -= size
+
+        if start + size < end:
+            rest.append((start + size, end))
+
+    return taken, rest
+
+
+class SeedsDumpMeta(BaseModel):
+    """
+    Метаданные дампа сидинга. Хранятся рядом с дампом и позволяют понять,
+    можно ли переиспользовать уже созданные данные вместо повторного сидинга.
+
+    Attributes:
+        fingerprint (str): Хэш плана сидинга вместе с адресом целевого gateway.
+        gateway_url (str): Адрес gateway, на котором были созданы данные.
+        created_at (datetime): Время создания дампа (UTC).
+        plan (SeedsPlan): План, по которому был построен дамп.
+        completed (bool): Сидинг завершён. Незавершённый дамп с тем же отпечатком можно продолжить.
+            Пользователи завершённого дампа упорядочены по номерам плана: номер пользователя — его позиция
+            (на это опираются дополнение дампа и выборка диапазона базы в seeds.layers).
+        built_ranges (list[SeedsRange]): Диапазоны номеров пользователей плана, которые уже есть
+            в незавершённом дампе, в порядке строк дампа. Пользователи, дописанные в дамп после сохранения
+            метаданных, занимают следующие по порядку номера вне этих диапазонов (см. get_built_ranges).
+    """
+    fingerprint: str
+    gateway_url: str
+    created_at: datetime
+    plan: SeedsPlan
+    completed: bool = True
+    built_ranges: list[SeedsRange] = Field(default_factory=list)
+
+    def get_built_ranges(self, built: int) -> list[SeedsRange]:
+        """
+        Возвращает диапазоны номеров пользователей, которые есть в незавершённом дампе, в порядке строк дампа.
+
+        Последовательный сидинг дописывает пользователей по порядку недостающих номеров, поэтому
+        сверх built_ranges в дампе лежат первые (built - размер built_ranges) недостающих номеров.
+        Без built_ranges это обычный непрерывный префикс [0, built).
+
+        :param built: Количество пользователей в дампе (см. repair_seeds_stream).
+        """
+        recorded = chain_seeds_ranges(self.built_ranges)
+        extra = built - get_seeds_ranges_size(recorded)
+        if extra < 0:
+            # Дамп изменён в обход метаданных — считаем его непрерывным префиксом
+            return [(0, built)] if built > 0 else []
+
+        taken, _ = take_seeds_ranges(subtract_seeds_ranges(self.plan.users.count, recorded), extra)
+        return chain_seeds_ranges(recorded + taken)
@@ -1,24 +1,182 @@
-from pydantic import BaseModel, Field
+import random
+from functools import cached_property
+from itertools import accumulate
+from typing import Annotated, Literal
 
+from pydantic import BaseModel, Field, field_validator, model_validator
 
-class SeedCardsPlan(BaseModel):
+
+class SeedRangeDistribution(BaseModel):
+    """
+    Базовая модель распределения, ограниченного отрезком [min, max]: проверяет, что min <= max.
+    Поля min и max объявляются в наследниках: так их порядок в плане (и отпечаток плана) не меняется.
+    """
+
+    @model_validator(mode="after")
+    def check_range(self):
+        if self.max is not None and self.min > self.max:
+            raise ValueError(f"min ({self.min}) больше max ({self.max})")
+
+        return self
+
+
+class SeedUniformDistribution(SeedRangeDistribution):
+    """
+    Равномерное распределение количества на отрезке [min, max].
+    """
+    kind: Literal["uniform"] = "uniform"
+    min: int = Field(default=0, ge=0)
+    max: int = Field(ge=0)
+
+    def sample(self, rng: random.Random) -> int:
+        return rng.randint(self.min, self.max)
+
+
+class SeedZipfDistribution(SeedRangeDistribution):
+    """
+    Распределение Ципфа на отрезке [min, max]: значение min + k - 1 выпадает с вероятностью ∝ 1 / k^exponent.
+    Большинство счетов получают мало сущностей, а редкие — очень много (длинный хвост).
+    """
+    kind: Literal["zipf"] = "zipf"
+    exponent: float = Field(default=1.5, gt=0)
+    min: int = Field(default=0, ge=0)
+    max: int = Field(ge=0)
+
+    @cached_property
+    def cum_weights(self) -> list[float]:
+        return list(accumulate(1 / rank ** self.exponent for rank in range(1, self.max - self.min + 2)))
+
+    def sample(self, rng: random.Random) -> int:
+        return rng.choices(range(self.min, self.max + 1), cum_weights=self.cum_weights)[0]
+
+
+class SeedLognormalDistribution(SeedRangeDistribution):
+    """
+    Логнормальное распределение: округлённое exp(N(mu, sigma)), ограниченное отрезком [min, max].
+    """
+    kind: Literal["lognormal"] = "lognormal"
+    mu: float
+    sigma: float = Field(ge=0)
+    min: int = Field(default=0, ge=0)
+    max: int | None = Field(default=None, ge=0)
+
+    def sample(self, rng: random.Random) -> int:
+        value = max(round(rng.lognormvariate(self.mu, self.sigma)), self.min)
+        return value if self.max is None else min(value, self.max)
+
+
+class SeedHistogramDistribution(BaseModel):
+    """
+    Явная гистограмма: количество -> относительный вес (например, {0: 70, 5: 25, 500: 5}).
+    """
+    kind: Literal["histogram"] = "histogram"
+    buckets: dict[int, float]
+
+    @field_validator("buckets")
+    @classmethod
+    def check_buckets(cls, buckets: dict[int, float]) -> dict[int, float]:
+        if not buckets:
+            raise ValueError("Гистограмма должна содержать хотя бы одно значение")
+
+        if any(count < 0 for count in buckets):
+            raise ValueError(f"Количества гистограммы должны быть неотрицательными: {list(buckets)}")
+
+        if any(weight < 0 for weight in buckets.values()) or sum(buckets.values()) <= 0:
+            raise ValueError(f"Веса гистограммы должны быть неотрицательными и не все нулевыми: {buckets}")
+
+        return buckets
+
+    def sample(self, rng: random.Random) -> int:
+        return rng.choices(list(self.buckets), weights=list(self.buckets.values()))[0]
+
+
+SeedCountDistribution = Annotated[
+    SeedUniformDistribution | SeedZipfDistribution | SeedLognormalDistribution | SeedHistogramDistribution,
+    Field(discriminator="kind")
+]
+
+
+class SeedCountPlan(BaseModel):
+    """
+    Базовый план количества однотипных сущностей на счёте.
+
+    Attributes:
+        count (int): Фиксированное количество.
+        distribution (SeedCountDistribution | None): Распределение, из которого количество
+            выбирается отдельно для каждого счёта. Если задано, count не используется.
+    """
+    count: int = Field(default=0, ge=0)
+    distribution: SeedCountDistribution | None = None
+
+    def get_count(self, rng: random.Random) -> int:
+        """
+        Возвращает количество для одного счёта: фиксированное или выбранное из распределения.
+        """
+        return self.count if self.distribution is None else self.distribution.sample(rng)
+
+    def is_extension_of(self, other: "SeedCountPlan") -> bool:
+        """
+        Проверяет, что план только увеличивает количество относительно other:
+        фиксированное количество не меньше прежнего, а распределение не изменилось.
+        """
+        if self.distribution is None and other.distribution is None:
+            return self.count >= other.count
+
+        return self.distribution == other.distribution
+
+    def union(self, other: "SeedCountPlan") -> "SeedCountPlan":
+        """
+        Возвращает план, покрывающий оба плана: большее фиксированное количество
+        или общее распределение.
+
+        :raises ValueError: Если планы задают разные распределения или распределение и ненулевое количество.
+        """
+        if self.distribution is None and other.distribution is None:
+            return self if self.count >= other.count else other
+
+        if self.distribution == other.distribution:
+            return self
+
+        if other.distribution is None and other.count == 0:
+            return self
+
+        if self.distribution is None and self.count == 0:
+            return other
+
+        raise ValueError(f"Нельзя объединить планы количества {self!r} и {other!r}")
+
+
+class SeedCardsPlan(SeedCountPlan):
     """
     План генерации карт на счёте.
 
     Attributes:
         count (int): Количество карт (виртуальных или физических), которые нужно создать.
+        distribution (SeedCountDistribution | None): Распределение количества карт по счетам.
     """
-    count: int = 0
 
 
-class SeedOperationsPlan(BaseModel):
+class SeedOperationsPlan(SeedCountPlan):
     """
     План генерации операций на счёте.
 
     Attributes:
         count (int): Количество операций (например, пополнений или покупок), которые нужно сгенерировать.
+        distribution (SeedCountDistribution | None): Распределение количества операций по счетам.
     """
-    count: int = 0
+
+
+# Вложенные планы счёта (карты и операции) в фиксированном порядке выборки из распределений
+SEED_COUNT_FIELDS = (
+    "physical_cards",
+    "top_up_operations",
+    "purchase_operations",
+    "virtual_cards",
+    "transfer_operations",
+    "cash_withdrawal_operations"
+)
+# Типы счетов пользователя
+SEED_ACCOUNT_FIELDS = ("deposit_accounts", "savings_accounts", "debit_card_accounts", "credit_card_accounts")
 
 
 class SeedAccountsPlan(BaseModel):
@@ -31,7 +189,7 @@ class SeedAccountsPlan(BaseModel):
         top_up_operations (SeedOperationsPlan): План по созданию операций пополнения.
         purchase_operations (SeedOperationsPlan): План по созданию операций покупки.
     """
-    count: int = 0
+    count: int = Field(default=0, ge=0)
     physical_cards: SeedCardsPlan = Field(default_factory=SeedCardsPlan)
     top_up_operations: SeedOperationsPlan = Field(default_factory=SeedOperationsPlan)
     purchase_operations: SeedOperationsPlan = Field(default_factory=SeedOperationsPlan)
@@ -39,6 +197,34 @@ class SeedAccountsPlan(BaseModel):
     transfer_operations: SeedOperationsPlan = Field(default_factory=SeedOperationsPlan)
     cash_withdrawal_operations: SeedOperationsPlan = Field(default_factory=SeedOperationsPlan)
 
+    def is_extension_of(self, other: "SeedAccountsPlan") -> bool:
+        """
+        Проверяет, что план счетов получен из other только добавлением счетов, карт и операций.
+        """
+        return self.count >= other.count and all(
+            getattr(self, field).is_extension_of(getattr(other, field)) for field in SEED_COUNT_FIELDS
+        )
+
+    def union(self, other: "SeedAccountsPlan") -> "SeedAccountsPlan":
+        """
+        Возвращает план счетов, покрывающий оба плана: большее количество счетов,
+        а на каждом счёте — большее количество карт и операций каждого типа.
+        """
+        return SeedAccountsPlan(
+            count=max(self.count, other.count),
+            **{field: getattr(self, field).union(getattr(other, field)) for field in SEED_COUNT_FIELDS}
+        )
+
+    def resolve(self, rng: random.Random) -> "SeedAccountsPlan":
+        """
+        Возвращает план одного счёта, в котором количества карт и операций выбраны из распределений.
+        Порядок выборки фиксирован, поэтому при одинаковом rng результат воспроизводим.
+        """
+        return self.model_copy(update={
+            field: type(getattr(self, field))(count=getattr(self, field).get_count(rng))
+            for field in SEED_COUNT_FIELDS
+        })
+
 
 class SeedUsersPlan(BaseModel):
     """
@@ -50,12 +236,148 @@ class SeedUsersPlan(BaseModel):
         savings_accounts (SeedAccountsPlan): План по сберегательным счетам.
         debit_card_accounts (SeedAccountsPlan): План по дебетовым картам.
         credit_card_accounts (SeedAccountsPlan): План по кредитным картам.
+        seed (int): Зерно генератора случайных чисел для распределений количеств.
+            Вместе с номером пользователя однозначно определяет форму его счетов.
+        ranges (list[SeedUsersRangePlan]): Сущности, которые нужны только пользователям с номерами
+            из диапазона (например, слой сценария на своём диапазоне общей базы, см. seeds.layers).
+            План пользователя с конкретным номером возвращает at.
     """
-    count: int = 0
+    count: int = Field(default=0, ge=0)
     deposit_accounts: SeedAccountsPlan = Field(default_factory=SeedAccountsPlan)
     savings_accounts: SeedAccountsPlan = Field(default_factory=SeedAccountsPlan)
     debit_card_accounts: SeedAccountsPlan = Field(default_factory=SeedAccountsPlan)
     credit_card_accounts: SeedAccountsPlan = Field(default_factory=SeedAccountsPlan)
+    seed: int = 0
+    ranges: list["SeedUsersRangePlan"] = Field(default_factory=list)
+
+    @field_validator("ranges")
+    @classmethod
+    def check_ranges(cls, ranges: list["SeedUsersRangePlan"]) -> list["SeedUsersRangePlan"]:
+        if any(range_plan.plan.ranges for range_plan in ranges):
+            raise ValueError("План диапазона не может содержать собственные диапазоны")
+
+        return ranges
+
+    def at(self, index: int) -> "SeedUsersPlan":
+        """
+        Возвращает план пользователя с номером index: общий план, объединённый с планами
+        всех диапазонов, в которые попадает index. Зерно и количество пользователей берутся из общего плана.
+
+        :param index: Номер пользователя в плане.
+        :return: План без диапазонов.
+        """
+        if not self.ranges:
+            return self
+
+        plan = self.model_copy(update={"ranges": []})
+        for range_plan in self.ranges:
+            if range_plan.offset <= index < range_plan.end:
+                plan = plan.union(range_plan.plan.model_copy(update={"count": 0, "seed": self.seed}))
+
+        return plan
+
+    def split(self, start: int, end: int, *plans: "SeedUsersPlan") -> list[tuple[int, int]]:
+        """
+        Делит номера пользователей [start, end) на отрезки, внутри которых at возвращает
+        один и тот же план (у self и у каждого из plans).
+
+        :param start: Первый номер.
+        :param end: Номер после последнего.
+        :param plans: Другие планы, границы диапазонов которых тоже учитываются.
+        :return: Отрезки [start, end) по порядку.
+        """
+        bounds = {start, end}
+        for plan in (self, *plans):
+            for range_plan in plan.ranges:
+                bounds.update(bound for bound in (range_plan.offset, range_plan.end) if start < bound < end)
+
+        bounds = sorted(bounds)
+        return [(left, right) for left, right in zip(bounds, bounds[1:]) if left < right]
+
+    def get_random(self, index: int, *keys: str | int) -> random.Random:
+        """
+        Возвращает генератор случайных чисел для пользователя с номером index.
+        Генератор свой у каждого пользователя, поэтому результат не зависит от порядка
+        параллельного создания, продолжения после сбоя и деления на процессы.
+
+        :param index: Номер пользователя в плане.
+        :param keys: Дополнительные ключи (например, тип и позиция счёта), чтобы выборки
+            разных счетов не зависели друг от друга.
+        """
+        return random.Random(":".join(map(str, (self.seed, index, *keys))))
+
+    def resolve_accounts(self, index: int, field: str) -> list[SeedAccountsPlan]:
+        """
+        Возвращает планы счетов типа field пользователя с номером index с выбранными из распределений
+        количествами карт и операций.
+
+        Каждый счёт получает свой генератор по типу и позиции, поэтому добавление счетов одного типа
+        не сдвигает выборки на других счетах: SeedsBuilder.top_up_user и seeds.planner получают
+        ту же форму, что и build_user.
+
+        :param index: Номер пользователя в плане.
+        :param field: Тип счетов (например, "debit_card_accounts").
+        :return: Планы счетов в порядке их создания.
+        """
+        account_plan: SeedAccountsPlan = getattr(self, field)
+        return [account_plan.resolve(self.get_random(index, field, position)) for position in range(account_plan.count)]
+
+    def is_extension_of(self, other: "SeedUsersPlan") -> bool:
+        """
+        Проверяет, что план получен из other только увеличением количеств
+        (пользователей, счетов, карт и операций) при том же зерне генератора.
+        """
+        if self.count < other.count or self.seed != other.seed:
+            return False
+
+        if self.ranges or other.ranges:
+            # Созданные пользователи дополняются до плана своего номера, поэтому сравниваются планы отрезков
+            return all(
+                self.at(start).is_extension_of(other.at(start)) for start, _ in self.split(0, other.count, other)
+            )
+
+        return all(getattr(self, field).is_extension_of(getattr(other, field)) for field in SEED_ACCOUNT_FIELDS)
+
+    def union(self, other: "SeedUsersPlan") -> "SeedUsersPlan":
+        """
+        Возвращает план пользователей, покрывающий оба плана (см. SeedAccountsPlan.union).
+        Диапазоны обоих планов сохраняются без повторов в постоянном порядке, чтобы отпечаток плана
+        не зависел от порядка объединения.
+
+        :raises ValueError: Если у планов разное зерно генератора.
+        """
+        if self.seed != other.seed:
+            raise ValueError(f"Нельзя объединить планы пользователей с разным зерном: {self.seed} и {other.seed}")
+
+        ranges = {range_plan.model_dump_json(): range_plan for range_plan in (*self.ranges, *other.ranges)}
+        return SeedUsersPlan(
+            count=max(self.count, other.count),
+            seed=self.seed,
+            ranges=[
+                ranges[key] for key in sorted(ranges, key=lambda key: (ranges[key].offset, ranges[key].end, key))
+            ],
+            **{field: getattr(self, field).union(getattr(other, field)) for field in SEED_ACCOUNT_FIELDS}
+        )
+
+
+class SeedUsersRangePlan(BaseModel):
+    """
+    План сущностей пользователей с номерами [offset, offset + plan.count) в общем плане.
+
+    Attributes:
+        offset (int): Номер первого пользователя диапазона.
+        plan (SeedUsersPlan): Сущности пользователей диапазона; plan.count — размер диапазона.
+            Зерно генератора берётся из общего плана.
+    """
+    offset: int = Field(default=0, ge=0)
+    plan: SeedUsersPlan
+
+    @property
+    def end(self) -> int:
+        """
+        Номер после последнего пользователя диапазона.
+        """
+        return self.offset + self.plan.count
 
 
 class SeedsPlan(BaseModel):
@@ -66,3 +388,16 @@ class SeedsPlan(BaseModel):
         users (SeedUsersPlan): План по созданию пользователей и всей связанной структуры.
     """
     users: SeedUsersPlan = Field(default_factory=SeedUsersPlan)
+
+    def is_extension_of(self, other: "SeedsPlan") -> bool:
+        """
+        Проверяет, что план только вырос относительно other, и дамп по other можно дополнить до этого плана.
+        """
+        return self.users.is_extension_of(other.users)
+
+    def union(self, other: "SeedsPlan") -> "SeedsPlan":
+        """
+        Возвращает план, по которому создаётся одна популяция пользователей, подходящая под оба плана.
+        Используется для общей базовой популяции нескольких сценариев (см. seeds.layers).
+        """
+        return SeedsPlan(users=self.users.union(other.users))
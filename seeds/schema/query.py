@@ -0,0 +1,69 @@
+from typing import Literal
+
+from pydantic import BaseModel, ConfigDict
+
+from seeds.schema.result import SeedUserResult, SeedAccountResult
+
+SeedAccountType = Literal["deposit_accounts", "savings_accounts", "debit_card_accounts", "credit_card_accounts"]
+SeedCardType = Literal["physical_cards", "virtual_cards"]
+SeedOperationType = Literal[
+    "top_up_operations",
+    "purchase_operations",
+    "transfer_operations",
+    "cash_withdrawal_operations"
+]
+
+
+class SeedsQuery(BaseModel):
+    """
+    Условие выбора сидингового пользователя.
+
+    Пользователь подходит, если у него есть хотя бы один счёт типа account, на котором
+    есть карта типа card (если задана) и не меньше min_operations операций типа operation (если задана).
+    Запрос неизменяемый и хешируемый — используется как ключ индекса в SeedsAllocator.
+
+    Attributes:
+        account (SeedAccountType): Тип счёта.
+        card (SeedCardType | None): Тип карты, которая должна быть на счёте.
+        operation (SeedOperationType | None): Тип операций на счёте.
+        min_operations (int): Минимальное количество операций типа operation.
+    """
+    model_config = ConfigDict(frozen=True)
+
+    account: SeedAccountType
+    card: SeedCardType | None = None
+    operation: SeedOperationType | None = None
+    min_operations: int = 1
+
+    def is_account_matched(self, account: SeedAccountResult) -> bool:
+        """
+        Проверяет, подходит ли счёт под условия запроса.
+        """
+        if self.card is not None and not getattr(account, self.card):
+            return False
+
+        if self.operation is not None and len(getattr(account, self.operation)) < self.min_operations:
+            return False
+
+        return True
+
+    def get_accounts(self, user: SeedUserResult) -> list[SeedAccountResult]:
+        """
+        Возвращает все счета пользователя, подходящие под условия запроса.
+        """
+        return [account for account in getattr(user, self.account) if self.is_account_matched(account)]
+
+    def get_account(self, user: SeedUserResult) -> SeedAccountResult:
+        """
+        Возвращает первый подходящий счёт пользователя.
+        Удобно в сценарии: allocator выдаёт пользователя по запросу, а запрос — нужный счёт.
+
+        :raises IndexError: Если у пользователя нет подходящих счетов.
+        """
+        return self.get_accounts(user)[0]
+
+    def is_matched(self, user: SeedUserResult) -> bool:
+        """
+        Проверяет, подходит ли пользователь под условия запроса.
+        """
+        return any(self.is_account_matched(account) for account in getattr(user, self.account))
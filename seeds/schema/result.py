@@ -92,3 +92,19 @@ class SeedsResult(BaseModel):
             SeedUserResult: Случайный пользователь.
         """
         return random.choice(self.users)
+
+    def get_shards(self, count: int) -> list["SeedsResult"]:
+        """
+        Делит пользователей на count непересекающихся частей (шардов).
+
+        Пользователи распределяются по кругу (i-й пользователь попадает в шард i % count),
+        поэтому размеры шардов отличаются не больше чем на одного пользователя.
+        Используется для раздачи данных воркерам в распределённом режиме Locust.
+
+        Args:
+            count (int): Количество шардов.
+
+        Returns:
+            list[SeedsResult]: Список шардов в порядке их номеров.
+        """
+        return [SeedsResult(users=self.users[index::count]) for index in range(count)]
@@ -0,0 +1,235 @@
+"""
+Многопроцессный сидинг больших планов.
+
+Один процесс с SeedsBuilder упирается в CPU (Faker, protobuf, pydantic) раньше, чем в gateway.
+Здесь SeedUsersPlan.count делится между несколькими процессами: каждый создаёт свой gRPC-канал
+(клиенты билдера создаются заново в дочернем процессе), пишет частичный дамп, а по завершении
+части дописываются в стандартный потоковый дамп сценария с метаданными:
+
+    python -m seeds.sharded existing_user_get_operations --processes 8
+
+Сценарии поверх общей базы (seeds.layers) своих пользователей не создают: для них в нескольких
+процессах сидится база, дополненная до слоёв сценариев, а дампы сценариев затем собираются из неё.
+"""
+import argparse
+import glob
+import inspect
+import multiprocessing
+import os
+import time
+from importlib import import_module
+
+from config import settings
+from seeds.dumps import (
+    DUMPS_PATH,
+    clear_seeds_stream,
+    merge_seeds_parts,
+    repair_seeds_stream,
+    sort_seeds_stream,
+    load_seeds_meta,
+    append_seed_user_results,
+    save_seeds_result_binary
+)
+from seeds.scenario import SeedsScenario
+from seeds.schema.meta import (
+    SeedsRange,
+    chain_seeds_ranges,
+    get_seeds_ranges_size,
+    subtract_seeds_ranges,
+    take_seeds_ranges
+)
+from seeds.schema.plan import SeedsPlan
+
+
+def load_seeds_scenario_class(name: str) -> type[SeedsScenario]:
+    """
+    Находит класс сценария сидинга в модуле seeds.scenarios.<name>.
+
+    :param name: Имя модуля сценария (например, existing_user_get_operations).
+    :return: Класс-наследник SeedsScenario, объявленный в модуле.
+    :raises ValueError: Если в модуле нет сценария сидинга.
+    """
+    module = import_module(f"seeds.scenarios.{name}")
+    for value in vars(module).values():
+        if inspect.isclass(value) and issubclass(value, SeedsScenario) and value.__module__ == module.__name__:
+            return value
+
+    raise ValueError(f"В модуле seeds.scenarios.{name} нет сценария сидинга")
+
+
+def split_seeds_count(count: int, processes: int) -> list[int]:
+    """
+    Делит количество пользователей между процессами так, что доли отличаются не больше чем на единицу.
+    """
+    return [count // processes + (1 if index < count % processes else 0) for index in range(processes)]
+
+
+def run_seeds_part(
+        scenario_class: type[SeedsScenario],
+        plan: SeedsPlan,
+        index: int,
+        ranges: list[SeedsRange],
+        progress
+) -> None:
+    """
+    Точка входа дочернего процесса: создаёт пользователей плана с номерами из ranges (по порядку)
+    и пишет их в частичный дамп с номером index.
+
+    :param scenario_class: Класс сценария (создаётся заново в дочернем процессе вместе с билдером).
+    :param plan: План сидинга из родительского процесса (у базы он зависит от слоёв сценариев).
+    :param index: Номер процесса (части).
+    :param ranges: Диапазоны номеров пользователей плана, которые создаёт часть.
+    :param progress: Общий счётчик созданных пользователей по процессам (multiprocessing.Array).
+    """
+    seeds_scenario = scenario_class()
+
+    def iter_counted_users():
+        for start, end in ranges:
+            users = seeds_scenario.builder.iter_users(plan=plan.users, count=end - start, offset=start)
+            for user in users:
+                yield user
+                progress[index] += 1
+
+    append_seed_user_results(users=iter_counted_users(), scenario=seeds_scenario.scenario, part=index)
+
+
+def build_seeds_sharded(name: str, processes: int, force: bool = False, interval: float = 1.0) -> None:
+    """
+    Выполняет сидинг сценария в нескольких процессах и собирает стандартный дамп
+    (см. build_seeds_scenario_sharded).
+
+    Для сценария поверх общей базы или самой базы сидится база, дополненная до слоёв
+    (всех сценариев на базе, если указана база), и дампы сценариев собираются из неё.
+
+    :param name: Имя модуля сценария в seeds/scenarios.
+    :param processes: Количество процессов.
+    :param force: Пересоздать данные независимо от существующего дампа.
+    :param interval: Период вывода прогресса (секунды).
+    """
+    # seeds.layers сам импортирует этот модуль, поэтому импортируется при вызове
+    from seeds.layers import SeedsBaseScenario, SeedsOverlayScenario, build_seeds_layers, load_seeds_layers
+
+    seeds_scenario = load_seeds_scenario_class(name)()
+    if isinstance(seeds_scenario, (SeedsBaseScenario, SeedsOverlayScenario)):
+        build_seeds_layers(load_seeds_layers([name]), force=force, processes=processes)
+        return
+
+    build_seeds_scenario_sharded(seeds_scenario=seeds_scenario, processes=processes, force=force, interval=interval)
+
+
+def build_seeds_scenario_sharded(
+        seeds_scenario: SeedsScenario,
+        processes: int,
+        force: bool = False,
+        interval: float = 1.0
+) -> None:
+    """
+    Выполняет сидинг сценария в нескольких процессах и собирает стандартный дамп.
+
+    Логика переиспользования и продолжения такая же, как у SeedsScenario.build: актуальный дамп
+    не пересоздаётся, а прерванный сидинг с тем же отпечатком продолжается.
+    Если какой-то процесс упал, созданные им пользователи всё равно попадают в дамп, а их номера
+    в плане сохраняются в метаданных (SeedsDumpMeta.built_ranges). Повторный запуск досоздаст
+    ровно недостающие номера, даже если они находятся в середине плана, и упорядочит дамп по номерам.
+
+    :param seeds_scenario: Сценарий сидинга; дочерние процессы создают свой экземпляр его класса
+        и получают текущий план сценария.
+    :param processes: Количество процессов.
+    :param force: Пересоздать данные независимо от существующего дампа.
+    :param interval: Период вывода прогресса (секунды).
+    :raises RuntimeError: Если хотя бы один процесс завершился с ошибкой.
+    """
+    scenario = seeds_scenario.scenario
+
+    force = force or settings.seeds.force_rebuild
+    if not force and seeds_scenario.is_dump_actual():
+        print(f"Дамп {scenario} актуален, сидинг не требуется")
+        return
+
+    if not force and seeds_scenario.is_dump_extendable():
+        # Дополнение дампа создаёт только недостающие сущности и выполняется в текущем процессе
+        seeds_scenario.build_top_up()
+        return
+
+    meta = load_seeds_meta(scenario=scenario)
+    fingerprint = seeds_scenario.fingerprint
+    if (not force) and (meta is not None) and (not meta.completed) and (meta.fingerprint == fingerprint):
+        built_ranges = meta.get_built_ranges(repair_seeds_stream(scenario=scenario))
+    else:
+        built_ranges = []
+        clear_seeds_stream(scenario=scenario)
+
+    # Части дописываются в дамп не по порядку номеров, поэтому номера уже созданных
+    # пользователей фиксируются в метаданных явно — в порядке строк дампа
+    seeds_scenario.save_meta(completed=False, built_ranges=built_ranges)
+
+    # Остатки частей от прошлого запуска уже не соответствуют состоянию дампа
+    for filename in glob.glob(os.path.join(DUMPS_PATH, f"{scenario}_seeds.part*.jsonl")):
+        os.remove(filename)
+
+    missing = subtract_seeds_ranges(seeds_scenario.plan.users.count, built_ranges)
+    total = get_seeds_ranges_size(missing)
+
+    parts = []
+    for count in split_seeds_count(total, processes):
+        part, missing = take_seeds_ranges(missing, count)
+        parts.append(part)
+
+    # spawn, а не fork: родительский процесс уже пропатчен gevent и держит gRPC-канал
+    context = multiprocessing.get_context("spawn")
+    progress = context.Array("q", processes)
+    workers = [
+        context.Process(
+            target=run_seeds_part,
+            args=(type(seeds_scenario), seeds_scenario.plan, index, part, progress),
+            daemon=True
+        )
+        for index, part in enumerate(parts) if part
+    ]
+    for worker in workers:
+        worker.start()
+
+    started_at = time.monotonic()
+    while any(worker.is_alive() for worker in workers):
+        time.sleep(interval)
+
+        done = sum(progress)
+        elapsed = time.monotonic() - started_at
+        rate = done / elapsed
+        eta = (total - done) / rate if rate > 0 else float("inf")
+        print(f"{scenario}: {done}/{total} пользователей, {rate:.1f} users/s, ETA {eta:.0f} с", flush=True)
+
+    for worker in workers:
+        worker.join()
+
+    merged = merge_seeds_parts(scenario=scenario, count=processes)
+    for part, count in zip(parts, merged):
+        # Часть создаёт пользователей по порядку своих номеров, поэтому в дамп попали первые count из них
+        built_ranges = chain_seeds_ranges(built_ranges + take_seeds_ranges(part, count)[0])
+
+    failed = [worker for worker in workers if worker.exitcode != 0]
+    if failed:
+        seeds_scenario.save_meta(completed=False, built_ranges=built_ranges)
+        raise RuntimeError(
+            f"Сидинг {scenario}: {len(failed)} из {len(workers)} процессов завершились с ошибкой. "
+            f"Созданные пользователи сохранены, повторный запуск продолжит сидинг"
+        )
+
+    # После продолжения прерванного сидинга части лежат в дампе не по порядку номеров,
+    # а завершённый дамп должен быть упорядочен по плану (см. SeedsDumpMeta.completed)
+    sort_seeds_stream(scenario=scenario, ranges=built_ranges)
+
+    if settings.seeds.dump_format == "binary":
+        save_seeds_result_binary(scenario=scenario)
+
+    seeds_scenario.save_meta(completed=True)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Многопроцессный сидинг сценария")
+    parser.add_argument("scenario", help="Имя модуля сценария в seeds/scenarios")
+    parser.add_argument("--processes", type=int, default=os.cpu_count())
+    parser.add_argument("--force", action="store_true", help="Пересоздать данные независимо от дампа")
+    args = parser.parse_args()
+
+    build_seeds_sharded(name=args.scenario, processes=args.processes, force=args.force)
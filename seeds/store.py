@@ -0,0 +1,364 @@
+import logging
+from typing import Iterable
+from uuid import uuid4
+
+import gevent
+from gevent import Greenlet
+
+from seeds.schema.query import SeedsQuery
+from seeds.schema.result import SeedUserResult
+
+try:
+    from redis import Redis
+except ImportError as error:
+    # redis — необязательная зависимость, нужна только при settings.seeds.store == "redis"
+    raise ImportError(
+        "Для settings.seeds.store == \"redis\" нужен пакет redis (pip install redis) и сервер Redis 6.2+"
+    ) from error
+
+logger = logging.getLogger(__name__)
+
+# Текущее время сервера Redis в секундах. Время берётся у Redis, а не у воркеров,
+# поэтому расхождение часов между хостами не сокращает и не продлевает аренды.
+SEEDS_NOW_SCRIPT = """
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+"""
+
+# Атомарно снимает первого свободного пользователя и возвращает его JSON.
+# KEYS: free, users
+SEEDS_POP_SCRIPT = """
+local user_id = redis.call('LPOP', KEYS[1])
+if not user_id then
+    return false
+end
+return redis.call('HGET', KEYS[2], user_id)
+"""
+
+# Возвращает в свободные пользователей с истёкшей арендой, затем арендует первого свободного на ARGV[1] секунд.
+# KEYS: free, users, leases, owners; ARGV: время аренды, владелец аренды, сколько аренд возвращать за вызов
+SEEDS_LEASE_SCRIPT = SEEDS_NOW_SCRIPT + """
+local expired = redis.call('ZRANGEBYSCORE', KEYS[3], '-inf', now, 'LIMIT', 0, tonumber(ARGV[3]))
+for _, user_id in ipairs(expired) do
+    redis.call('ZREM', KEYS[3], user_id)
+    redis.call('HDEL', KEYS[4], user_id)
+    redis.call('RPUSH', KEYS[1], user_id)
+end
+
+local user_id = redis.call('LPOP', KEYS[1])
+if not user_id then
+    return false
+end
+redis.call('ZADD', KEYS[3], now + tonumber(ARGV[1]), user_id)
+redis.call('HSET', KEYS[4], user_id, ARGV[2])
+return redis.call('HGET', KEYS[2], user_id)
+"""
+
+# Продлевает аренды владельца на ARGV[1] секунд и возвращает user_id, аренды которых владелец уже потерял
+# (истекли и были отданы другому). KEYS: leases, owners; ARGV: время аренды, владелец, user_id...
+SEEDS_EXTEND_SCRIPT = SEEDS_NOW_SCRIPT + """
+local lost = {}
+for index = 3, #ARGV do
+    if redis.call('HGET', KEYS[2], ARGV[index]) == ARGV[2] then
+        redis.call('ZADD', KEYS[1], 'XX', now + tonumber(ARGV[1]), ARGV[index])
+    else
+        table.insert(lost, ARGV[index])
+    end
+end
+return lost
+"""
+
+# Возвращает пользователя в свободные, только если он арендован этим владельцем
+# (повторный возврат и возврат чужой аренды игнорируются).
+# KEYS: free, leases, owners; ARGV: user_id, владелец
+SEEDS_RELEASE_SCRIPT = """
+if redis.call('HGET', KEYS[3], ARGV[1]) == ARGV[2] then
+    redis.call('ZREM', KEYS[2], ARGV[1])
+    redis.call('HDEL', KEYS[3], ARGV[1])
+    redis.call('RPUSH', KEYS[1], ARGV[1])
+end
+return true
+"""
+
+# Случайный пользователь без удаления из пула (HRANDFIELD — Redis 6.2+).
+# KEYS: users
+SEEDS_RANDOM_SCRIPT = """
+local user_ids = redis.call('HRANDFIELD', KEYS[1], 1)
+if (not user_ids) or (#user_ids == 0) then
+    return false
+end
+return redis.call('HGET', KEYS[1], user_ids[1])
+"""
+
+
+class RedisSeedsStore:
+    """
+    Общее хранилище сидинговых пользователей в Redis для распределённого запуска Locust.
+
+    SeedsAllocator живёт в памяти одного процесса, поэтому воркеры на разных хостах получают
+    от мастера непересекающиеся шарды и не могут отдавать друг другу пользователей. Хранилище
+    держит пользователей в Redis, и все воркеры берут их из одного пула: каждая операция
+    выполняется одним Lua-скриптом за O(1) и один сетевой вызов, поэтому пользователь
+    выдаётся ровно один раз во всём кластере, а дамп не нужно копировать на воркеры.
+
+    Ключи сценария (префикс seeds:<scenario>):
+    - users — хеш user_id -> SeedUserResult в JSON;
+    - free — список user_id свободных пользователей;
+    - leases — ZSET арендованных user_id со временем окончания аренды (по часам Redis);
+    - owners — хеш user_id -> владелец аренды (экземпляр хранилища, то есть процесс Locust);
+    - fingerprint — отпечаток опубликованного дампа.
+
+    Пока процесс жив, его аренды продлевает фоновый greenlet (см. start_heartbeat), поэтому
+    пользователь остаётся арендованным сколько угодно долго. Аренды процесса, который упал,
+    не вернув пользователей, перестают продлеваться, истекают через lease_ttl и возвращаются
+    в free при следующих lease_user.
+
+    Интерфейс выдачи совпадает с SeedsAllocator, поэтому хранилище подставляется в environment.seeds
+    вместо него. Индексов по SeedsQuery хранилище не строит: все пользователи сценария создаются
+    по одному плану и подходят под запросы сценария, поэтому запрос только проверяется на выданном
+    пользователе (см. check_query).
+    """
+
+    def __init__(self, redis: Redis, scenario: str, lease_ttl: float = 300.0, batch_size: int = 1000):
+        """
+        :param redis: Клиент Redis.
+        :param scenario: Имя сценария сидинга (определяет ключи хранилища).
+        :param lease_ttl: Время аренды пользователя по умолчанию (секунды).
+        :param batch_size: Сколько пользователей записывать в Redis за один вызов при публикации.
+        """
+        self.redis = redis
+        self.scenario = scenario
+        self.lease_ttl = lease_ttl
+        self.batch_size = batch_size
+
+        # Владелец аренд этого процесса и арендованные им пользователи (их продлевает heartbeat)
+        self.owner = uuid4().hex
+        self.leased: set[str] = set()
+        self.heartbeat: Greenlet | None = None
+
+        self.pop_script = redis.register_script(SEEDS_POP_SCRIPT)
+        self.lease_script = redis.register_script(SEEDS_LEASE_SCRIPT)
+        self.extend_script = redis.register_script(SEEDS_EXTEND_SCRIPT)
+        self.release_script = redis.register_script(SEEDS_RELEASE_SCRIPT)
+        self.random_script = redis.register_script(SEEDS_RANDOM_SCRIPT)
+
+    def get_key(self, name: str) -> str:
+        return f"seeds:{self.scenario}:{name}"
+
+    @property
+    def total_count(self) -> int:
+        """
+        Общее количество пользователей в хранилище.
+        """
+        return self.redis.hlen(self.get_key("users"))
+
+    @property
+    def free_count(self) -> int:
+        """
+        Количество свободных пользователей, доступных для get_next_user и lease_user.
+        """
+        return self.redis.llen(self.get_key("free"))
+
+    @property
+    def leased_count(self) -> int:
+        """
+        Количество пользователей, арендованных в данный момент (включая аренды с истёкшим сроком).
+        """
+        return self.redis.zcard(self.get_key("leases"))
+
+    def is_published(self, fingerprint: str) -> bool:
+        """
+        Проверяет, что в хранилище уже опубликован дамп с таким отпечатком.
+        """
+        return self.redis.get(self.get_key("fingerprint")) == fingerprint.encode()
+
+    def clear(self) -> None:
+        """
+        Удаляет всех пользователей сценария из хранилища.
+        """
+        self.redis.delete(*(self.get_key(name) for name in ("users", "free", "leases", "owners", "fingerprint")))
+
+    def add_users(self, users: Iterable[SeedUserResult]) -> None:
+        """
+        Добавляет пользователей в пул свободных пачками по batch_size (один pipeline на пачку).
+
+        :param users: Новые пользователи (из дампа или созданные во время теста).
+        """
+        batch = []
+        for user in users:
+            batch.append(user)
+            if len(batch) >= self.batch_size:
+                self.push_users(batch)
+                batch = []
+
+        if batch:
+            self.push_users(batch)
+
+    def push_users(self, users: list[SeedUserResult]) -> None:
+        pipeline = self.redis.pipeline(transaction=False)
+        pipeline.hset(self.get_key("users"), mapping={user.user_id: user.model_dump_json() for user in users})
+        pipeline.rpush(self.get_key("free"), *(user.user_id for user in users))
+        pipeline.execute()
+
+    def publish(self, users: Iterable[SeedUserResult], fingerprint: str) -> None:
+        """
+        Публикует пользователей дампа в хранилище. Если дамп с тем же отпечатком уже опубликован,
+        хранилище не трогается — выданные и арендованные в прошлых запусках пользователи остаются выданными.
+
+        :param users: Пользователи дампа.
+        :param fingerprint: Отпечаток дампа (см. SeedsScenario.fingerprint).
+        """
+        if self.is_published(fingerprint):
+            return
+
+        self.clear()
+        self.add_users(users)
+        self.redis.set(self.get_key("fingerprint"), fingerprint)
+
+    def check_query(self, user: SeedUserResult, query: SeedsQuery | None) -> None:
+        """
+        Проверяет, что выданный пользователь подходит под запрос.
+
+        :raises IndexError: Если не подходит (дамп собран по плану, который не гарантирует запрос сценария).
+        """
+        if query is not None and not query.is_matched(user):
+            raise IndexError(f"Сидинговый пользователь {user.user_id} не подходит под запрос {query!r}")
+
+    def get_next_user(self, query: SeedsQuery | None = None) -> SeedUserResult:
+        """
+        Возвращает следующего свободного пользователя и исключает его из пула навсегда.
+
+        :param query: Условие, которому должен соответствовать пользователь (см. check_query).
+        :raises IndexError: Если свободных пользователей не осталось или пользователь не подходит под запрос.
+        """
+        payload = self.pop_script(keys=[self.get_key("free"), self.get_key("users")])
+        if payload is None:
+            raise IndexError("Свободные сидинговые пользователи закончились")
+
+        user = SeedUserResult.model_validate_json(payload)
+        try:
+            self.check_query(user, query)
+        except IndexError:
+            # Неподходящий пользователь может пригодиться другому сценарию — возвращаем его в пул
+            self.redis.rpush(self.get_key("free"), user.user_id)
+            raise
+
+        return user
+
+    def get_random_user(self, query: SeedsQuery | None = None) -> SeedUserResult:
+        """
+        Возвращает случайного пользователя без удаления из пула.
+
+        :param query: Условие, которому должен соответствовать пользователь (см. check_query).
+        :raises IndexError: Если хранилище пусто или пользователь не подходит под запрос.
+        """
+        payload = self.random_script(keys=[self.get_key("users")])
+        if payload is None:
+            raise IndexError("Нет сидинговых пользователей")
+
+        user = SeedUserResult.model_validate_json(payload)
+        self.check_query(user, query)
+        return user
+
+    def lease_user(self, query: SeedsQuery | None = None, ttl: float | None = None) -> SeedUserResult:
+        """
+        Выдаёт свободного пользователя в эксклюзивное пользование до release_user.
+        Если heartbeat не запущен, аренда истекает через ttl.
+
+        :param query: Условие, которому должен соответствовать пользователь (см. check_query).
+        :param ttl: Время аренды (секунды), по умолчанию lease_ttl.
+        :raises IndexError: Если свободных пользователей не осталось или пользователь не подходит под запрос.
+        """
+        payload = self.lease_script(
+            keys=[self.get_key("free"), self.get_key("users"), self.get_key("leases"), self.get_key("owners")],
+            args=[self.lease_ttl if ttl is None else ttl, self.owner, self.batch_size]
+        )
+        if payload is None:
+            raise IndexError("Свободные сидинговые пользователи закончились")
+
+        user = SeedUserResult.model_validate_json(payload)
+        self.leased.add(user.user_id)
+        try:
+            self.check_query(user, query)
+        except IndexError:
+            self.release_user(user)
+            raise
+
+        return user
+
+    def extend_leases(self, user_ids: Iterable[str], ttl: float | None = None) -> list[str]:
+        """
+        Продлевает аренды пользователей этого процесса на ttl от текущего времени Redis.
+
+        :param user_ids: Идентификаторы арендованных пользователей.
+        :param ttl: Время аренды (секунды), по умолчанию lease_ttl.
+        :return: Пользователи, аренды которых процесс уже потерял (истекли и были выданы заново).
+        """
+        user_ids = list(user_ids)
+        if not user_ids:
+            return []
+
+        lost = self.extend_script(
+            keys=[self.get_key("leases"), self.get_key("owners")],
+            args=[self.lease_ttl if ttl is None else ttl, self.owner, *user_ids]
+        )
+        return [user_id.decode() for user_id in lost]
+
+    def extend_lease(self, user: SeedUserResult, ttl: float | None = None) -> None:
+        """
+        Продлевает аренду пользователя (для виртуальных пользователей, которые держат его дольше lease_ttl
+        без запущенного heartbeat).
+        """
+        self.extend_leases([user.user_id], ttl=ttl)
+
+    def release_user(self, user: SeedUserResult) -> None:
+        """
+        Возвращает арендованного пользователя в пул свободных.
+        Повторный возврат или возврат неарендованного пользователя игнорируется.
+
+        :param user: Пользователь, ранее полученный через lease_user.
+        """
+        self.leased.discard(user.user_id)
+        self.release_script(
+            keys=[self.get_key("free"), self.get_key("leases"), self.get_key("owners")],
+            args=[user.user_id, self.owner]
+        )
+
+    def run_heartbeat(self, interval: float) -> None:
+        while True:
+            gevent.sleep(interval)
+            try:
+                lost = self.extend_leases(list(self.leased))
+            except Exception as error:
+                # Redis временно недоступен: аренды продлятся на следующем шаге, если не успеют истечь
+                logger.warning(f"Не удалось продлить аренды сидов {self.scenario}: {error}")
+                continue
+
+            if lost:
+                self.leased.difference_update(lost)
+                logger.warning(f"Аренды сидов {self.scenario} истекли и выданы заново: {len(lost)}")
+
+    def start_heartbeat(self, interval: float | None = None) -> None:
+        """
+        Запускает фоновое продление аренд этого процесса, пока он жив.
+
+        :param interval: Период продления (секунды), по умолчанию треть lease_ttl,
+            чтобы аренда пережила пару неудачных попыток.
+        """
+        if self.heartbeat is None:
+            self.heartbeat = gevent.spawn(self.run_heartbeat, self.lease_ttl / 3 if interval is None else interval)
+
+    def stop_heartbeat(self) -> None:
+        """
+        Останавливает продление аренд. Невозвращённые аренды истекут через lease_ttl.
+        """
+        if self.heartbeat is not None:
+            self.heartbeat.kill()
+            self.heartbeat = None
+
+
+def build_redis_seeds_store(scenario: str, url: str, lease_ttl: float = 300.0) -> RedisSeedsStore:
+    """
+    Создаёт хранилище сидов сценария на Redis по адресу url (например, redis://localhost:6379/0).
+    """
+    return RedisSeedsStore(redis=Redis.from_url(url), scenario=scenario, lease_ttl=lease_ttl)
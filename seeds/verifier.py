@@ -0,0 +1,164 @@
+import random
+from typing import Sequence
+
+from gevent.pool import Pool
+from grpc import RpcError, StatusCode
+from httpx import HTTPStatusError
+from pydantic import BaseModel, Field
+
+from clients.http.gateway.accounts.client import AccountsGatewayHTTPClient
+from clients.http.gateway.cards.client import CardsGatewayHTTPClient
+from clients.http.gateway.client import build_gateway_verifier_http_client
+from clients.http.gateway.operations.client import OperationsGatewayHTTPClient
+from clients.http.gateway.users.client import UsersGatewayHTTPClient
+from seeds.builder import SeedsBuilder
+from seeds.schema.plan import SEED_ACCOUNT_FIELDS, SEED_COUNT_FIELDS
+from seeds.schema.result import SeedUserResult
+
+
+class SeedsVerificationResult(BaseModel):
+    """
+    Результат проверки сидинговых пользователей на gateway.
+
+    Attributes:
+        checked (int): Количество проверенных пользователей.
+        dead_user_ids (list[str]): Пользователи, у которых хотя бы одна сущность не найдена.
+    """
+    checked: int = 0
+    dead_user_ids: list[str] = Field(default_factory=list)
+
+    @property
+    def alive(self) -> int:
+        """
+        Количество живых пользователей среди проверенных.
+        """
+        return self.checked - len(self.dead_user_ids)
+
+    @property
+    def live_fraction(self) -> float:
+        """
+        Доля живых пользователей среди проверенных (1.0, если проверять было нечего).
+        """
+        return self.alive / self.checked if self.checked else 1.0
+
+
+def is_not_found_error(error: Exception) -> bool:
+    """
+    Проверяет, что ошибка вызова gateway означает отсутствие сущности (gRPC NOT_FOUND или HTTP 404).
+    """
+    if isinstance(error, RpcError):
+        return error.code() == StatusCode.NOT_FOUND
+
+    if isinstance(error, HTTPStatusError):
+        return error.response.status_code == 404
+
+    return False
+
+
+class SeedsVerifier:
+    """
+    Проверка перед нагрузкой, что сидинговые данные существуют на gateway
+    (например, после сброса базы дамп становится неактуальным, а тест падает на 404 посреди прогона).
+
+    Для каждого пользователя запрашиваются get_user и get_accounts: все счета и карты из дампа
+    должны вернуться. Для каждого счёта с операциями запрашивается get_operations, и все операции
+    из дампа должны быть в ответе. Пользователи проверяются параллельно в gevent-пуле,
+    поэтому тысячи пользователей проверяются за секунды.
+    """
+
+    def __init__(self, builder: SeedsBuilder, workers: int = 50):
+        """
+        :param builder: Билдер сценария — используются его клиенты gateway.
+        :param workers: Количество пользователей, проверяемых одновременно.
+        """
+        self.builder = builder
+        self.workers = workers
+
+    def is_user_alive(self, user: SeedUserResult) -> bool:
+        """
+        Проверяет пользователя и его сущности. Пользователь непригоден для теста, если gateway
+        ответил «не найдено» (gRPC NOT_FOUND или HTTP 404) или в ответе нет сущности из дампа.
+
+        :raises Exception: Остальные ошибки вызова (недоступность gateway, таймаут, ошибка сервера)
+            пробрасываются: они не говорят о том, что данных нет, и не должны браковать дамп.
+        """
+        try:
+            self.builder.users_gateway_client.get_user(user_id=user.user_id)
+
+            response = self.builder.accounts_gateway_client.get_accounts(user_id=user.user_id)
+            card_ids = {account.id: {card.id for card in account.cards} for account in response.accounts}
+
+            for field in SEED_ACCOUNT_FIELDS:
+                for account in getattr(user, field):
+                    if account.account_id not in card_ids:
+                        return False
+
+                    if not {
+                        card.card_id
+                        for nested_field in SEED_COUNT_FIELDS if nested_field.endswith("_cards")
+                        for card in getattr(account, nested_field)
+                    } <= card_ids[account.account_id]:
+                        return False
+
+                    operation_ids = {
+                        operation.operation_id
+                        for nested_field in SEED_COUNT_FIELDS if nested_field.endswith("_operations")
+                        for operation in getattr(account, nested_field)
+                    }
+                    if operation_ids:
+                        response = self.builder.operations_gateway_client.get_operations(
+                            account_id=account.account_id
+                        )
+                        if not operation_ids <= {operation.id for operation in response.operations}:
+                            return False
+        except Exception as error:
+            if is_not_found_error(error):
+                return False
+
+            raise
+
+        return True
+
+    def verify(self, users: Sequence[SeedUserResult], sample: int | None = None) -> SeedsVerificationResult:
+        """
+        Проверяет пользователей (всех или случайную выборку).
+
+        :param users: Пользователи из дампа.
+        :param sample: Размер случайной выборки (None — проверить всех).
+        :return: Количество проверенных и идентификаторы неживых пользователей.
+        """
+        positions = range(len(users))
+        if (sample is not None) and (sample < len(users)):
+            positions = random.sample(positions, sample)
+
+        pool = Pool(self.workers)
+        dead_user_ids = [
+            user_id
+            for user_id, alive in pool.imap_unordered(
+                lambda position: (users[position].user_id, self.is_user_alive(users[position])), positions
+            )
+            if not alive
+        ]
+
+        return SeedsVerificationResult(checked=len(positions), dead_user_ids=dead_user_ids)
+
+
+def build_http_seeds_verifier(workers: int = 50) -> SeedsVerifier:
+    """
+    Создаёт проверку сидов через http-gateway.
+
+    Клиенты используют build_gateway_verifier_http_client: ответ 404 выбрасывает httpx.HTTPStatusError
+    и распознаётся как отсутствие сущности, а не как ошибка разбора тела ответа.
+
+    :param workers: Количество пользователей, проверяемых одновременно.
+    :return: SeedsVerifier с HTTP-клиентами.
+    """
+    client = build_gateway_verifier_http_client()
+    builder = SeedsBuilder(
+        users_gateway_client=UsersGatewayHTTPClient(client=client),
+        cards_gateway_client=CardsGatewayHTTPClient(client=client),
+        accounts_gateway_client=AccountsGatewayHTTPClient(client=client),
+        operations_gateway_client=OperationsGatewayHTTPClient(client=client),
+        workers=workers
+    )
+    return SeedsVerifier(builder=builder, workers=workers)
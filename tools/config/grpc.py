@@ -1,4 +1,62 @@
-from pydantic import BaseModel
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+# Опция GRPCChannelOptions -> аргумент канала gRPC (grpc_types.h)
+GRPC_CHANNEL_ARGUMENTS = {
+    "keepalive_time_ms": "grpc.keepalive_time_ms",
+    "keepalive_timeout_ms": "grpc.keepalive_timeout_ms",
+    "keepalive_permit_without_calls": "grpc.keepalive_permit_without_calls",
+    "http2_max_pings_without_data": "grpc.http2.max_pings_without_data",
+    "max_send_message_length": "grpc.max_send_message_length",
+    "max_receive_message_length": "grpc.max_receive_message_length",
+    "lookahead_bytes": "grpc.http2.lookahead_bytes",
+    "bdp_probe": "grpc.http2.bdp_probe",
+    "use_local_subchannel_pool": "grpc.use_local_subchannel_pool",
+}
+
+
+class GRPCChannelOptions(BaseModel):
+    """
+    Настройки gRPC-канала. Незаданные (None) опции не передаются в канал — действуют значения gRPC по умолчанию.
+    Задаются переменными вида GATEWAY_GRPC_CLIENT.OPTIONS.KEEPALIVE_TIME_MS=10000.
+    """
+
+    # Keepalive: период ping по соединению, время ожидания ответа на ping,
+    # ping без активных вызовов и количество ping без данных (0 — без ограничения)
+    keepalive_time_ms: int | None = None
+    keepalive_timeout_ms: int | None = None
+    keepalive_permit_without_calls: bool | None = None
+    http2_max_pings_without_data: int | None = None
+
+    # Максимальный размер отправляемого и принимаемого сообщения в байтах (-1 — без ограничения)
+    max_send_message_length: int | None = None
+    max_receive_message_length: int | None = None
+
+    # Сколько байт gRPC читает из стрима вперёд, не дожидаясь чтения сообщений приложением.
+    # Окна управления потоком HTTP/2 (стрима и соединения) gRPC отдельной опцией не задаёт:
+    # их подстраивает BDP-зондирование (bdp_probe, включено по умолчанию)
+    lookahead_bytes: int | None = None
+    bdp_probe: bool | None = None
+
+    # Собственный пул сабканалов канала: каналы с одинаковыми адресом и опциями не делят соединение
+    use_local_subchannel_pool: bool | None = None
+
+    # Сжатие вызовов канала
+    compression: Literal["none", "deflate", "gzip"] | None = None
+
+    def to_channel_arguments(self) -> list[tuple[str, int]]:
+        """
+        Возвращает заданные опции в виде аргументов канала для insecure_channel(options=...).
+        Сжатие передаётся в канал отдельным параметром compression.
+        """
+        arguments = []
+        for name, argument in GRPC_CHANNEL_ARGUMENTS.items():
+            value = getattr(self, name)
+            if value is not None:
+                arguments.append((argument, int(value)))
+
+        return arguments
 
 
 class GRPCClientConfig(BaseModel):
@@ -8,6 +66,13 @@ class GRPCClientConfig(BaseModel):
     # Хост (например, localhost или grpc-gateway.internal)
     host: str
 
+    # Количество каналов (HTTP/2-соединений) на процесс Locust, которые клиенты получают по кругу.
+    # Если не задано, каждый клиент открывает собственный канал (5 соединений на виртуального пользователя)
+    pool_size: int | None = None
+
+    # Настройки канала: keepalive, размеры сообщений, чтение вперёд и BDP HTTP/2, сжатие
+    options: GRPCChannelOptions = Field(default_factory=GRPCChannelOptions)
+
     @property
     def client_url(self) -> str:
         """
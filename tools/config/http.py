@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic import BaseModel, HttpUrl
 
 
@@ -8,6 +10,26 @@ class HTTPClientConfig(BaseModel):
     # Таймаут для запросов в секундах (по умолчанию 100)
     timeout: float = 100.0
 
+    # Отдельные таймауты фаз запроса (секунды): установка соединения, чтение ответа, отправка запроса
+    # и ожидание свободного соединения в пуле. Если не заданы, используется timeout
+    connect_timeout: float | None = None
+    read_timeout: float | None = None
+    write_timeout: float | None = None
+    pool_timeout: float | None = None
+
+    # HTTP/2: запросы клиента мультиплексируются в одном соединении (нужен пакет h2: pip install httpx[http2])
+    http2: bool = False
+
+    # Чьи клиенты gateway делят пул соединений в Locust:
+    # client — у каждого клиента свой пул (5 пулов на виртуального пользователя);
+    # user — один пул на виртуального пользователя; worker — один пул на процесс
+    pool_mode: Literal["client", "user", "worker"] = "client"
+
+    # Размер пула: максимум соединений, из них keep-alive, и время жизни простаивающего соединения (секунды)
+    max_connections: int | None = 100
+    max_keepalive_connections: int | None = 20
+    keepalive_expiry: float | None = 5.0
+
     @property
     def client_url(self) -> str:
         """
@@ -19,5 +41,3 @@ class HTTPClientConfig(BaseModel):
         - Если передать HttpUrl напрямую, будет ошибка типов.
         """
         return str(self.url)
-
-
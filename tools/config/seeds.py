@@ -0,0 +1,53 @@
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+
+class SeedsConfig(BaseModel):
+    # Количество пользователей, которые сидер создаёт параллельно (размер gevent-пула).
+    # Значение 1 — последовательный сидинг, как раньше.
+    workers: int = Field(1, ge=1)
+
+    # Максимальный возраст дампа в секундах, при котором он ещё переиспользуется.
+    # None — дамп с совпадающим отпечатком плана переиспользуется без ограничения по времени.
+    max_age: float | None = None
+
+    # Принудительно пересоздать данные, даже если подходящий дамп уже существует
+    force_rebuild: bool = False
+
+    # Формат, из которого сценарии загружают сиды:
+    # jsonl — потоковый дамп; binary — компактный колоночный дамп, читаемый через mmap
+    dump_format: Literal["jsonl", "binary"] = "jsonl"
+
+    # Сколько пользователей из дампа загружать в процесс Locust (None — все).
+    # Позволяет не держать в памяти весь дамп, если виртуальных пользователей меньше
+    load_limit: int | None = None
+
+    # Фоновое пополнение пула пользователей во время теста:
+    # порог свободных пользователей (0 — пополнение выключено) и скорость создания (пользователей в секунду).
+    # При store == "memory" порог и скорость действуют на каждый процесс со своим шардом,
+    # при store == "redis" — на весь общий пул (пополняет только мастер)
+    replenish_min_free: int = 0
+    replenish_rate: float = Field(1.0, gt=0)
+
+    # Проверка сидов на gateway перед нагрузкой: включена ли, сколько пользователей проверять
+    # (None — всех), минимальная доля живых пользователей (ниже — полный пересидинг)
+    # и количество одновременно проверяемых пользователей
+    verify: bool = False
+    verify_sample: int | None = None
+    verify_threshold: float = Field(0.9, ge=0, le=1)
+    verify_workers: int = Field(50, ge=1)
+
+    # Где хранятся сиды во время теста: memory — SeedsAllocator в каждом процессе (воркеры получают шарды);
+    # redis — общее хранилище (seeds.store.RedisSeedsStore), из которого берут пользователей все воркеры
+    # (нужны пакет redis и сервер Redis 6.2+)
+    store: Literal["memory", "redis"] = "memory"
+    redis_url: str = "redis://localhost:6379/0"
+    # Время аренды пользователя в Redis (секунды): аренды живых процессов продлеваются в фоне,
+    # а аренды упавших воркеров возвращаются в пул по истечении
+    lease_ttl: float = Field(300.0, gt=0)
+
+    # Сбор сидов во время нагрузки: имя дампа, в который базовые TaskSet gateway записывают
+    # созданных пользователей (None — сбор выключен), и период записи в секундах
+    harvest: str | None = None
+    harvest_flush_interval: float = 1.0